@@ -0,0 +1,222 @@
+import chart_cli
+import chart_profile
+import chart_theme
+import fast_figure
+from export_engine import export_figure
+
+OUTPUT_NAME = "certificate_analytics"
+
+# Certificates table columns (see the ERD in chart_script_2.py), plus when
+# the certificate was approved or rejected; reviewed_at is empty while Pending
+LOG_COLUMNS = ["cert_id", "student_id", "university_id", "cert_type", "status",
+               "upload_date", "reviewed_at"]
+DECIDED = ["Approved", "Rejected"]
+CERT_TYPES = ["Degree", "Marksheet", "Provisional", "Migration", "Transcript"]
+
+# Rows parsed per chunk; memory is bounded by this, not by the log's length
+CHUNK_ROWS = 1_000_000
+# Universities with the most uploads get a line each
+TOP_UNIVERSITIES = 8
+
+# Built-in sample log used when no --log is given
+SAMPLE_ROWS = 20_000
+SAMPLE_START = "2023-01-01"
+SAMPLE_DAYS = 3 * 365
+
+
+def iter_sample_log(rows=SAMPLE_ROWS, chunk_rows=CHUNK_ROWS, universities=40, seed=0):
+    """Yield a synthetic certificate log as DataFrame chunks."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    start = np.datetime64(SAMPLE_START, "s")
+    end = start + np.timedelta64(SAMPLE_DAYS, "D")
+    # A few large universities dominate uploads and review at their own pace
+    weights = 1 / np.arange(1, universities + 1)
+    weights /= weights.sum()
+    review_days = rng.uniform(1, 20, universities)
+    for offset in range(0, rows, chunk_rows):
+        n = min(chunk_rows, rows - offset)
+        university = rng.choice(universities, n, p=weights)
+        uploaded = start + rng.integers(0, SAMPLE_DAYS * 86400, n).astype("timedelta64[s]")
+        reviewed = uploaded + (rng.exponential(review_days[university]) * 86400).astype("timedelta64[s]")
+        pending = reviewed > end
+        reviewed[pending] = np.datetime64("NaT")
+        status = np.where(pending, "Pending",
+                          np.where(rng.random(n) < 0.85, "Approved", "Rejected"))
+        yield pd.DataFrame({
+            "cert_id": np.arange(offset + 1, offset + n + 1),
+            "student_id": rng.integers(1, rows // 3 + 2, n),
+            "university_id": university + 1,
+            "cert_type": rng.choice(CERT_TYPES, n),
+            "status": status,
+            "upload_date": uploaded,
+            "reviewed_at": reviewed,
+        })
+
+
+def write_sample_log(path, rows=SAMPLE_ROWS, chunk_rows=CHUNK_ROWS):
+    """Write the synthetic log to a CSV, a chunk at a time."""
+    for i, chunk in enumerate(iter_sample_log(rows, chunk_rows)):
+        chunk.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False,
+                     date_format="%Y-%m-%d %H:%M:%S")
+
+
+def read_log(path, chunk_rows=CHUNK_ROWS):
+    """Stream the columns the charts need from a certificate log CSV."""
+    import pandas as pd
+
+    return pd.read_csv(path, chunksize=chunk_rows,
+                       usecols=["university_id", "status", "upload_date", "reviewed_at"],
+                       dtype={"status": "category"})
+
+
+def aggregate(chunks):
+    """Fold log chunks into per-day, per-university counters.
+
+    Returns a DataFrame indexed by (day, university_id) with the number of
+    certificates uploaded, approved and rejected that day and the summed
+    turnaround (days from upload to decision) of that day's decisions.
+    Its size depends on days x universities, never on the row count.
+    """
+    import pandas as pd
+
+    totals = None
+    for chunk in chunks:
+        uploaded = pd.to_datetime(chunk["upload_date"], format="ISO8601")
+        reviewed = pd.to_datetime(chunk["reviewed_at"], format="ISO8601")
+        status = chunk["status"]
+        decided = status.isin(DECIDED) & reviewed.notna()
+
+        uploads = pd.DataFrame({"day": uploaded.dt.normalize(),
+                                "university_id": chunk["university_id"], "uploaded": 1})
+        decisions = pd.DataFrame({
+            "day": reviewed[decided].dt.normalize(),
+            "university_id": chunk["university_id"][decided],
+            "approved": (status[decided] == "Approved").astype("int64"),
+            "rejected": (status[decided] == "Rejected").astype("int64"),
+            "turnaround_days": (reviewed - uploaded)[decided].dt.total_seconds() / 86400,
+        })
+        part = (pd.concat([uploads, decisions])
+                .groupby(["day", "university_id"]).sum())
+        totals = part if totals is None else totals.add(part, fill_value=0)
+
+    if totals is None:
+        index = pd.MultiIndex.from_arrays([pd.DatetimeIndex([]), []],
+                                          names=["day", "university_id"])
+        totals = pd.DataFrame(columns=["uploaded", "approved", "rejected", "turnaround_days"],
+                              index=index, dtype="float64")
+    return totals.fillna(0)
+
+
+def trends(counters, top=TOP_UNIVERSITIES):
+    """Daily backlog and monthly mean turnaround for the ``top`` universities.
+
+    Returns ``(leaders, days, backlog, months, turnaround)``; ``backlog``
+    and ``turnaround`` are DataFrames with one column per university.
+    """
+    import pandas as pd
+
+    uploads = counters["uploaded"].groupby(level="university_id").sum()
+    leaders = uploads.nlargest(top).index
+    # The axis spans the whole log, but only the leaders are made dense,
+    # so memory grows with ``top`` rather than the number of universities
+    days = counters.index.get_level_values("day")
+    leading = counters[counters.index.get_level_values("university_id").isin(leaders)]
+    daily = leading.unstack("university_id", fill_value=0)
+    daily = daily.reindex(pd.date_range(days.min(), days.max(), freq="D"), fill_value=0)
+
+    # Certificates still pending at the end of each day
+    backlog = (daily["uploaded"] - daily["approved"] - daily["rejected"]).cumsum()
+    # Mean days from upload to decision of the certificates decided each month
+    monthly = daily.groupby(daily.index.to_period("M")).sum()
+    turnaround = monthly["turnaround_days"] / (monthly["approved"] + monthly["rejected"])
+
+    days = backlog.index.strftime("%Y-%m-%d").tolist()
+    months = turnaround.index.to_timestamp().strftime("%Y-%m-%d").tolist()
+
+    return leaders, days, backlog, months, turnaround
+
+
+def build_figure(chunks=None, top=TOP_UNIVERSITIES, fast=False):
+    go = fast_figure.objects(fast)
+    chart_theme.register()
+
+    # Chunks are streamed, so reading the log is timed as part of this
+    with chart_profile.stage("aggregate"):
+        counters = aggregate(iter_sample_log() if chunks is None else chunks)
+
+    fig = go.Figure()
+    # A log with no rows still gets the titled, empty chart
+    leaders, days, backlog, months, turnaround = (trends(counters, top) if len(counters)
+                                                  else ([], [], None, [], None))
+    for i, university in enumerate(leaders):
+        color = chart_theme.BRAND_COLORS[i % len(chart_theme.BRAND_COLORS)]
+        name = f"University {university}"
+        fig.add_trace(go.Scatter(
+            x=days,
+            y=backlog[university].to_numpy(),
+            mode='lines',
+            line=dict(color=color, width=2),
+            name=name,
+            legendgroup=name,
+            hovertemplate='%{x}<br>Pending: %{y}<extra>' + name + '</extra>'
+        ))
+        fig.add_trace(go.Scatter(
+            x=months,
+            y=turnaround[university].round(1).to_numpy(),
+            mode='lines+markers',
+            line=dict(color=color, width=2),
+            marker=dict(size=4),
+            xaxis='x2',
+            yaxis='y2',
+            name=name,
+            legendgroup=name,
+            showlegend=False,
+            hovertemplate='%{x|%b %Y}<br>Turnaround: %{y} days<extra>' + name + '</extra>'
+        ))
+
+    fig.update_layout(
+        title="Certificate Verification Backlog and Turnaround",
+        xaxis=dict(domain=[0, 1], anchor='y', showticklabels=False),
+        yaxis=dict(domain=[0.55, 1], title="Pending certificates"),
+        xaxis2=dict(domain=[0, 1], anchor='y2', matches='x'),
+        yaxis2=dict(domain=[0, 0.42], title="Turnaround (days)"),
+        legend=dict(y=1.08)
+    )
+
+    return fast_figure.finish(fig)
+
+
+def main(argv=None):
+    parser = chart_cli.make_parser()
+    parser.add_argument("--log", help="certificate log CSV ("
+                        + ",".join(LOG_COLUMNS) + ") to stream in chunks")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--top", type=int, default=TOP_UNIVERSITIES,
+                        help="universities to chart, by upload volume")
+    parser.add_argument("--write-sample", metavar="PATH",
+                        help="write a synthetic log of --rows rows to PATH and exit")
+    parser.add_argument("--rows", type=int, default=SAMPLE_ROWS)
+    chart_cli.add_report_option(parser)
+    args = parser.parse_args(argv)
+
+    if args.write_sample:
+        write_sample_log(args.write_sample, args.rows, args.chunk_rows)
+        return
+
+    chunks = (read_log(args.log, args.chunk_rows) if args.log
+              else iter_sample_log(args.rows, args.chunk_rows))
+    report = chart_profile.RowReport(len)
+    with chart_profile.stage("build"):
+        fig = build_figure(report.count(chunks), args.top)
+    if args.report:
+        print(report.summary())
+    chart_profile.record_figure(fig, OUTPUT_NAME)
+    export_figure(fig, OUTPUT_NAME)
+    chart_cli.show(fig, args.headless)
+
+
+if __name__ == "__main__":
+    main()
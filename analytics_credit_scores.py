@@ -0,0 +1,244 @@
+import json
+from pathlib import Path
+
+import chart_cli
+import chart_profile
+import chart_theme
+import fast_figure
+from export_engine import export_figure
+
+OUTPUT_NAME = "credit_score_distribution"
+
+# Histograms are kept per (university, course, year); columns as in app.js
+GROUP_COLUMNS = ["universityId", "course", "year"]
+GROUP_NAMES = {"university": 0, "course": 1, "year": 2}
+SCORE_COLUMN = "creditScore"
+
+# Scores run 0-100; out-of-range scores land in the first or last bin
+BIN_WIDTH = 5
+SCORE_MAX = 100
+
+CHUNK_ROWS = 1_000_000
+# Series drawn per chart; the largest groups win
+TOP_SERIES = 6
+
+SAMPLE_STUDENTS = 50_000
+COURSES = ["B.Tech Computer Science", "B.Tech Mechanical", "B.Sc Physics", "B.Com", "BA English"]
+YEARS = ["1st Year", "2nd Year", "3rd Year", "4th Year"]
+
+
+def bin_edges():
+    import numpy as np
+    return np.arange(0, SCORE_MAX + BIN_WIDTH, BIN_WIDTH, dtype=np.float64)
+
+
+def iter_sample_students(rows=SAMPLE_STUDENTS, chunk_rows=CHUNK_ROWS, universities=20, seed=0):
+    """Yield synthetic student records as columnar DataFrame chunks."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    university_mean = rng.uniform(60, 80, universities)
+    for offset in range(0, rows, chunk_rows):
+        n = min(chunk_rows, rows - offset)
+        university = rng.integers(0, universities, n)
+        year = rng.integers(0, len(YEARS), n)
+        # Scores climb a little with each year of study
+        scores = rng.normal(university_mean[university] + 2 * year, 10)
+        yield pd.DataFrame({
+            "universityId": university + 1,
+            "course": np.array(COURSES)[rng.integers(0, len(COURSES), n)],
+            "year": np.array(YEARS)[year],
+            "creditScore": np.clip(np.rint(scores), 0, SCORE_MAX),
+        })
+
+
+def read_students(path, chunk_rows=CHUNK_ROWS):
+    """Stream the grouping and score columns from a CSV or app.js-style JSON."""
+    import pandas as pd
+
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with open(path) as f:
+            data = json.load(f)
+        records = data["students"] if isinstance(data, dict) else data
+        return [pd.DataFrame(records, columns=GROUP_COLUMNS + [SCORE_COLUMN])]
+    # Group values stay text, so a chunk with a blank universityId does not
+    # turn that column's ids into floats
+    return pd.read_csv(path, chunksize=chunk_rows, usecols=GROUP_COLUMNS + [SCORE_COLUMN],
+                       dtype={column: str for column in GROUP_COLUMNS})
+
+
+def compute_bins(chunks, edges=None):
+    """Histogram credit scores per (university, course, year) with NumPy.
+
+    Each chunk's group columns are factorized into one combined group code,
+    so a single ``np.bincount`` over ``group * n_bins + bin`` counts every
+    group's histogram at once.  Returns ``{"edges", "keys", "counts"}`` with
+    one row of ``counts`` per key.  Rows without a score, or with a missing
+    or blank university, course or year, are skipped.
+    """
+    import numpy as np
+    import pandas as pd
+
+    edges = bin_edges() if edges is None else edges
+    n_bins = len(edges) - 1
+    index = {}
+    counts = np.zeros((0, n_bins), dtype=np.int64)
+    for chunk in chunks:
+        scores = chunk[SCORE_COLUMN].to_numpy(dtype=np.float64)
+        grouped = chunk[GROUP_COLUMNS].replace(r"^\s*$", np.nan, regex=True).notna()
+        valid = np.isfinite(scores) & grouped.all(axis=1).to_numpy()
+        if not valid.any():
+            continue
+        bins = np.clip(np.searchsorted(edges, scores[valid], side="right") - 1, 0, n_bins - 1)
+
+        codes, uniques = [], []
+        for column in GROUP_COLUMNS:
+            column_codes, column_uniques = pd.factorize(chunk[column].to_numpy()[valid])
+            codes.append(column_codes)
+            uniques.append(column_uniques)
+        shape = [len(u) for u in uniques]
+        group_codes, groups = pd.factorize(np.ravel_multi_index(codes, shape))
+        chunk_counts = np.bincount(group_codes * n_bins + bins,
+                                   minlength=len(groups) * n_bins).reshape(-1, n_bins)
+
+        labels = [u[c].tolist() for u, c in zip(uniques, np.unravel_index(groups, shape))]
+        rows = [index.setdefault(key, len(index)) for key in zip(*labels)]
+        if len(index) > len(counts):
+            counts = np.vstack([counts, np.zeros((len(index) - len(counts), n_bins), np.int64)])
+        # Keys are unique within a chunk, so plain fancy-index addition is safe
+        counts[rows] += chunk_counts
+    return {"edges": edges, "keys": list(index), "counts": counts}
+
+
+def save_bins(bins, path):
+    """Persist bin counts as a compressed .npz of plain arrays."""
+    import numpy as np
+
+    columns = list(zip(*bins["keys"])) or [()] * len(GROUP_COLUMNS)
+    np.savez_compressed(path, edges=bins["edges"], counts=bins["counts"],
+                        **{name: np.array(values) for name, values in zip(GROUP_COLUMNS, columns)})
+
+
+def load_bins(path):
+    import numpy as np
+
+    with np.load(path) as data:
+        keys = list(zip(*(data[name].tolist() for name in GROUP_COLUMNS)))
+        return {"edges": data["edges"], "keys": keys, "counts": data["counts"]}
+
+
+def select(bins, by="year", filters=None, top=TOP_SERIES):
+    """Sum the histograms matching ``filters`` per value of ``by``.
+
+    ``filters`` maps "university"/"course"/"year" to the value to keep.
+    Returns ``[(label, counts), ...]`` for the ``top`` largest series,
+    years in order.
+    """
+    import numpy as np
+
+    checks = [(GROUP_NAMES[name], str(value)) for name, value in (filters or {}).items()
+              if value is not None]
+    dim = GROUP_NAMES[by]
+    series = {}
+    for key, counts in zip(bins["keys"], bins["counts"]):
+        if all(str(key[i]) == value for i, value in checks):
+            label = key[dim]
+            series[label] = series.get(label, 0) + counts
+    largest = sorted(series.items(), key=lambda item: -int(np.sum(item[1])))[:top]
+    if by == "year":
+        largest.sort(key=lambda item: str(item[0]))
+    return largest
+
+
+def build_figure(bins=None, by="year", filters=None, top=TOP_SERIES, fast=False):
+    import numpy as np
+    go = fast_figure.objects(fast)
+    chart_theme.register()
+
+    with chart_profile.stage("aggregate"):
+        if bins is None:
+            bins = compute_bins(iter_sample_students())
+        series = select(bins, by, filters, top)
+
+    edges = bins["edges"]
+    centers = (edges[:-1] + edges[1:]) / 2
+    bin_labels = [f"{lo:g}-{hi:g}" for lo, hi in zip(edges[:-1], edges[1:])]
+
+    fig = go.Figure()
+    for label, counts in series:
+        total = int(counts.sum())
+        mean = float((centers * counts).sum() / total) if total else 0.0
+        name = f"University {label}" if by == "university" else str(label)
+        fig.add_trace(go.Bar(
+            x=bin_labels,
+            y=np.round(counts * 100 / max(total, 1), 2),
+            customdata=counts,
+            name=f"{name} (n={total:,}, mean {mean:.1f})",
+            hovertemplate='Score %{x}<br>%{y}% of students (%{customdata:,})<extra>'
+                          + name + '</extra>'
+        ))
+
+    title = "Student Credit Score Distribution"
+    shown = [f"University {value}" if name == "university" else str(value)
+             for name, value in (filters or {}).items() if value is not None]
+    if shown:
+        title += f" ({', '.join(shown)})"
+    fig.update_layout(
+        title=title,
+        barmode='group',
+        bargap=0.15,
+        xaxis_title="Credit score",
+        yaxis_title="Students (%)"
+    )
+
+    return fast_figure.finish(fig)
+
+
+def main(argv=None):
+    parser = chart_cli.make_parser()
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--students", help="CSV (" + ",".join(GROUP_COLUMNS + [SCORE_COLUMN])
+                        + ") or app.js-style JSON of students")
+    source.add_argument("--from-bins", action="store_true",
+                        help="chart the bin counts already saved at --bins")
+    parser.add_argument("--bins", metavar="PATH",
+                        help="save the computed bin counts here (.npz)")
+    parser.add_argument("--by", choices=list(GROUP_NAMES), default="year",
+                        help="draw one series per university, course or year")
+    parser.add_argument("--university")
+    parser.add_argument("--course")
+    parser.add_argument("--year")
+    parser.add_argument("--top", type=int, default=TOP_SERIES)
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--rows", type=int, default=SAMPLE_STUDENTS,
+                        help="synthetic students to generate without --students")
+    chart_cli.add_report_option(parser)
+    args = parser.parse_args(argv)
+    if args.from_bins and not args.bins:
+        parser.error("--from-bins needs --bins PATH")
+
+    report = chart_profile.RowReport(len)
+    with chart_profile.stage("load"):
+        if args.from_bins:
+            bins = load_bins(args.bins)
+        else:
+            chunks = (read_students(args.students, args.chunk_rows) if args.students
+                      else iter_sample_students(args.rows, args.chunk_rows))
+            bins = compute_bins(report.count(chunks))
+            if args.bins:
+                save_bins(bins, args.bins)
+    filters = {"university": args.university, "course": args.course, "year": args.year}
+    with chart_profile.stage("build"):
+        fig = build_figure(bins, args.by, filters, args.top)
+    if args.report:
+        source = "saved bins" if args.from_bins else None
+        print(f"{len(bins['keys'])} histograms from {report.summary(source)}")
+    chart_profile.record_figure(fig, OUTPUT_NAME)
+    export_figure(fig, OUTPUT_NAME)
+    chart_cli.show(fig, args.headless)
+
+
+if __name__ == "__main__":
+    main()
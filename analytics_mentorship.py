@@ -0,0 +1,191 @@
+import time
+from pathlib import Path
+
+import chart_cli
+import chart_profile
+import chart_theme
+import fast_figure
+from export_engine import export_figure
+
+OUTPUT_NAME = "mentorship_network"
+
+# Mentorships(alumni_id, student_id) from the ERD in chart_script_2.py
+PAIR_COLUMNS = ["alumni_id", "student_id"]
+
+# Keep alumni mentoring at least this many students (and their edges)
+MIN_DEGREE = 1
+
+SAMPLE_EDGES = 100_000
+SAMPLE_ALUMNI = 8_000
+SAMPLE_STUDENTS = 80_000
+
+GOLDEN_ANGLE = 2.399963229728653
+
+
+def sample_pairs(edges=SAMPLE_EDGES, alumni=SAMPLE_ALUMNI, students=SAMPLE_STUDENTS, seed=0):
+    """Return synthetic (alumni_ids, student_ids) arrays; a few alumni mentor many."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    weights = 1 / np.arange(1, alumni + 1) ** 0.8
+    weights /= weights.sum()
+    return (rng.choice(alumni, edges, p=weights) + 1,
+            rng.integers(1, students + 1, edges))
+
+
+def read_pairs(path):
+    """Read (alumni_ids, student_ids) arrays from a CSV of mentorships."""
+    import pandas as pd
+
+    pairs = pd.read_csv(path, usecols=PAIR_COLUMNS)
+    return pairs["alumni_id"].to_numpy(), pairs["student_id"].to_numpy()
+
+
+def layout(alumni_idx, student_idx, n_alumni, n_students, seed=0):
+    """Place every node with a few O(edges) vectorized passes.
+
+    Alumni sit on a sunflower spiral about one unit apart, busiest mentors
+    in the middle; each student sits at the mean position of their mentors,
+    jittered onto a small ring so a mentor's students fan out around them.
+    Returns float32 (x, y) arrays, alumni first.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    degree = np.bincount(alumni_idx, minlength=n_alumni)
+    rank = np.empty(n_alumni, dtype=np.float64)
+    rank[np.argsort(-degree, kind="stable")] = np.arange(n_alumni)
+    radius = np.sqrt(rank + 0.5)
+    alumni_x = radius * np.cos(rank * GOLDEN_ANGLE)
+    alumni_y = radius * np.sin(rank * GOLDEN_ANGLE)
+
+    mentors = np.maximum(np.bincount(student_idx, minlength=n_students), 1)
+    student_x = np.bincount(student_idx, alumni_x[alumni_idx], n_students) / mentors
+    student_y = np.bincount(student_idx, alumni_y[alumni_idx], n_students) / mentors
+    angle = rng.uniform(0, 2 * np.pi, n_students)
+    ring = rng.uniform(0.15, 0.45, n_students)
+    student_x += ring * np.cos(angle)
+    student_y += ring * np.sin(angle)
+
+    x = np.concatenate([alumni_x, student_x]).astype(np.float32)
+    y = np.concatenate([alumni_y, student_y]).astype(np.float32)
+    return x, y
+
+
+def build_figure(pairs=None, min_degree=MIN_DEGREE, fast=False):
+    import numpy as np
+    go = fast_figure.objects(fast)
+    chart_theme.register()
+
+    with chart_profile.stage("layout"):
+        alumni_ids, student_ids = sample_pairs() if pairs is None else pairs
+        alumni_keys, alumni_idx = np.unique(alumni_ids, return_inverse=True)
+        # Degree filtering drops light mentors and, with them, their edges
+        degree = np.bincount(alumni_idx, minlength=len(alumni_keys))
+        keep = degree[alumni_idx] >= min_degree
+        alumni_keys, alumni_idx = np.unique(np.asarray(alumni_ids)[keep], return_inverse=True)
+        student_keys, student_idx = np.unique(np.asarray(student_ids)[keep], return_inverse=True)
+        n_alumni, n_students = len(alumni_keys), len(student_keys)
+        x, y = layout(alumni_idx, student_idx, n_alumni, n_students)
+
+        # Positions on a shared uint16 grid halve the node payload; x and y
+        # use the same scale so the layout keeps its aspect ratio
+        origin = min(x.min(), y.min()) if len(x) else 0
+        scale = 65535 / max(float(max(x.max(), y.max()) - origin), 1e-9) if len(x) else 1
+        x = np.rint((x - origin) * scale).astype(np.uint16)
+        y = np.rint((y - origin) * scale).astype(np.uint16)
+
+        # All edges in one trace, drawn as a star per mentor
+        # (mentor, student, mentor, student, ..., gap) so an edge costs two
+        # points rather than start, end and a gap
+        order = np.argsort(alumni_idx, kind="stable")
+        start, end = alumni_idx[order], student_idx[order] + n_alumni
+        star = np.cumsum(np.r_[True, start[1:] != start[:-1]]) - 1 if len(start) else start
+        slot = 2 * np.arange(len(start)) + star
+        points = 2 * len(start) + (star[-1] + 1 if len(start) else 0)
+        edge_x = np.full(points, np.nan, dtype=np.float32)
+        edge_y = np.full(points, np.nan, dtype=np.float32)
+        edge_x[slot], edge_x[slot + 1] = x[start], x[end]
+        edge_y[slot], edge_y[slot + 1] = y[start], y[end]
+
+        degree = np.concatenate([np.bincount(alumni_idx, minlength=n_alumni),
+                                 np.bincount(student_idx, minlength=n_students)])
+        role = np.concatenate([np.zeros(n_alumni, np.uint8), np.ones(n_students, np.uint8)])
+        size = np.where(role == 0, np.minimum(4 + 1.5 * np.sqrt(degree), 20), 3).astype(np.uint8)
+        node_ids = np.column_stack([np.concatenate([alumni_keys, student_keys]),
+                                    degree]).astype(np.int64)
+        # int32 halves the hover payload, but real ids may not fit in it
+        int32 = np.iinfo(np.int32)
+        if not node_ids.size or int32.min <= node_ids.min() and node_ids.max() <= int32.max:
+            node_ids = node_ids.astype(np.int32)
+
+    alumni_color, student_color = chart_theme.BRAND_COLORS[0], chart_theme.BRAND_COLORS[1]
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=edge_x,
+        y=edge_y,
+        mode='lines',
+        line=dict(color='rgba(120,120,120,0.25)', width=0.5),
+        showlegend=False,
+        hoverinfo='skip'
+    ))
+    fig.add_trace(go.Scattergl(
+        x=x,
+        y=y,
+        mode='markers',
+        marker=dict(
+            size=size,
+            color=role,
+            # Two flat bands: one color per role, labelled on the colorbar
+            colorscale=[[0, alumni_color], [0.5, alumni_color],
+                        [0.5, student_color], [1, student_color]],
+            cmin=0,
+            cmax=1,
+            colorbar=dict(tickvals=[0.25, 0.75], ticktext=["Alumni", "Students"],
+                          thickness=12, len=0.3, y=0.85),
+            line=dict(width=0)
+        ),
+        customdata=node_ids,
+        hovertemplate='ID %{customdata[0]}<br>%{customdata[1]} mentorships<extra></extra>',
+        showlegend=False
+    ))
+
+    fig.update_layout(
+        title=f"Alumni Mentorship Network ({len(start):,} mentorships, "
+              f"{n_alumni:,} alumni, {n_students:,} students)",
+        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False,
+                   scaleanchor='x'),
+        hovermode='closest'
+    )
+
+    return fast_figure.finish(fig)
+
+
+def main(argv=None):
+    parser = chart_cli.make_parser()
+    parser.add_argument("--pairs", help="CSV of mentorships (" + ",".join(PAIR_COLUMNS) + ")")
+    parser.add_argument("--edges", type=int, default=SAMPLE_EDGES,
+                        help="synthetic mentorships to generate without --pairs")
+    parser.add_argument("--min-degree", type=int, default=MIN_DEGREE,
+                        help="only draw alumni mentoring at least this many students")
+    parser.add_argument("--html", metavar="PATH",
+                        help="also write interactive HTML loading plotly.js from the CDN")
+    args = parser.parse_args(argv)
+
+    with chart_profile.stage("load"):
+        pairs = read_pairs(args.pairs) if args.pairs else sample_pairs(args.edges)
+    with chart_profile.stage("build"):
+        fig = build_figure(pairs, args.min_degree)
+    chart_profile.record_figure(fig, OUTPUT_NAME)
+    export_figure(fig, OUTPUT_NAME)
+    if args.html:
+        start = time.perf_counter()
+        fig.write_html(args.html, include_plotlyjs="cdn")
+        print(f"wrote {args.html} ({Path(args.html).stat().st_size / 1024:.0f} KB) "
+              f"in {time.perf_counter() - start:.2f}s")
+    chart_cli.show(fig, args.headless)
+
+
+if __name__ == "__main__":
+    main()
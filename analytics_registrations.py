@@ -0,0 +1,176 @@
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import chart_cli
+import chart_profile
+import chart_theme
+import fast_figure
+from export_engine import export_figure
+from registration_store import DEFAULT_STORE, REGISTRATION_COLUMNS, RegistrationStore
+
+OUTPUT_NAME = "event_registrations"
+
+# Event titles from app.js; other events are labelled by id
+events = {
+    1: "Tech Career Fair 2024",
+    2: "Alumni Networking Event",
+}
+
+# Events with the most registrations get a line each
+TOP_EVENTS = 8
+
+SAMPLE_START = "2024-01-01"
+SAMPLE_DAYS = 90
+SAMPLE_PER_DAY = 500
+SAMPLE_EVENTS = 20
+
+
+def iter_sample_registrations(days=SAMPLE_DAYS, per_day=SAMPLE_PER_DAY, start=SAMPLE_START,
+                              first_id=1, seed=0):
+    """Yield synthetic (registration_id, event_id, student_id, registered_at) rows."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    # A few headline events draw most of the sign-ups
+    weights = 1 / np.arange(1, SAMPLE_EVENTS + 1)
+    weights /= weights.sum()
+    day0 = date.fromisoformat(start)
+    registration_id = first_id
+    for offset in range(days):
+        day = (day0 + timedelta(days=offset)).isoformat()
+        n = rng.poisson(per_day * (1.3 if offset % 7 in (5, 6) else 1.0))
+        event_ids = rng.choice(SAMPLE_EVENTS, n, p=weights) + 1
+        seconds = np.sort(rng.integers(0, 86400, n))
+        students = rng.integers(1, 100_000, n)
+        for event_id, second, student_id in zip(event_ids, seconds, students):
+            yield (registration_id, int(event_id), int(student_id),
+                   f"{day} {second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}")
+            registration_id += 1
+
+
+def append_sample_log(path, days=1, per_day=SAMPLE_PER_DAY):
+    """Append ``days`` more days of synthetic registrations to a CSV log."""
+    path = Path(path)
+    start, first_id = SAMPLE_START, 1
+    empty = not path.exists() or not path.stat().st_size
+    if not empty:
+        # Continue from the last complete line without reading the whole log
+        with open(path, "rb") as f:
+            f.seek(max(0, path.stat().st_size - 256))
+            tail = f.read()
+        lines = [line for line in tail.splitlines() if line.strip()]
+        last = lines[-1].decode().split(",") if lines else REGISTRATION_COLUMNS
+        if last[0] != REGISTRATION_COLUMNS[0]:
+            first_id = int(last[0]) + 1
+            start = (date.fromisoformat(last[3][:10]) + timedelta(days=1)).isoformat()
+    with open(path, "a") as f:
+        if empty:
+            f.write(",".join(REGISTRATION_COLUMNS) + "\n")
+        elif not tail.endswith(b"\n"):
+            f.write("\n")
+        rows = iter_sample_registrations(days, per_day, start, first_id, seed=first_id)
+        f.writelines(f"{r[0]},{r[1]},{r[2]},{r[3]}\n" for r in rows)
+
+
+def sample_daily():
+    store = RegistrationStore(":memory:")
+    store.ingest_rows((event_id, registered_at)
+                      for _, event_id, _, registered_at in iter_sample_registrations())
+    return store.daily()
+
+
+def build_figure(daily=None, top=TOP_EVENTS, fast=False):
+    import numpy as np
+    go = fast_figure.objects(fast)
+    chart_theme.register()
+
+    with chart_profile.stage("aggregate"):
+        rows = list(sample_daily() if daily is None else daily)
+        days = sorted({day for day, _, _ in rows})
+        day_index = {day: i for i, day in enumerate(days)}
+        event_index = {}
+        day_idx = np.fromiter((day_index[day] for day, _, _ in rows), np.intp, len(rows))
+        event_idx = np.fromiter((event_index.setdefault(event_id, len(event_index))
+                                 for _, event_id, _ in rows), np.intp, len(rows))
+        # One events x days matrix, filled in a single unbuffered scatter-add
+        matrix = np.zeros((len(event_index), len(days)), dtype=np.int64)
+        np.add.at(matrix, (event_idx, day_idx),
+                  np.fromiter((n for _, _, n in rows), np.int64, len(rows)))
+        per_event = dict(zip(event_index, matrix))
+
+    totals = np.sum(list(per_event.values()), axis=0) if per_event else np.zeros(0)
+    leaders = sorted(per_event, key=lambda event_id: -per_event[event_id].sum())[:top]
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=days,
+        y=totals,
+        name="All events (daily)",
+        marker_color="#D9D9D9",
+        yaxis='y2',
+        hovertemplate='%{x}<br>%{y} registrations<extra>All events</extra>'
+    ))
+    for event_id in leaders:
+        name = events.get(event_id, f"Event {event_id}")
+        fig.add_trace(go.Scatter(
+            x=days,
+            y=np.cumsum(per_event[event_id]),
+            mode='lines',
+            line=dict(width=2),
+            name=name,
+            hovertemplate='%{x}<br>%{y} registered<extra>' + name + '</extra>'
+        ))
+
+    fig.update_layout(
+        title="Event Registration Trends",
+        xaxis_title="Date",
+        yaxis=dict(title="Cumulative registrations"),
+        yaxis2=dict(title="Daily registrations", overlaying='y', side='right',
+                    showgrid=False),
+        legend=dict(y=1.08)
+    )
+
+    return fast_figure.finish(fig)
+
+
+def main(argv=None):
+    parser = chart_cli.make_parser()
+    parser.add_argument("--log", help="append-only registration CSV ("
+                        + ",".join(REGISTRATION_COLUMNS) + ")")
+    parser.add_argument("--store", default=str(DEFAULT_STORE),
+                        help="SQLite file holding the counters and checkpoint")
+    parser.add_argument("--append-sample", type=int, metavar="DAYS",
+                        help="first append DAYS days of synthetic registrations to --log")
+    parser.add_argument("--top", type=int, default=TOP_EVENTS)
+    args = parser.parse_args(argv)
+    if args.append_sample and not args.log:
+        parser.error("--append-sample needs --log PATH")
+
+    daily = None
+    if args.log:
+        if args.append_sample:
+            append_sample_log(args.log, args.append_sample)
+        store = RegistrationStore(args.store)
+        try:
+            start = time.perf_counter()
+            with chart_profile.stage("ingest"):
+                added = store.ingest_log(args.log)
+            ingest_s = time.perf_counter() - start
+            with chart_profile.stage("load"):
+                daily = store.daily()
+            _, total = store.checkpoint(Path(args.log).resolve())
+        finally:
+            store.close()
+        print(f"ingested {added} new registrations in {ingest_s:.2f}s "
+              f"({total} total, {len(daily)} day/event counters)")
+
+    with chart_profile.stage("build"):
+        fig = build_figure(daily, args.top)
+    chart_profile.record_figure(fig, OUTPUT_NAME)
+    export_figure(fig, OUTPUT_NAME)
+    chart_cli.show(fig, args.headless)
+
+
+if __name__ == "__main__":
+    main()
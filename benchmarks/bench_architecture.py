@@ -0,0 +1,68 @@
+"""Build/export cost of the architecture graph at 100, 1k and 10k edges.
+
+Compares the single segmented edge trace in chart_script.build_figure with
+the previous one-trace-per-connection approach (skipped above
+``--legacy-max`` edges, where it takes minutes).
+
+Usage: python -m benchmarks.bench_architecture [--sizes 100 1000 10000]
+"""
+import argparse
+import random
+
+import plotly.graph_objects as go
+
+import chart_script
+from benchmarks.common import best_of, export_seconds, fmt_seconds
+
+TYPES = [('Frontend', '#1FB8CD'), ('Core', '#DB4545'),
+         ('Service', '#2E8B57'), ('External', '#5D878F')]
+
+
+def synthetic_graph(n_edges, seed=0):
+    rng = random.Random(seed)
+    n_nodes = max(2, n_edges // 2)
+    components = {}
+    for i in range(n_nodes):
+        comp_type, color = TYPES[i % len(TYPES)]
+        components[f'svc-{i}'] = {'x': rng.uniform(0, 100), 'y': rng.uniform(0, 100),
+                                  'color': color, 'type': comp_type}
+    names = list(components)
+    connections = [tuple(rng.sample(names, 2)) for _ in range(n_edges)]
+    return components, connections
+
+
+def legacy_build(components, connections):
+    fig = go.Figure()
+    for start, end in connections:
+        fig.add_trace(go.Scatter(
+            x=[components[start]['x'], components[end]['x']],
+            y=[components[start]['y'], components[end]['y']],
+            mode='lines', line=dict(color='lightgray', width=2),
+            showlegend=False, hoverinfo='skip'))
+    return fig
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--legacy-max', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'edges':>7}{'traces':>8}{'build':>10}{'json KB':>10}{'export':>10}"
+          f"{'legacy build':>14}")
+    for n_edges in args.sizes:
+        components, connections = synthetic_graph(n_edges)
+        build_s, fig = best_of(lambda: chart_script.build_figure(components, connections),
+                               args.repeat)
+        json_kb = len(fig.to_json()) / 1024
+        export_s = export_seconds(fig, f'architecture_{n_edges}')
+        legacy_s = None
+        if n_edges <= args.legacy_max:
+            legacy_s, _ = best_of(lambda: legacy_build(components, connections), 1)
+        print(f"{n_edges:>7}{len(fig.data):>8}{fmt_seconds(build_s):>10}{json_kb:>10.1f}"
+              f"{fmt_seconds(export_s):>10}{fmt_seconds(legacy_s):>14}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""SQLite introspection, force layout and figure build for synthetic schemas.
+
+Each synthetic schema is a forest of tables where every table after the
+first few references one or two earlier ones, plus a few junction tables,
+which is roughly the shape of an application schema.
+
+Usage: python -m benchmarks.bench_erd_layout [--sizes 50 100 250 500 1000]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+
+import chart_script_2
+from benchmarks.common import best_of, fmt_seconds
+
+
+def synthetic_schema(path, n_tables, seed=0):
+    rng = random.Random(seed)
+    con = sqlite3.connect(path)
+    for i in range(n_tables):
+        columns = ["id INTEGER PRIMARY KEY"]
+        columns += [f"col_{j} TEXT" for j in range(rng.randint(2, 9))]
+        refs = rng.sample(range(i), min(i, rng.choice([1, 1, 1, 2]))) if i >= 3 else []
+        columns += [f"t{ref}_id INTEGER REFERENCES t{ref}(id)" for ref in refs]
+        con.execute(f"CREATE TABLE t{i} ({', '.join(columns)})")
+    con.commit()
+    con.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 250, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'tables':>7}{'fks':>6}{'introspect':>12}{'layout':>10}{'build':>10}")
+    for n_tables in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "schema.db")
+            synthetic_schema(path, n_tables)
+            introspect_s, (entities, rels) = best_of(
+                lambda: chart_script_2.load_sqlite_schema(path), args.repeat)
+
+        layout_s, positions = best_of(
+            lambda: chart_script_2.force_layout(list(entities), rels), args.repeat)
+        for name, info in entities.items():
+            info["position"] = positions[name]
+        build_s, _ = best_of(lambda: chart_script_2.build_figure(entities, rels), 1)
+
+        print(f"{n_tables:>7}{len(rels):>6}{fmt_seconds(introspect_s):>12}"
+              f"{fmt_seconds(layout_s):>10}{fmt_seconds(build_s):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Parity and speed of the fast_figure dict builder against graph_objects.
+
+For every chart at each synthetic scale, builds the figure both ways,
+checks the two serialize to the same JSON document (key order aside) and
+times the graph_objects build, the fast build, and the fast build plus a
+single validation pass (what ADHYAYAN_DEBUG=1 costs).  Exits non-zero if
+any chart's figures differ.
+
+Usage: python -m benchmarks.bench_fast_figure [--scales 1 10 100] [--charts ...]
+"""
+import argparse
+import importlib
+import json
+import sys
+
+from benchmarks.common import best_of, fmt_seconds
+from benchmarks.synthetic import SCALERS, scaled_inputs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charts", nargs="+", default=list(SCALERS))
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    mismatches = []
+    print(f"{'chart':<16}{'scale':>6}{'go':>11}{'fast':>11}{'fast+validate':>15}"
+          f"{'speedup':>9}  parity")
+    for chart in args.charts:
+        module = importlib.import_module(chart)
+        for scale in args.scales:
+            inputs = scaled_inputs(chart, scale)
+            go_s, go_fig = best_of(lambda: module.build_figure(*inputs), args.repeat)
+            fast_s, fast_fig = best_of(lambda: module.build_figure(*inputs, fast=True),
+                                       args.repeat)
+            checked_s, _ = best_of(
+                lambda: module.build_figure(*inputs, fast=True).validate(), args.repeat)
+            same = json.loads(go_fig.to_json()) == json.loads(fast_fig.to_json())
+            if not same:
+                mismatches.append(f"{chart} x{scale}")
+            print(f"{chart:<16}{scale:>6}{fmt_seconds(go_s):>11}{fmt_seconds(fast_s):>11}"
+                  f"{fmt_seconds(checked_s):>15}{go_s / fast_s:>8.1f}x  "
+                  f"{'ok' if same else 'DIFFERS'}")
+
+    if mismatches:
+        print(f"figures differ: {', '.join(mismatches)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
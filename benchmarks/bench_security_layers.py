@@ -0,0 +1,67 @@
+"""Trace count, JSON size, build and export time for the security-layers chart.
+
+Compares the previous one-trace-per-control figure against the per-layer
+and single-trace modes of chart_script_7.build_figure on synthetic control
+catalogues.
+
+Usage: python -m benchmarks.bench_security_layers [--catalogues 7x5 30x50 60x100]
+"""
+import argparse
+
+import plotly.graph_objects as go
+
+import chart_script_7
+from benchmarks.common import best_of, export_seconds, fmt_seconds
+
+
+def synthetic_catalogue(n_layers, controls_per_layer):
+    return [(f"layer_{i}", [f"Control {i}.{j}" for j in range(controls_per_layer)])
+            for i in range(n_layers)]
+
+
+def legacy_build(layers):
+    fig = go.Figure()
+    color_idx = 0
+    for i, (layer_key, layer_components) in enumerate(layers):
+        for j, component in enumerate(layer_components):
+            fig.add_trace(go.Bar(
+                x=[1], y=[i], orientation='h', name=component[:14],
+                marker_color=chart_script_7.brand_colors[color_idx % 7],
+                text=component[:14], textposition='inside', textfont=dict(size=10),
+                hovertemplate=f'<b>{component[:14]}</b><br>Layer: {layer_key}<extra></extra>',
+                offsetgroup=j, base=j, showlegend=False))
+            color_idx += 1
+    fig.update_layout(barmode='stack')
+    return fig
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--catalogues", nargs="+", default=["7x5", "30x50", "60x100"],
+                        help="LAYERSxCONTROLS sizes")
+    parser.add_argument("--legacy-max", type=int, default=2000,
+                        help="skip the per-control build above this many controls")
+    args = parser.parse_args(argv)
+
+    builders = {
+        "per-control": legacy_build,
+        "per-layer": lambda layers: chart_script_7.build_figure(layers, "layer"),
+        "single": lambda layers: chart_script_7.build_figure(layers, "single"),
+    }
+    print(f"{'catalogue':>10}{'approach':>13}{'traces':>8}{'json KB':>10}"
+          f"{'build':>10}{'export':>10}")
+    for spec in args.catalogues:
+        n_layers, per_layer = (int(v) for v in spec.split("x"))
+        layers = synthetic_catalogue(n_layers, per_layer)
+        for approach, build in builders.items():
+            if approach == "per-control" and n_layers * per_layer > args.legacy_max:
+                continue
+            build_s, fig = best_of(lambda: build(layers), 1)
+            json_kb = len(fig.to_json()) / 1024
+            export_s = export_seconds(fig, f"security_{spec}_{approach}")
+            print(f"{spec:>10}{approach:>13}{len(fig.data):>8}{json_kb:>10.1f}"
+                  f"{fmt_seconds(build_s):>10}{fmt_seconds(export_s):>10}")
+
+
+if __name__ == "__main__":
+    main()
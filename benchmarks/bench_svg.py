@@ -0,0 +1,53 @@
+"""Native SVG rendering against the plotly build + Kaleido export.
+
+For the three diagram charts at each synthetic scale, times ``render_svg``
+(plus PNG rasterization when cairosvg is installed) next to the plotly
+``build_figure`` and its cache-less static export, which needs Kaleido and
+Chrome and shows n/a without them.
+
+Usage: python -m benchmarks.bench_svg [--scales 1 10 100] [--charts ...]
+"""
+import argparse
+import importlib
+import tempfile
+from pathlib import Path
+
+import svg_render
+from benchmarks.common import best_of, export_seconds, fmt_seconds
+from benchmarks.synthetic import scaled_inputs
+
+DIAGRAMS = ["chart_script", "chart_script_1", "chart_script_2"]
+
+
+def rasterize_seconds(svg, repeat):
+    path = Path(tempfile.mkdtemp(prefix="bench-")) / "chart.png"
+    try:
+        return best_of(lambda: svg_render.rasterize(svg, path), repeat)[0]
+    except RuntimeError:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charts", nargs="+", default=DIAGRAMS)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'chart':<16}{'scale':>6}{'svg':>10}{'svg png':>10}{'svg KB':>9}"
+          f"{'go build':>11}{'go png':>10}")
+    for chart in args.charts:
+        module = importlib.import_module(chart)
+        for scale in args.scales:
+            inputs = scaled_inputs(chart, scale)
+            svg_s, svg = best_of(lambda: module.render_svg(*inputs), args.repeat)
+            png_s = rasterize_seconds(svg, args.repeat)
+            build_s, fig = best_of(lambda: module.build_figure(*inputs), args.repeat)
+            export_s = export_seconds(fig, module.OUTPUT_NAME)
+            print(f"{chart:<16}{scale:>6}{fmt_seconds(svg_s):>10}{fmt_seconds(png_s):>10}"
+                  f"{len(svg) / 1024:>9.1f}{fmt_seconds(build_s):>11}"
+                  f"{fmt_seconds(export_s):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Timing helpers shared by the benchmarks."""
+import tempfile
+import time
+
+from export_engine import ExportEngine
+
+
+def best_of(fn, repeat=3):
+    """Return (best seconds, last result) of calling ``fn`` ``repeat`` times."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+_engine = None
+
+
+def export_seconds(fig, name, formats=("png",)):
+    """Time a cache-less static export, or return None if export is unavailable."""
+    global _engine
+    if _engine is None:
+        _engine = ExportEngine(output_dir=tempfile.mkdtemp(prefix="bench-"),
+                               verbose=False)
+    try:
+        return _engine.export(fig, name, formats).seconds
+    except RuntimeError:
+        return None
+
+
+def fmt_seconds(value):
+    return "n/a" if value is None else f"{value * 1000:.1f}ms"
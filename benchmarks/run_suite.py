@@ -0,0 +1,119 @@
+"""Build, serialize and export benchmarks for every chart script.
+
+For each chart and scale the suite times ``build_figure`` on the
+synthetically scaled inputs, ``fig.to_json()`` and a cache-less static
+export, then appends the run to a JSON-lines history file tagged with the
+current commit so runs can be compared across commits.
+
+Usage:
+    python -m benchmarks.run_suite [--charts chart_script_2 ...] [--scales 1 10 100 1000]
+    python -m benchmarks.run_suite --compare <commit>   # diff against a recorded run
+"""
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import time
+from pathlib import Path
+
+import plotly
+
+from benchmarks.common import best_of, export_seconds, fmt_seconds
+from benchmarks.synthetic import SCALERS, scaled_inputs
+
+HISTORY = Path(__file__).resolve().parent / "history.jsonl"
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                    capture_output=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+    return commit, dirty
+
+
+def bench_chart(chart, scale, export=True):
+    module = importlib.import_module(chart)
+    args = scaled_inputs(chart, scale)
+    repeat = 3 if scale <= 10 else 1
+
+    build_s, fig = best_of(lambda: module.build_figure(*args), repeat)
+    json_s, payload = best_of(fig.to_json, repeat)
+    export_s = export_seconds(fig, f"{chart}_x{scale}") if export else None
+    return {"chart": chart, "scale": scale, "build_s": build_s, "json_s": json_s,
+            "json_bytes": len(payload), "export_s": export_s}
+
+
+def load_history(path=HISTORY):
+    if not Path(path).exists():
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compare(results, baseline):
+    """Print current timings next to a recorded run's as ratios."""
+    before = {(r["chart"], r["scale"]): r for r in baseline["results"]}
+    print(f"\ncompared with {baseline['commit'][:10]} ({baseline['timestamp']}):")
+    print(f"{'chart':<16}{'scale':>6}{'build':>9}{'json':>9}{'export':>9}")
+    for r in results:
+        old = before.get((r["chart"], r["scale"]))
+        if old is None:
+            continue
+        ratios = []
+        for key in ("build_s", "json_s", "export_s"):
+            if r[key] is None or not old[key]:
+                ratios.append(f"{'-':>9}")
+            else:
+                ratios.append(f"{r[key] / old[key]:>8.2f}x")
+        print(f"{r['chart']:<16}{r['scale']:>6}{''.join(ratios)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charts", nargs="+", default=list(SCALERS))
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--export-max-scale", type=int, default=100,
+                        help="skip static export above this scale (0 disables export)")
+    parser.add_argument("--history", default=str(HISTORY))
+    parser.add_argument("--compare", metavar="COMMIT",
+                        help="compare with the latest recorded run of this commit")
+    parser.add_argument("--no-record", action="store_true",
+                        help="do not append this run to the history file")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'chart':<16}{'scale':>6}{'build':>11}{'to_json':>11}{'json KB':>10}{'export':>11}")
+    for chart in args.charts:
+        for scale in args.scales:
+            r = bench_chart(chart, scale, export=scale <= args.export_max_scale)
+            results.append(r)
+            print(f"{chart:<16}{scale:>6}{fmt_seconds(r['build_s']):>11}"
+                  f"{fmt_seconds(r['json_s']):>11}{r['json_bytes'] / 1024:>10.1f}"
+                  f"{fmt_seconds(r['export_s']):>11}")
+
+    commit, dirty = git_commit()
+    record = {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "commit": commit,
+              "dirty": dirty, "python": platform.python_version(),
+              "plotly": plotly.__version__, "machine": platform.node(),
+              "results": results}
+
+    if args.compare:
+        matches = [run for run in load_history(args.history)
+                   if run["commit"] and run["commit"].startswith(args.compare)]
+        if matches:
+            compare(results, matches[-1])
+        else:
+            print(f"\nno recorded run for commit {args.compare}")
+
+    if not args.no_record:
+        with open(args.history, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
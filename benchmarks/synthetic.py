@@ -0,0 +1,96 @@
+"""Synthetically scaled inputs for every chart script.
+
+``scaled_inputs(chart, scale)`` returns the positional arguments for that
+chart's ``build_figure`` with its shipped data replicated ``scale`` times:
+nodes and connections, flow steps, entities, dashboards, inventory rows,
+matrix cells, tasks and controls respectively.  Copies are renamed (and
+shifted where positions matter) so they stay distinct in the figure.
+"""
+import chart_script
+import chart_script_1
+import chart_script_2
+import chart_script_3
+import chart_script_4
+import chart_script_5
+import chart_script_6
+import chart_script_7
+
+
+def _architecture(scale):
+    components = {}
+    connections = []
+    for k in range(scale):
+        for name, info in chart_script.components.items():
+            components[f"{name} #{k}"] = dict(info, x=info["x"] + 9 * k)
+        connections += [(f"{a} #{k}", f"{b} #{k}") for a, b in chart_script.connections]
+    return components, connections
+
+
+def _user_flows(scale):
+    flows = []
+    for k in range(scale):
+        for flow in chart_script_1.flows:
+            steps = [dict(step, x=step["x"] + 16 * k) for step in flow["steps"]]
+            flows.append(dict(flow, name=f"{flow['name']} #{k}", steps=steps,
+                              title_x=flow["title_x"] + 16 * k))
+    return chart_script_1.swimlanes, flows
+
+
+def _erd(scale):
+    entities = {}
+    relationships = []
+    for k in range(scale):
+        for name, info in chart_script_2.entities_data.items():
+            x, y = info["position"]
+            entities[f"{name} #{k}"] = dict(info, position=(x + 8 * k, y))
+        relationships += [dict(rel, **{"from": f"{rel['from']} #{k}", "to": f"{rel['to']} #{k}"})
+                          for rel in chart_script_2.relationships]
+    return entities, relationships
+
+
+def _wireframes(scale):
+    counts = [(wireframe["name"], chart_script_3.section_counts(wireframe))
+              for wireframe in chart_script_3.data["wireframes"]]
+    return ([(f"{name} #{k}", section) for k in range(scale) for name, section in counts],)
+
+
+def _tech_stack(scale):
+    # Prefix the copy number: names are truncated to 15 characters
+    rows = [(layer, category, f"{k}-{tech}", value)
+            for k in range(scale)
+            for layer, category, tech, value in chart_script_4.iter_tech_data()]
+    return (rows,)
+
+
+def _feature_matrix(scale):
+    policy = chart_script_5.data
+    features = [dict(feature, name=f"{k}-{feature['name']}")
+                for k in range(scale) for feature in policy["features"]]
+    return (dict(policy, features=features),)
+
+
+def _roadmap(scale):
+    tasks = [dict(task, Task=f"{task['Task']} #{k}")
+             for k in range(scale)
+             for task in chart_script_6.phases + chart_script_6.dev_tracks]
+    return tasks, chart_script_6.milestones
+
+
+def _security_layers(scale):
+    return ([(key, components * scale) for key, components in chart_script_7.default_layers()],)
+
+
+SCALERS = {
+    "chart_script": _architecture,
+    "chart_script_1": _user_flows,
+    "chart_script_2": _erd,
+    "chart_script_3": _wireframes,
+    "chart_script_4": _tech_stack,
+    "chart_script_5": _feature_matrix,
+    "chart_script_6": _roadmap,
+    "chart_script_7": _security_layers,
+}
+
+
+def scaled_inputs(chart, scale):
+    return SCALERS[chart](scale)
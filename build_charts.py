@@ -0,0 +1,157 @@
+"""Regenerate every chart_script*.py diagram across a process pool.
+
+Each worker imports chart scripts by module name, calls their
+``build_figure()`` and submits the result to that worker's shared export
+engine, so the Kaleido server is started once per worker rather than once
+per chart.  A summary of per-chart timings, failures and outputs, plus the
+render cache hits summed over the workers, is printed at the end (and
+optionally written as JSON).  With ``--profile PATH`` every
+worker records its import/build/export stages and the merged Chrome trace
+is written to PATH.
+
+Usage: python build_charts.py [--jobs N] [--output-dir DIR] [--json PATH] [--profile PATH]
+"""
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import util
+from pathlib import Path
+
+import chart_profile
+from render_cache import format_stats
+
+ROOT = Path(__file__).resolve().parent
+
+
+def discover(root=ROOT):
+    """Return every diagram script in ``root``, in a stable order.
+
+    Only ``chart_script*.py`` counts; the data-driven ``analytics_*.py``
+    generators need real inputs and are run on their own.
+    """
+    return sorted(root.glob("chart_script*.py"))
+
+
+def _init_worker(output_dir, profile=False):
+    os.environ["ADHYAYAN_HEADLESS"] = "1"
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from export_engine import get_engine
+
+    engine = get_engine()
+    engine.output_dir = Path(output_dir)
+    engine.verbose = False
+    # atexit does not run in pool workers; multiprocessing finalizers do
+    util.Finalize(None, engine.stop, exitpriority=10)
+    if profile:
+        # Events go back with each summary; the parent writes the trace
+        chart_profile.enable()
+
+
+def build_chart(script):
+    """Build and export one chart. Never raises; failures are reported."""
+    from export_engine import export_figure, get_engine
+
+    chart = Path(script).stem
+    summary = {"chart": chart, "ok": False, "build_s": None, "export_s": None,
+               "total_s": None, "outputs": [], "error": None, "cache": None}
+    # Each worker has its own cache counters; report this chart's share
+    cache = get_engine().cache
+    before = cache.stats() if cache is not None else None
+    start = time.perf_counter()
+    try:
+        with chart_profile.stage("import", chart=chart):
+            module = importlib.import_module(chart)
+        with chart_profile.stage("build", chart=chart):
+            fig = module.build_figure()
+        summary["build_s"] = time.perf_counter() - start
+        chart_profile.record_figure(fig, chart)
+        result = export_figure(fig, module.OUTPUT_NAME)
+        summary["export_s"] = result.seconds
+        summary["outputs"] = [str(path) for path in result.paths]
+        summary["ok"] = True
+    except Exception:
+        summary["error"] = traceback.format_exc(limit=3)
+    summary["total_s"] = time.perf_counter() - start
+    if cache is not None:
+        summary["cache"] = {key: value - before[key] for key, value in cache.stats().items()}
+    profiler = chart_profile.get_profiler()
+    if profiler is not None:
+        summary["trace"] = profiler.drain()
+    return summary
+
+
+def build_all(scripts, jobs=None, output_dir=".", profile=False):
+    """Build ``scripts`` in parallel and return their summaries in order."""
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(scripts)))
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(str(output_dir), profile)) as pool:
+        return list(pool.map(build_chart, [str(s) for s in scripts]))
+
+
+def cache_totals(summaries):
+    """Sum the per-chart render cache counters, or None with the cache off."""
+    stats = [s["cache"] for s in summaries if s.get("cache")]
+    if not stats:
+        return None
+    return {key: sum(stat[key] for stat in stats) for key in stats[0]}
+
+
+def format_summary(summaries, wall_s):
+    def secs(value):
+        return f"{value:8.2f}" if value is not None else f"{'-':>8}"
+
+    lines = [f"{'chart':<20}{'status':<8}{'build':>8}{'export':>8}{'total':>8}  outputs"]
+    for s in summaries:
+        status = "ok" if s["ok"] else "FAILED"
+        outputs = ", ".join(Path(p).name for p in s["outputs"])
+        lines.append(f"{s['chart']:<20}{status:<8}{secs(s['build_s'])}"
+                     f"{secs(s['export_s'])}{secs(s['total_s'])}  {outputs}")
+    slowest = max((s["total_s"] for s in summaries), default=0.0)
+    serial = sum(s["total_s"] for s in summaries)
+    lines.append(f"wall clock {wall_s:.2f}s (slowest chart {slowest:.2f}s, "
+                 f"serial sum {serial:.2f}s)")
+    totals = cache_totals(summaries)
+    if totals is not None:
+        lines.append(format_stats(totals))
+    for s in summaries:
+        if s["error"]:
+            lines.append(f"\n{s['chart']} failed:\n{s['error']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--output-dir", default=".",
+                        help="directory the images are written to")
+    parser.add_argument("--json", help="also write the summary as JSON here")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="write a Chrome trace of every chart's stages to PATH")
+    args = parser.parse_args(argv)
+
+    scripts = discover()
+    start = time.perf_counter()
+    summaries = build_all(scripts, args.jobs, args.output_dir, profile=bool(args.profile))
+    wall_s = time.perf_counter() - start
+
+    print(format_summary(summaries, wall_s))
+    if args.profile:
+        events = [event for s in summaries for event in s.pop("trace", ())]
+        chart_profile.write_trace(args.profile, events)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"wall_s": wall_s, "render_cache": cache_totals(summaries),
+                       "charts": summaries}, f, indent=2)
+    return 0 if all(s["ok"] for s in summaries) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""Export every chart into one static HTML bundle sharing a single plotly.js.
+
+``fig.write_html`` embeds its own ~4.6 MB copy of plotly.js per file.  The
+bundle instead writes one ``index.html`` with a placeholder section per
+chart, loads plotly.js once (deferred, so the page paints first) and only
+plots a chart's compact payload (see ``figure_payload``) when its section
+scrolls into view, via an IntersectionObserver.
+
+Payloads are inlined as JSON script blocks by default, so the page also
+works opened straight from disk.  With ``--fetch-payloads`` each payload is
+a separate file fetched on scroll instead, which keeps the page small but
+needs the bundle served over HTTP (browsers block ``fetch()`` on file://),
+e.g. ``python -m http.server -d chart_bundle``.
+
+Usage:
+    python chart_bundle.py [--output-dir chart_bundle] [--plotlyjs file|cdn] [--fetch-payloads]
+    python chart_bundle.py --single-file   # plotly.js inlined into index.html too
+"""
+import argparse
+import html
+import importlib
+import time
+from pathlib import Path
+
+import plotly.io as pio
+from plotly.io.json import to_json_plotly
+from plotly.offline import get_plotlyjs
+
+from build_charts import discover
+from figure_payload import compact_figure
+
+PLOTLY_CDN = "https://cdn.plot.ly/plotly-{version}.min.js"
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Adhyayan Sathi Diagrams</title>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 0 auto; max-width: 1200px; padding: 16px; }}
+nav a {{ margin-right: 12px; }}
+.chart {{ min-height: 600px; border-top: 1px solid #ddd; padding-top: 12px; }}
+.chart .plot {{ height: 560px; }}
+.chart .plot:empty::before {{ content: "Loading\\2026"; color: #888; }}
+</style>
+</head>
+<body>
+<h1>Adhyayan Sathi Diagrams</h1>
+<nav>{nav}</nav>
+{sections}
+{data}
+{plotly}
+<script>
+{loader}
+</script>
+</body>
+</html>
+"""
+
+# Resolves a section's payload from an inline <script type="application/json">
+# block or a URL, fetching each shared template once, and plots it when the
+# section first comes within a screen of the viewport
+LOADER = """(function () {
+  var templates = {};
+  function readJson(source) {
+    var inline = document.getElementById(source);
+    if (inline) return Promise.resolve(JSON.parse(inline.textContent));
+    return fetch(source).then(function (r) { return r.json(); });
+  }
+  function template(name) {
+    var inline = document.getElementById(name);
+    return templates[name] || (templates[name] = readJson(inline ? name : name + ".json"));
+  }
+  function plot(section) {
+    var target = section.querySelector(".plot");
+    readJson(section.dataset.payload).then(function (payload) {
+      return template(payload.template).then(function (tpl) {
+        payload.layout.template = tpl;
+        return Plotly.newPlot(target, payload.data, payload.layout, {responsive: true});
+      });
+    }).catch(function (err) { target.textContent = "Could not load chart: " + err; });
+  }
+  function start() {
+    var sections = document.querySelectorAll(".chart[data-payload]");
+    if (!("IntersectionObserver" in window)) { sections.forEach(plot); return; }
+    var observer = new IntersectionObserver(function (entries) {
+      entries.forEach(function (entry) {
+        if (entry.isIntersecting) { observer.unobserve(entry.target); plot(entry.target); }
+      });
+    }, {rootMargin: "100% 0px"});
+    sections.forEach(function (section) { observer.observe(section); });
+  }
+  // Deferred scripts, plotly.js included, have run by DOMContentLoaded
+  if (window.Plotly) start(); else document.addEventListener("DOMContentLoaded", start);
+})();"""
+
+
+def _inline_json(element_id, text):
+    # "</" would end the script element early
+    text = text.replace("</", "<\\/")
+    return f'<script type="application/json" id="{element_id}">{text}</script>'
+
+
+def build_bundle(output_dir="chart_bundle", plotlyjs="file", single_file=False,
+                 fetch_payloads=False):
+    """Write the bundle and return ``(index_path, {chart: payload_bytes})``.
+
+    ``fetch_payloads`` writes payloads as separate files loaded with
+    ``fetch()``, which only works when the bundle is served over HTTP.
+    """
+    inline_payloads = single_file or not fetch_payloads
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    nav, sections, inline, sizes = [], [], [], {}
+    templates = {}
+    for script in discover():
+        module = importlib.import_module(script.stem)
+        fig = module.build_figure()
+        name = module.OUTPUT_NAME
+        title = fig.layout.title.text or name
+        payload, template_name, template_json = compact_figure(fig)
+        templates[template_name] = template_json
+        text = to_json_plotly(payload)
+        sizes[name] = len(text)
+        if inline_payloads:
+            source = f"payload-{name}"
+            inline.append(_inline_json(source, text))
+        else:
+            source = f"{name}.json"
+            (output_dir / source).write_text(text)
+        nav.append(f'<a href="#{name}">{html.escape(title)}</a>')
+        sections.append(f'<section class="chart" id="{name}" data-payload="{source}">'
+                        f'<h2>{html.escape(title)}</h2><div class="plot"></div></section>')
+
+    for template_name, template_json in templates.items():
+        if inline_payloads:
+            inline.append(_inline_json(template_name, template_json))
+        else:
+            (output_dir / f"{template_name}.json").write_text(template_json)
+
+    if single_file:
+        plotly_tag = f"<script>{get_plotlyjs()}</script>"
+    elif plotlyjs == "cdn":
+        plotly_tag = f'<script defer src="{PLOTLY_CDN.format(version=_plotlyjs_version())}"></script>'
+    else:
+        (output_dir / "plotly.min.js").write_text(get_plotlyjs())
+        plotly_tag = '<script defer src="plotly.min.js"></script>'
+
+    index = output_dir / "index.html"
+    index.write_text(PAGE.format(nav="\n".join(nav), sections="\n".join(sections),
+                                 data="\n".join(inline), plotly=plotly_tag, loader=LOADER))
+    return index, sizes
+
+
+def _plotlyjs_version():
+    from plotly.offline.offline import get_plotlyjs_version
+    return get_plotlyjs_version()
+
+
+def standalone_bytes():
+    """Total size of writing every chart with ``fig.write_html`` instead."""
+    total = 0
+    for script in discover():
+        fig = importlib.import_module(script.stem).build_figure()
+        total += len(pio.to_html(fig, include_plotlyjs=True, full_html=True))
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output-dir", default="chart_bundle")
+    parser.add_argument("--plotlyjs", choices=["file", "cdn"], default="file",
+                        help="ship plotly.min.js next to index.html or load it from the CDN")
+    parser.add_argument("--fetch-payloads", action="store_true",
+                        help="write payloads as separate files fetched on scroll; the "
+                             "bundle must then be served over HTTP, not opened from disk")
+    parser.add_argument("--single-file", action="store_true",
+                        help="inline plotly.js and every payload into index.html")
+    parser.add_argument("--compare", action="store_true",
+                        help="also report the size of one standalone write_html file per chart")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    index, sizes = build_bundle(args.output_dir, args.plotlyjs, args.single_file,
+                                args.fetch_payloads)
+    elapsed = time.perf_counter() - start
+
+    for name, size in sizes.items():
+        print(f"{name:<24}{size / 1024:>8.1f} KB payload")
+    files = sorted(p for p in Path(args.output_dir).iterdir() if p.is_file())
+    total = sum(p.stat().st_size for p in files)
+    print(f"wrote {index} ({index.stat().st_size / 1024:.1f} KB page, "
+          f"{total / 1024:.1f} KB in {len(files)} files) in {elapsed:.2f}s")
+    if args.fetch_payloads and not args.single_file:
+        print(f"payloads are fetched over HTTP; serve it with "
+              f"python -m http.server -d {args.output_dir}")
+    if args.compare:
+        print(f"{len(discover())} standalone write_html files: "
+              f"{standalone_bytes() / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Command-line plumbing shared by the chart scripts.
+
+Every script accepts ``--headless`` (or ``ADHYAYAN_HEADLESS=1`` in the
+environment) to export its images without opening an interactive renderer,
+which is what build machines and the batch tools want.  ``--profile PATH``
+writes a Chrome trace of the script's stages (see ``chart_profile``).
+The diagram scripts also take ``--renderer svg`` to write their SVG/PNG
+directly (see ``svg_render``) instead of through plotly and Kaleido.
+"""
+import argparse
+import os
+
+import chart_profile
+
+
+def headless_default():
+    return os.environ.get("ADHYAYAN_HEADLESS", "0") != "0"
+
+
+class _ProfileAction(argparse.Action):
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, values)
+        chart_profile.enable(values)
+
+
+def make_parser(description=None):
+    """Return an argument parser pre-populated with the shared options."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--headless", action="store_true", default=headless_default(),
+                        help="export only; never open an interactive renderer")
+    parser.add_argument("--profile", metavar="PATH", action=_ProfileAction,
+                        help="write a Chrome trace of the build stages to PATH")
+    return parser
+
+
+def add_renderer_option(parser):
+    """Add ``--renderer`` to a script that also has ``render_svg``."""
+    parser.add_argument("--renderer", choices=["plotly", "svg"], default="plotly",
+                        help="svg writes the images natively (export only); formats it "
+                             "cannot produce still go through plotly")
+
+
+def add_report_option(parser):
+    """Add ``--report`` to a script that streams its input (see ``chart_profile.RowReport``)."""
+    parser.add_argument("--report", action="store_true",
+                        help="print row throughput and peak memory")
+
+
+def show(fig, headless):
+    """Display ``fig`` unless running headless."""
+    if not headless:
+        fig.show()
@@ -0,0 +1,175 @@
+"""Opt-in per-stage timing for chart generation.
+
+Scripts wrap their stages (loading data, building the figure, exporting it)
+in ``stage(name)`` blocks and pass the finished figure to
+``record_figure``.  Nothing is recorded unless profiling is enabled, either
+with ``--profile PATH`` on any chart script or ``build_charts.py``, or with
+``ADHYAYAN_PROFILE=PATH`` in the environment; a disabled ``stage`` is a
+global lookup returning a shared no-op context manager.
+
+When enabled, the stages are written to PATH at exit in the Chrome trace
+event format, which chrome://tracing, Perfetto and speedscope all open.
+Nested stages show up nested.  ``record_figure`` adds the figure's trace,
+shape and annotation counts and, to split validation and JSON encoding out
+of the build, times re-validating and encoding the finished figure.
+"""
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import nullcontext
+
+_NULL_STAGE = nullcontext()
+
+_profiler = None
+
+
+class _Stage:
+    __slots__ = ("profiler", "name", "args", "start")
+
+    def __init__(self, profiler, name, args):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        self.profiler.complete(self.name, self.start, end - self.start, self.args)
+        return False
+
+
+class Profiler:
+    """Collects Chrome trace events for one process."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.events = []
+        self.pid = os.getpid()
+
+    def stage(self, name, **args):
+        return _Stage(self, name, args)
+
+    def complete(self, name, start_ns, duration_ns, args=None):
+        event = {"name": name, "cat": "chart", "ph": "X", "pid": self.pid,
+                 "tid": threading.get_ident(), "ts": start_ns / 1000,
+                 "dur": duration_ns / 1000}
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def counter(self, name, **values):
+        self.events.append({"name": name, "cat": "chart", "ph": "C", "pid": self.pid,
+                            "ts": time.perf_counter_ns() / 1000, "args": values})
+
+    def drain(self):
+        """Return and forget the events recorded so far."""
+        events, self.events = self.events, []
+        return events
+
+    def write(self, path=None):
+        write_trace(path or self.path, self.events)
+
+
+def write_trace(path, events):
+    """Write ``events`` as a Chrome trace file."""
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+def enable(path=None):
+    """Start recording; with ``path`` the trace is written there at exit."""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler(path)
+        if path:
+            atexit.register(_profiler.write)
+    return _profiler
+
+
+def get_profiler():
+    """Return the active profiler, or None when profiling is disabled."""
+    return _profiler
+
+
+def stage(name, **args):
+    """Context manager timing one stage; a no-op unless profiling is on."""
+    if _profiler is None:
+        return _NULL_STAGE
+    return _profiler.stage(name, **args)
+
+
+def figure_stats(fig):
+    """Return the trace, shape and annotation counts of ``fig``."""
+    layout = fig.layout
+    if isinstance(layout, dict):
+        # fast_figure.Figure keeps its layout as a plain dict
+        shapes, annotations = layout.get("shapes"), layout.get("annotations")
+    else:
+        shapes, annotations = layout.shapes, layout.annotations
+    return {"traces": len(fig.data), "shapes": len(shapes or ()),
+            "annotations": len(annotations or ())}
+
+
+def record_figure(fig, name=None):
+    """Record ``fig``'s element counts plus validate/encode timings."""
+    if _profiler is None:
+        return
+    import plotly.graph_objects as go
+
+    stats = figure_stats(fig)
+    fig_dict = fig.to_dict()
+    with _profiler.stage("validate", figure=name):
+        go.Figure(fig_dict)
+    with _profiler.stage("encode", figure=name) as encode:
+        payload = fig.to_json()
+    encode.args["bytes"] = len(payload)
+    _profiler.counter(f"figure {name}" if name else "figure", **stats)
+
+
+def peak_rss_mib():
+    """Return this process's peak resident set size in MiB, or None if unknown."""
+    try:
+        import resource
+    except ImportError:  # POSIX only
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB elsewhere
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+class RowReport:
+    """Row throughput and peak memory for a script's ``--report`` line.
+
+    Wrap the stream in ``count`` (``size`` gives the rows in each item, so
+    chunked DataFrames count their length); the clock starts on creation.
+    """
+
+    def __init__(self, size=lambda item: 1):
+        self.size = size
+        self.rows = 0
+        self.start = time.perf_counter()
+
+    def count(self, items):
+        for item in items:
+            self.rows += self.size(item)
+            yield item
+
+    def summary(self, source=None):
+        """Return "<source> in <s>s, peak RSS <n> MiB"; ``source`` defaults to the rows."""
+        elapsed = time.perf_counter() - self.start
+        if source is None:
+            source = f"{self.rows} rows ({self.rows / elapsed:,.0f} rows/s)"
+        peak = peak_rss_mib()
+        memory = "peak RSS n/a" if peak is None else f"peak RSS {peak:.1f} MiB"
+        return f"{source} in {elapsed:.2f}s, {memory}"
+
+
+# ADHYAYAN_PROFILE=<path> profiles any process that imports this module
+if os.environ.get("ADHYAYAN_PROFILE"):
+    enable(os.environ["ADHYAYAN_PROFILE"])
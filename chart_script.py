@@ -1,8 +1,18 @@
-import plotly.graph_objects as go
-import pandas as pd
+import csv
+import json
+from pathlib import Path
 
-# Create architecture diagram with connections
-fig = go.Figure()
+import chart_cli
+import chart_profile
+import chart_theme
+import fast_figure
+import svg_render
+from export_engine import export_figure
+
+OUTPUT_NAME = "architecture_chart"
+
+# Above this many components or connections, render with WebGL traces
+WEBGL_THRESHOLD = 2000
 
 # Define component positions and categories
 components = {
@@ -53,50 +63,162 @@ connections = [
     ('API Gateway', 'Payment')
 ]
 
-# Add connection lines
-for start, end in connections:
-    start_pos = components[start]
-    end_pos = components[end]
-    
-    fig.add_trace(go.Scatter(
-        x=[start_pos['x'], end_pos['x']],
-        y=[start_pos['y'], end_pos['y']],
+
+def load_components(path):
+    """Read components from a JSON mapping or a CSV with name,x,y,color,type."""
+    path = Path(path)
+    if path.suffix.lower() == '.csv':
+        with open(path, newline='') as f:
+            return {row['name']: {'x': float(row['x']), 'y': float(row['y']),
+                                  'color': row['color'], 'type': row['type']}
+                    for row in csv.DictReader(f)}
+    with open(path) as f:
+        data = json.load(f)
+    return data.get('components', data)
+
+
+def load_connections(path):
+    """Read connections from a JSON list of pairs or a CSV with source,target.
+
+    A JSON object without a "connections" key has no connections.
+    """
+    path = Path(path)
+    if path.suffix.lower() == '.csv':
+        with open(path, newline='') as f:
+            return [(row['source'], row['target']) for row in csv.DictReader(f)]
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('connections', [])
+    return [tuple(pair) for pair in data]
+
+
+def build_figure(components=components, connections=connections,
+                 webgl_threshold=WEBGL_THRESHOLD, fast=False):
+    go = fast_figure.objects(fast)
+    chart_theme.register()
+
+    # Large service maps switch to WebGL traces and drop the in-node labels
+    large = max(len(components), len(connections)) > webgl_threshold
+    scatter = go.Scattergl if large else go.Scatter
+
+    # Create architecture diagram with connections
+    fig = go.Figure()
+
+    # Add all connection lines as one trace, segments separated by None
+    edge_x = []
+    edge_y = []
+    for start, end in connections:
+        start_pos = components[start]
+        end_pos = components[end]
+        edge_x += [start_pos['x'], end_pos['x'], None]
+        edge_y += [start_pos['y'], end_pos['y'], None]
+
+    fig.add_trace(scatter(
+        x=edge_x,
+        y=edge_y,
         mode='lines',
-        line=dict(color='lightgray', width=2),
+        line=dict(color='lightgray', width=1 if large else 2),
         showlegend=False,
         hoverinfo='skip'
     ))
 
-# Add component nodes by type
-for comp_type in ['Frontend', 'Core', 'Service', 'External']:
-    comp_names = [name for name, info in components.items() if info['type'] == comp_type]
-    x_vals = [components[name]['x'] for name in comp_names]
-    y_vals = [components[name]['y'] for name in comp_names]
-    colors = [components[name]['color'] for name in comp_names]
-    
-    fig.add_trace(go.Scatter(
-        x=x_vals,
-        y=y_vals,
-        mode='markers+text',
-        marker=dict(size=80, color=colors[0], line=dict(width=2, color='white')),
-        text=comp_names,
-        textposition='middle center',
-        textfont=dict(size=11, color='white'),
-        name=comp_type,
-        hovertemplate='%{text}<br>Type: ' + comp_type + '<extra></extra>'
-    ))
+    # Group component nodes by type in a single pass
+    by_type = {}
+    for name, info in components.items():
+        by_type.setdefault(info['type'], []).append(name)
+
+    # Add component nodes by type
+    for comp_type, comp_names in by_type.items():
+        x_vals = [components[name]['x'] for name in comp_names]
+        y_vals = [components[name]['y'] for name in comp_names]
+        color = components[comp_names[0]]['color']
+
+        fig.add_trace(scatter(
+            x=x_vals,
+            y=y_vals,
+            mode='markers' if large else 'markers+text',
+            marker=dict(size=8 if large else 80, color=color,
+                        line=dict(width=1 if large else 2, color='white')),
+            text=comp_names,
+            textposition='middle center',
+            textfont=dict(size=11, color='white'),
+            name=comp_type,
+            hovertemplate='%{text}<br>Type: ' + comp_type + '<extra></extra>'
+        ))
+
+    # Update layout
+    fig.update_layout(
+        title='Adhyayan Sathi Architecture',
+        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+    )
+
+    return fast_figure.finish(fig)
+
+
+def render_svg(components=components, connections=connections,
+               webgl_threshold=WEBGL_THRESHOLD):
+    """Draw the same diagram as ``build_figure`` straight to an SVG string."""
+    # Same switch as build_figure: small unlabelled nodes for large maps
+    large = max(len(components), len(connections)) > webgl_threshold
+    xs = [info['x'] for info in components.values()]
+    ys = [info['y'] for info in components.values()]
+    # Pad the autorange the way plotly does for the markers
+    pad_x = (max(xs) - min(xs)) * (0.02 if large else 0.12) or 1
+    pad_y = (max(ys) - min(ys)) * (0.03 if large else 0.2) or 1
+    canvas = svg_render.SvgCanvas((min(xs) - pad_x, max(xs) + pad_x),
+                                  (min(ys) - pad_y, max(ys) + pad_y))
+    canvas.title('Adhyayan Sathi Architecture')
+
+    canvas.lines([(components[a]['x'], components[a]['y'],
+                   components[b]['x'], components[b]['y']) for a, b in connections],
+                 'lightgray', 1 if large else 2)
+
+    legend = {}
+    for name, info in components.items():
+        legend.setdefault(info['type'], info['color'])
+        canvas.circle(info['x'], info['y'], 4 if large else 40, info['color'],
+                      stroke='white', stroke_width=1 if large else 2)
+        if not large:
+            canvas.text(info['x'], info['y'], name, size=11, color='white')
+    canvas.legend(list(legend.items()))
+    return canvas.to_svg()
+
+
+def main(argv=None):
+    parser = chart_cli.make_parser()
+    parser.add_argument('--components',
+                        help='JSON or CSV file of components (a JSON file may also hold connections)')
+    parser.add_argument('--connections', help='JSON or CSV file of connections')
+    parser.add_argument('--webgl-threshold', type=int, default=WEBGL_THRESHOLD)
+    chart_cli.add_renderer_option(parser)
+    args = parser.parse_args(argv)
+
+    graph_components = components
+    graph_connections = connections
+    with chart_profile.stage("load"):
+        if args.components:
+            if not args.connections and Path(args.components).suffix.lower() == '.csv':
+                parser.error('--connections is required with a CSV --components')
+            graph_components = load_components(args.components)
+            graph_connections = load_connections(args.connections or args.components)
+        elif args.connections:
+            graph_connections = load_connections(args.connections)
+
+    if args.renderer == 'svg':
+        with chart_profile.stage("render svg"):
+            svg = render_svg(graph_components, graph_connections, args.webgl_threshold)
+        svg_render.export_svg(svg, OUTPUT_NAME, fallback=lambda: build_figure(
+            graph_components, graph_connections, args.webgl_threshold, fast=True))
+        return
 
-# Update layout
-fig.update_layout(
-    title='Adhyayan Sathi Architecture',
-    xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-    yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-    plot_bgcolor='white',
-    legend=dict(orientation='h', yanchor='bottom', y=1.05, xanchor='center', x=0.5)
-)
+    with chart_profile.stage("build"):
+        fig = build_figure(graph_components, graph_connections, args.webgl_threshold)
+    chart_profile.record_figure(fig, OUTPUT_NAME)
+    export_figure(fig, OUTPUT_NAME)
+    chart_cli.show(fig, args.headless)
 
-# Save the chart
-fig.write_image("architecture_chart.png")
-fig.write_image("architecture_chart.svg", format="svg")
 
-fig.show()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,13 @@
-import plotly.graph_objects as go
+import json
+
+import chart_cli
+import chart_profile
+import chart_theme
+import fast_figure
+import svg_render
+from export_engine import export_figure
+
+OUTPUT_NAME = "user_flow_diagram"
 
 # Define swimlane positions and colors with better contrast
 swimlanes = {
@@ -9,32 +18,6 @@ swimlanes = {
     "System": {"y_pos": 0, "color": "#D2BA4C"}
 }
 
-fig = go.Figure()
-
-# Add swimlane background rectangles with better visibility
-for i, (role, props) in enumerate(swimlanes.items()):
-    fig.add_shape(
-        type="rect",
-        x0=-1, x1=16,
-        y0=props["y_pos"]-0.45, y1=props["y_pos"]+0.45,
-        fillcolor=props["color"],
-        opacity=0.15,
-        layer="below",
-        line=dict(color=props["color"], width=2)
-    )
-    
-    # Add swimlane labels with better contrast
-    fig.add_annotation(
-        x=-0.5, y=props["y_pos"],
-        text=role,
-        showarrow=False,
-        font=dict(size=14, color=props["color"], family="Arial Black"),
-        xanchor="center",
-        bgcolor="white",
-        bordercolor=props["color"],
-        borderwidth=1
-    )
-
 # All flows data
 flows = [
     {
@@ -85,123 +68,229 @@ flows = [
     }
 ]
 
-# Process all flows
-for flow in flows:
-    steps = flow["steps"]
-    
-    # Add flow title
-    fig.add_annotation(
-        x=flow["title_x"], y=flow["title_y"],
-        text=flow["name"],
-        showarrow=False,
-        font=dict(size=12, color="black", family="Arial Bold"),
-        xanchor="center",
-        bgcolor="rgba(255,255,255,0.8)",
-        bordercolor="black",
-        borderwidth=1
-    )
-    
-    # Add process boxes and arrows
-    for i, step in enumerate(steps):
-        y_pos = swimlanes[step["actor"]]["y_pos"]
-        color = swimlanes[step["actor"]]["color"]
-        
-        # Handle decision points with diamond shape
-        if step.get("decision", False):
-            # Diamond for decision points
-            path = f"M {step['x']-0.25} {y_pos} L {step['x']} {y_pos+0.2} L {step['x']+0.25} {y_pos} L {step['x']} {y_pos-0.2} Z"
-            fig.add_shape(
-                type="path",
-                path=path,
-                fillcolor=color,
-                opacity=0.9,
-                line=dict(color="white", width=3)
-            )
-        else:
-            # Rectangle for regular processes
-            fig.add_shape(
-                type="rect",
-                x0=step["x"]-0.35, x1=step["x"]+0.35,
-                y0=y_pos-0.18, y1=y_pos+0.18,
-                fillcolor=color,
-                opacity=0.9,
-                line=dict(color="white", width=3)
-            )
-        
-        # Add text with better visibility
-        fig.add_annotation(
-            x=step["x"], y=y_pos,
-            text=step["text"],
-            showarrow=False,
-            font=dict(size=11, color="white", family="Arial Bold"),
+
+def load_flows(path):
+    """Read flows (and optionally swimlanes) from a JSON file.
+
+    The file holds either a list of flows or an object with a "flows" list
+    and an optional "swimlanes" mapping; missing swimlanes fall back to the
+    built-in ones.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        return swimlanes, data
+    return data.get("swimlanes", swimlanes), data["flows"]
+
+
+def build_figure(swimlanes=swimlanes, flows=flows, fast=False):
+    go = fast_figure.objects(fast)
+    chart_theme.register()
+
+    # Collect every shape and annotation as plain dicts and hand them to the
+    # layout in one go; add_shape/add_annotation re-validate on every call
+    shapes = []
+    annotations = []
+
+    # Lanes span the widest flow, with the default diagram's 16 as minimum
+    x_max = max([16] + [step["x"] + 1 for flow in flows for step in flow["steps"]])
+    y_max = max(props["y_pos"] for props in swimlanes.values()) + 1.2
+
+    # Add swimlane background rectangles with better visibility
+    for role, props in swimlanes.items():
+        shapes.append(dict(
+            type="rect",
+            x0=-1, x1=x_max,
+            y0=props["y_pos"]-0.45, y1=props["y_pos"]+0.45,
+            fillcolor=props["color"],
+            opacity=0.15,
+            layer="below",
+            line=dict(color=props["color"], width=2)
+        ))
+
+        # Add swimlane labels with better contrast
+        annotations.append(dict(
+            x=-0.5, y=props["y_pos"],
+            text=role,
+            font=dict(size=14, color=props["color"], family=chart_theme.HEADING_FONT),
+            bgcolor="white",
+            bordercolor=props["color"],
+            borderwidth=1
+        ))
+
+    # Process all flows
+    for flow in flows:
+        steps = flow["steps"]
+
+        # Add flow title
+        annotations.append(dict(
+            x=flow["title_x"], y=flow["title_y"],
+            text=flow["name"],
+            font=dict(size=12, color="black", family="Arial Bold"),
+            bgcolor="rgba(255,255,255,0.8)",
+            bordercolor="black",
+            borderwidth=1
+        ))
+
+        # Add process boxes and arrows
+        for i, step in enumerate(steps):
+            y_pos = swimlanes[step["actor"]]["y_pos"]
+            color = swimlanes[step["actor"]]["color"]
+
+            # Handle decision points with diamond shape
+            if step.get("decision", False):
+                # Diamond for decision points
+                path = f"M {step['x']-0.25} {y_pos} L {step['x']} {y_pos+0.2} L {step['x']+0.25} {y_pos} L {step['x']} {y_pos-0.2} Z"
+                shapes.append(dict(
+                    type="path",
+                    path=path,
+                    fillcolor=color,
+                    opacity=0.9
+                ))
+            else:
+                # Rectangle for regular processes
+                shapes.append(dict(
+                    type="rect",
+                    x0=step["x"]-0.35, x1=step["x"]+0.35,
+                    y0=y_pos-0.18, y1=y_pos+0.18,
+                    fillcolor=color,
+                    opacity=0.9
+                ))
+
+            # Add text with better visibility
+            annotations.append(dict(
+                x=step["x"], y=y_pos,
+                text=step["text"],
+                font=dict(size=11, color="white", family="Arial Bold")
+            ))
+
+            # Add arrows between steps
+            if i < len(steps) - 1:
+                next_step = steps[i + 1]
+                next_y = swimlanes[next_step["actor"]]["y_pos"]
+
+                annotations.append(dict(
+                    x=next_step["x"] - 0.35, y=next_y,
+                    ax=step["x"] + 0.35, ay=y_pos,
+                    axref="x", ayref="y",
+                    xref="x", yref="y",
+                    showarrow=True
+                ))
+
+    # Add legend for decision points
+    shapes.append(dict(
+        type="path",
+        path=f"M {x_max-0.8} -0.7 L {x_max-0.6} -0.5 L {x_max-0.8} -0.3 L {x_max-1} -0.5 Z",
+        fillcolor="#999999",
+        opacity=0.8,
+        line=dict(width=2)
+    ))
+
+    annotations.append(dict(
+        x=x_max-0.2, y=-0.5,
+        text="Decision Point",
+        font=dict(size=10, color="black"),
+        xanchor="left"
+    ))
+
+    # Configure layout for better presentation
+    fig = go.Figure(layout=dict(
+        shapes=shapes,
+        annotations=annotations,
+        title=dict(
+            text="Adhyayan Platform User Flows",
+            font=dict(size=18, color="black", family="Arial Bold"),
+            x=0.5,
             xanchor="center"
-        )
-        
-        # Add arrows between steps
-        if i < len(steps) - 1:
-            next_step = steps[i + 1]
-            next_y = swimlanes[next_step["actor"]]["y_pos"]
-            
-            # Calculate arrow position
-            start_x = step["x"] + 0.35
-            end_x = next_step["x"] - 0.35
-            mid_x = (start_x + end_x) / 2
-            
-            fig.add_annotation(
-                x=end_x, y=next_y,
-                ax=start_x, ay=y_pos,
-                axref="x", ayref="y",
-                xref="x", yref="y",
-                arrowhead=2,
-                arrowsize=1.5,
-                arrowwidth=3,
-                arrowcolor="#333333"
-            )
-
-# Add legend for decision points
-fig.add_shape(
-    type="path", 
-    path="M 15.2 -0.7 L 15.4 -0.5 L 15.2 -0.3 L 15 -0.5 Z",
-    fillcolor="#999999",
-    opacity=0.8,
-    line=dict(color="white", width=2)
-)
-
-fig.add_annotation(
-    x=15.8, y=-0.5,
-    text="Decision Point",
-    showarrow=False,
-    font=dict(size=10, color="black"),
-    xanchor="left"
-)
-
-# Configure layout for better presentation
-fig.update_layout(
-    title=dict(
-        text="Adhyayan Platform User Flows",
-        font=dict(size=18, color="black", family="Arial Bold"),
-        x=0.5,
-        xanchor="center"
-    ),
-    xaxis=dict(
-        showgrid=False,
-        showticklabels=False,
-        range=[-1.5, 16.5],
-        fixedrange=True
-    ),
-    yaxis=dict(
-        showgrid=False,
-        showticklabels=False,
-        range=[-1, 5.2],
-        fixedrange=True
-    ),
-    showlegend=False,
-    plot_bgcolor="white",
-    paper_bgcolor="white"
-)
-
-# Save the chart
-fig.write_image("user_flow_diagram.png")
-fig.write_image("user_flow_diagram.svg", format="svg")
-
-fig.show()
\ No newline at end of file
+        ),
+        xaxis=dict(
+            showgrid=False,
+            showticklabels=False,
+            range=[-1.5, x_max+0.5],
+            fixedrange=True
+        ),
+        yaxis=dict(
+            showgrid=False,
+            showticklabels=False,
+            range=[-1, y_max],
+            fixedrange=True
+        ),
+        showlegend=False
+    ))
+
+    return fast_figure.finish(fig)
+
+
+def render_svg(swimlanes=swimlanes, flows=flows):
+    """Draw the same diagram as ``build_figure`` straight to an SVG string."""
+    x_max = max([16] + [step["x"] + 1 for flow in flows for step in flow["steps"]])
+    y_max = max(props["y_pos"] for props in swimlanes.values()) + 1.2
+    canvas = svg_render.SvgCanvas((-1.5, x_max + 0.5), (-1, y_max))
+    canvas.title("<b>Adhyayan Platform User Flows</b>", size=18, centered=True)
+
+    # Lane backgrounds first so boxes, arrows and labels draw over them
+    for role, props in swimlanes.items():
+        canvas.rect(-1, props["y_pos"] - 0.45, x_max, props["y_pos"] + 0.45,
+                    props["color"], stroke=props["color"], stroke_width=2, opacity=0.15)
+
+    labels = []
+    for flow in flows:
+        steps = flow["steps"]
+        for i, step in enumerate(steps):
+            x = step["x"]
+            y_pos = swimlanes[step["actor"]]["y_pos"]
+            color = swimlanes[step["actor"]]["color"]
+            if step.get("decision", False):
+                canvas.polygon([(x - 0.25, y_pos), (x, y_pos + 0.2), (x + 0.25, y_pos),
+                                (x, y_pos - 0.2)], color, stroke="white", stroke_width=3,
+                               opacity=0.9)
+            else:
+                canvas.rect(x - 0.35, y_pos - 0.18, x + 0.35, y_pos + 0.18, color,
+                            stroke="white", stroke_width=3, opacity=0.9)
+            labels.append((x, y_pos, step["text"]))
+
+            if i < len(steps) - 1:
+                next_step = steps[i + 1]
+                next_y = swimlanes[next_step["actor"]]["y_pos"]
+                canvas.arrow(x + 0.35, y_pos, next_step["x"] - 0.35, next_y)
+
+    for x, y, text in labels:
+        canvas.text(x, y, f"<b>{text}</b>", size=11, color="white")
+    for role, props in swimlanes.items():
+        canvas.text(-0.5, props["y_pos"], role, size=14, color=props["color"],
+                    family=chart_theme.HEADING_FONT, background="white",
+                    border=props["color"])
+    for flow in flows:
+        canvas.text(flow["title_x"], flow["title_y"], f"<b>{flow['name']}</b>",
+                    color="black", background="rgba(255,255,255,0.8)", border="black")
+
+    canvas.polygon([(x_max - 0.8, -0.7), (x_max - 0.6, -0.5), (x_max - 0.8, -0.3),
+                    (x_max - 1, -0.5)], "#999999", stroke="white", stroke_width=2,
+                   opacity=0.8)
+    canvas.text(x_max - 0.2, -0.5, "Decision Point", size=10, color="black", anchor="start")
+    return canvas.to_svg()
+
+
+def main(argv=None):
+    parser = chart_cli.make_parser()
+    parser.add_argument("--flows", help="JSON file of flows (and optional swimlanes) to draw")
+    chart_cli.add_renderer_option(parser)
+    args = parser.parse_args(argv)
+
+    with chart_profile.stage("load"):
+        inputs = load_flows(args.flows) if args.flows else (swimlanes, flows)
+    if args.renderer == "svg":
+        with chart_profile.stage("render svg"):
+            svg = render_svg(*inputs)
+        svg_render.export_svg(svg, OUTPUT_NAME,
+                              fallback=lambda: build_figure(*inputs, fast=True))
+        return
+    with chart_profile.stage("build"):
+        fig = build_figure(*inputs)
+    chart_profile.record_figure(fig, OUTPUT_NAME)
+    export_figure(fig, OUTPUT_NAME)
+    chart_cli.show(fig, args.headless)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,20 @@
-import plotly.graph_objects as go
-import numpy as np
+import sqlite3
+from pathlib import Path
+
+import chart_cli
+import chart_profile
+import chart_theme
+import fast_figure
+import svg_render
+from export_engine import export_figure
+
+OUTPUT_NAME = "erd_diagram"
+
+# Attribute lines that fit in an entity box
+MAX_ATTRIBUTES = 7
+
+# Entity types and colors for schemas introspected from SQLite
+SCHEMA_COLORS = {"Core": "#1FB8CD", "Dependent": "#2E8B57", "Junction": "#D2BA4C"}
 
 # Define entities with complete attributes and better positioning
 entities_data = {
@@ -156,135 +171,338 @@ relationships = [
     {"from": "Students", "to": "Mentorships", "cardinality": "1:M"}
 ]
 
-# Create the figure
-fig = go.Figure()
 
-# Add relationship lines
-entity_positions = {name: info["position"] for name, info in entities_data.items()}
+def _quote(name):
+    """Quote an SQL identifier, doubling any embedded double quotes."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def load_sqlite_schema(path):
+    """Introspect a SQLite database into (entities_data, relationships).
+
+    Tables become entities and foreign keys become relationships; entity
+    positions are left to ``force_layout``.
+    """
+    # as_uri() percent-encodes the path, so "?" or "#" in it stay literal
+    con = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        tables = [row[0] for row in con.execute(
+            "SELECT name FROM sqlite_master "
+            "WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name")]
+        # SQLite resolves REFERENCES targets case-insensitively
+        table_names = {table.lower(): table for table in tables}
+        entities = {}
+        relationships = []
+        for table in tables:
+            columns = con.execute(f"PRAGMA table_info({_quote(table)})").fetchall()
+            foreign_keys = con.execute(f"PRAGMA foreign_key_list({_quote(table)})").fetchall()
+            pk_columns = [col[1] for col in columns if col[5]]
+            fk_columns = {fk[3] for fk in foreign_keys}
+            referenced = {fk[2].lower() for fk in foreign_keys}
+
+            # Single-column unique keys turn a foreign key into a 1:1 link
+            unique = {pk_columns[0]} if len(pk_columns) == 1 else set()
+            for index in con.execute(f"PRAGMA index_list({_quote(table)})").fetchall():
+                index_columns = con.execute(f"PRAGMA index_info({_quote(index[1])})").fetchall()
+                if index[2] and len(index_columns) == 1:
+                    unique.add(index_columns[0][2])
+
+            attributes = []
+            for col in columns:
+                if col[5]:
+                    attributes.append(f"{col[1]} (PK)")
+                elif col[1] in fk_columns:
+                    attributes.append(f"{col[1]} (FK)")
+                else:
+                    attributes.append(col[1])
+
+            # A junction links two or more different tables
+            kind = ("Junction" if len(referenced) > 1 else
+                    "Dependent" if referenced else "Core")
+            entities[table] = {"type": kind, "color": SCHEMA_COLORS[kind],
+                               "attributes": attributes}
+
+            for fk in foreign_keys:
+                # Composite keys list one row per column; keep the first
+                if fk[1] != 0:
+                    continue
+                # Foreign keys to tables missing from the schema are dropped
+                if fk[2].lower() in table_names:
+                    relationships.append({"from": table_names[fk[2].lower()], "to": table,
+                                          "cardinality": "1:1" if fk[3] in unique else "1:M"})
+    finally:
+        con.close()
+
+    return entities, relationships
+
+
+def force_layout(names, relationships, iterations=50, spacing=2.4, seed=0):
+    """Fruchterman-Reingold layout vectorized over all entity pairs.
+
+    Returns a {name: (x, y)} dict with roughly ``spacing`` units between
+    neighbouring entities, shifted so every coordinate is at least 1.
+    """
+    import numpy as np
+
+    n = len(names)
+    if n == 0:
+        return {}
+    index = {name: i for i, name in enumerate(names)}
+    edges = np.array([(index[rel["from"]], index[rel["to"]]) for rel in relationships],
+                     dtype=np.intp).reshape(-1, 2)
+
+    # Start from a jittered grid so the result stays compact and repeatable
+    rng = np.random.default_rng(seed)
+    side = int(np.ceil(np.sqrt(n)))
+    grid = np.arange(n)
+    pos = np.column_stack([grid % side, grid // side]).astype(float) * spacing
+    pos += rng.uniform(-0.1, 0.1, size=pos.shape) * spacing
+
+    # Per-axis float32 work arrays keep the n x n temporaries small
+    pos = pos.astype(np.float32)
+    k2 = np.float32(spacing * spacing)
+    temperature = spacing * side / 4
+    for _ in range(iterations):
+        dx = pos[:, 0, None] - pos[None, :, 0]
+        dy = pos[:, 1, None] - pos[None, :, 1]
+        dist2 = dx * dx + dy * dy
+        np.fill_diagonal(dist2, np.inf)
+        np.maximum(dist2, 1e-4, out=dist2)
+
+        # Repulsion between every pair (k^2 / d along the unit vector)
+        scale = np.divide(k2, dist2, out=dist2)
+        disp = np.column_stack([(dx * scale).sum(axis=1), (dy * scale).sum(axis=1)])
+
+        # Attraction along foreign keys (d^2 / k along the unit vector)
+        if len(edges):
+            edge_delta = pos[edges[:, 0]] - pos[edges[:, 1]]
+            edge_dist = np.sqrt((edge_delta ** 2).sum(axis=1))
+            pull = edge_delta * (edge_dist / spacing)[:, None]
+            np.add.at(disp, edges[:, 0], -pull)
+            np.add.at(disp, edges[:, 1], pull)
+
+        length = np.maximum(np.sqrt((disp ** 2).sum(axis=1)), 1e-2)
+        pos += disp * (np.minimum(length, temperature) / length)[:, None]
+        temperature *= 0.93
+
+    pos -= pos.min(axis=0) - 1
+    return {name: (float(x), float(y)) for name, (x, y) in zip(names, pos)}
+
+
+def attribute_text(attributes):
+    """Format an entity's attributes: PKs bold, FKs italic, one per line."""
+    attrs_formatted = []
+    for attr in attributes[:MAX_ATTRIBUTES]:
+        if "(PK)" in attr:
+            attrs_formatted.append(f"<b>{attr}</b>")
+        elif "(FK)" in attr:
+            attrs_formatted.append(f"<i>{attr}</i>")
+        else:
+            attrs_formatted.append(attr)
+    if len(attributes) > MAX_ATTRIBUTES:
+        attrs_formatted.append(f"... +{len(attributes) - MAX_ATTRIBUTES} more")
+    return "<br>".join(attrs_formatted)
+
+
+def build_figure(entities_data=entities_data, relationships=relationships, fast=False):
+    go = fast_figure.objects(fast)
+    chart_theme.register()
+
+    # Add relationship lines
+    entity_positions = {name: info["position"] for name, info in entities_data.items()}
+
+    # All relationship lines share one None-separated trace and all
+    # cardinality labels one text trace
+    line_x = []
+    line_y = []
+    label_x = []
+    label_y = []
+    label_text = []
+    for rel in relationships:
+        from_pos = entity_positions[rel["from"]]
+        to_pos = entity_positions[rel["to"]]
+        line_x += [from_pos[0], to_pos[0], None]
+        line_y += [from_pos[1], to_pos[1], None]
 
-for rel in relationships:
-    from_pos = entity_positions[rel["from"]]
-    to_pos = entity_positions[rel["to"]]
-    
-    # Add relationship line
+        # Add cardinality label
+        label_x.append((from_pos[0] + to_pos[0]) / 2)
+        label_y.append((from_pos[1] + to_pos[1]) / 2)
+        label_text.append(rel["cardinality"])
+
+    # Add entity boxes with attributes
+    box_width = 1.6
+    box_height = 1.2
+
+    shapes = []
+    headers = {}
+    attrs_x = []
+    attrs_y = []
+    attrs_texts = []
+    for entity_name, entity_info in entities_data.items():
+        x, y = entity_info["position"]
+        color = entity_info["color"]
+
+        # Add entity box background
+        shapes.append(dict(
+            type="rect",
+            x0=x - box_width/2, y0=y - box_height/2,
+            x1=x + box_width/2, y1=y + box_height/2,
+            fillcolor=color,
+            line=dict(color="black", width=2)
+        ))
+
+        # Entity name headers are grouped per type for the legend
+        header = headers.setdefault(entity_info["type"], ([], [], []))
+        header[0].append(x)
+        header[1].append(y + 0.35)
+        header[2].append(f"<b>{entity_name}</b>")
+
+        attrs_x.append(x)
+        attrs_y.append(y - 0.1)
+        attrs_texts.append(attribute_text(entity_info["attributes"]))
+
+    fig = go.Figure()
     fig.add_trace(go.Scatter(
-        x=[from_pos[0], to_pos[0]],
-        y=[from_pos[1], to_pos[1]],
+        x=line_x,
+        y=line_y,
         mode='lines',
         line=dict(color='#333333', width=2),
         showlegend=False,
         hoverinfo='skip'
     ))
-    
-    # Add cardinality label
-    mid_x = (from_pos[0] + to_pos[0]) / 2
-    mid_y = (from_pos[1] + to_pos[1]) / 2
-    
     fig.add_trace(go.Scatter(
-        x=[mid_x],
-        y=[mid_y],
+        x=label_x,
+        y=label_y,
         mode='text',
-        text=rel["cardinality"],
-        textfont=dict(size=14, color='black', family='Arial Black'),
+        text=label_text,
+        textfont=dict(size=14, color='black', family=chart_theme.HEADING_FONT),
         textposition="middle center",
         showlegend=False,
         hoverinfo='skip'
     ))
-
-# Add entity boxes with attributes
-box_width = 1.6
-box_height = 1.2
-
-for entity_name, entity_info in entities_data.items():
-    x, y = entity_info["position"]
-    color = entity_info["color"]
-    
-    # Add entity box background
-    fig.add_shape(
-        type="rect",
-        x0=x - box_width/2, y0=y - box_height/2,
-        x1=x + box_width/2, y1=y + box_height/2,
-        fillcolor=color,
-        line=dict(color="black", width=2)
-    )
-    
-    # Add entity name header
+    for entity_type, (header_x, header_y, header_text) in headers.items():
+        fig.add_trace(go.Scatter(
+            x=header_x,
+            y=header_y,
+            mode='text',
+            text=header_text,
+            textfont=dict(size=16, color='white', family=chart_theme.HEADING_FONT),
+            textposition="middle center",
+            name=entity_type,
+            showlegend=True,
+            hoverinfo='skip'
+        ))
     fig.add_trace(go.Scatter(
-        x=[x],
-        y=[y + 0.35],
+        x=attrs_x,
+        y=attrs_y,
         mode='text',
-        text=f"<b>{entity_name}</b>",
-        textfont=dict(size=16, color='white', family='Arial Black'),
-        textposition="middle center",
-        name=entity_info["type"],
-        showlegend=True,
-        hoverinfo='skip'
-    ))
-    
-    # Create attributes text with proper formatting
-    attrs_formatted = []
-    for attr in entity_info["attributes"]:
-        if "(PK)" in attr:
-            attrs_formatted.append(f"<b>{attr}</b>")
-        elif "(FK)" in attr:
-            attrs_formatted.append(f"<i>{attr}</i>")
-        else:
-            attrs_formatted.append(attr)
-    
-    # Split attributes into two columns for better fit
-    attrs_text = "<br>".join(attrs_formatted)
-    
-    fig.add_trace(go.Scatter(
-        x=[x],
-        y=[y - 0.1],
-        mode='text',
-        text=attrs_text,
+        text=attrs_texts,
         textfont=dict(size=10, color='white'),
         textposition="middle center",
         showlegend=False,
         hoverinfo='skip'
     ))
 
-# Remove duplicate legend entries
-legend_names = []
-for trace in fig.data:
-    if hasattr(trace, 'name') and trace.name and trace.showlegend:
-        if trace.name in legend_names:
-            trace.showlegend = False
-        else:
-            legend_names.append(trace.name)
-
-# Update layout
-fig.update_layout(
-    title="Adhyayan Sathi Platform ERD",
-    xaxis=dict(
-        range=[0, 8],
-        showgrid=False, 
-        zeroline=False, 
-        showticklabels=False
-    ),
-    yaxis=dict(
-        range=[0.5, 9],
-        showgrid=False, 
-        zeroline=False, 
-        showticklabels=False
-    ),
-    plot_bgcolor='white',
-    paper_bgcolor='white',
-    legend=dict(
-        orientation='h',
-        yanchor='bottom',
-        y=1.02,
-        xanchor='center',
-        x=0.5,
-        title="Entity Types"
+    xs = [pos[0] for pos in entity_positions.values()]
+    ys = [pos[1] for pos in entity_positions.values()]
+
+    # Update layout
+    fig.update_layout(
+        title="Adhyayan Sathi Platform ERD",
+        shapes=shapes,
+        xaxis=dict(
+            range=[min(xs) - 1, max(xs) + 1],
+            showgrid=False, 
+            zeroline=False, 
+            showticklabels=False
+        ),
+        yaxis=dict(
+            range=[min(ys) - 1.5, max(ys) + 1],
+            showgrid=False, 
+            zeroline=False, 
+            showticklabels=False
+        ),
+        legend=dict(y=1.02, title="Entity Types")
     )
-)
 
-fig.update_traces(cliponaxis=False)
+    fig.update_traces(cliponaxis=False)
+
+    return fast_figure.finish(fig)
+
+
+def render_svg(entities_data=entities_data, relationships=relationships,
+               title=None):
+    """Draw the same diagram as ``build_figure`` straight to an SVG string."""
+    positions = {name: info["position"] for name, info in entities_data.items()}
+    xs = [pos[0] for pos in positions.values()]
+    ys = [pos[1] for pos in positions.values()]
+    canvas = svg_render.SvgCanvas((min(xs) - 1, max(xs) + 1), (min(ys) - 1.5, max(ys) + 1))
+    canvas.title(title or "Adhyayan Sathi Platform ERD")
+
+    canvas.lines([(*positions[rel["from"]], *positions[rel["to"]]) for rel in relationships],
+                 "#333333", 2)
+
+    box_width = 1.6
+    box_height = 1.2
+    legend = {}
+    for entity_name, entity_info in entities_data.items():
+        x, y = entity_info["position"]
+        legend.setdefault(entity_info["type"], entity_info["color"])
+        canvas.rect(x - box_width/2, y - box_height/2, x + box_width/2, y + box_height/2,
+                    entity_info["color"], stroke="black", stroke_width=2)
+        canvas.text(x, y + 0.35, f"<b>{entity_name}</b>", size=16, color="white",
+                    family=chart_theme.HEADING_FONT)
+        canvas.text(x, y - 0.1, attribute_text(entity_info["attributes"]), size=10,
+                    color="white")
+
+    # Cardinality labels sit on the line midpoints, above the boxes
+    for rel in relationships:
+        (x0, y0), (x1, y1) = positions[rel["from"]], positions[rel["to"]]
+        canvas.text((x0 + x1) / 2, (y0 + y1) / 2, rel["cardinality"], size=14,
+                    color="black", family=chart_theme.HEADING_FONT)
+    canvas.legend(list(legend.items()))
+    return canvas.to_svg()
+
+
+def main(argv=None):
+    parser = chart_cli.make_parser()
+    parser.add_argument("--sqlite", help="build the ERD from this SQLite database's schema")
+    chart_cli.add_renderer_option(parser)
+    args = parser.parse_args(argv)
+
+    entities, rels, title = entities_data, relationships, None
+    if args.sqlite:
+        with chart_profile.stage("load"):
+            entities, rels = load_sqlite_schema(args.sqlite)
+        if not entities:
+            parser.error(f"{args.sqlite} has no tables to draw")
+        with chart_profile.stage("layout", tables=len(entities)):
+            positions = force_layout(list(entities), rels)
+        for name, info in entities.items():
+            info["position"] = positions[name]
+        title = f"{Path(args.sqlite).stem} Schema ERD"
+
+    if args.renderer == "svg":
+        with chart_profile.stage("render svg"):
+            svg = render_svg(entities, rels, title)
+
+        def fallback():
+            fig = build_figure(entities, rels, fast=True)
+            if title:
+                fig.update_layout(title=title)
+            return fig
+
+        svg_render.export_svg(svg, OUTPUT_NAME, fallback=fallback)
+        return
+
+    with chart_profile.stage("build"):
+        fig = build_figure(entities, rels)
+        if title:
+            fig.update_layout(title=title)
+    chart_profile.record_figure(fig, OUTPUT_NAME)
+    export_figure(fig, OUTPUT_NAME)
+    chart_cli.show(fig, args.headless)
 
-# Save the chart
-fig.write_image("erd_diagram.png")
-fig.write_image("erd_diagram.svg", format="svg")
 
-fig.show()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,13 @@
-import plotly.graph_objects as go
-import pandas as pd
+import json
+from pathlib import Path
+
+import chart_cli
+import chart_profile
+import chart_theme
+import fast_figure
+from export_engine import export_figure
+
+OUTPUT_NAME = "wireframe_structure"
 
 # Parse the wireframe data
 data = {
@@ -45,14 +53,6 @@ data = {
 
 # Prepare data for stacked horizontal bar chart
 chart_data = []
-colors = ['#1FB8CD', '#DB4545', '#2E8B57', '#5D878F']
-section_colors = {
-    'header': '#1FB8CD',
-    'sidebar': '#DB4545', 
-    'main_content': '#2E8B57',
-    'footer': '#5D878F'
-}
-
 # Create traces for each section type
 section_types = ['header', 'sidebar', 'main_content', 'footer']
 section_names = {
@@ -62,93 +62,128 @@ section_names = {
     'footer': 'Footer'
 }
 
-dashboards = []
-header_counts = []
-sidebar_counts = []
-main_counts = []
-footer_counts = []
-
-for wireframe in data["wireframes"]:
-    dashboard_name = wireframe["name"].replace(" Dashboard", "")
-    dashboards.append(dashboard_name)
-    
-    # Initialize counts
-    h_count = s_count = m_count = f_count = 0
-    
+# Keys that hold a section's items
+ITEM_KEYS = ('elements', 'widgets')
+
+# Per-file parsed counts for --spec-dir, keyed by path, mtime and size
+SPEC_CACHE = Path('.chart_cache') / 'wireframe_counts.json'
+
+
+def section_counts(wireframe):
+    """Count the items in each section type of one wireframe."""
+    counts = dict.fromkeys(section_types, 0)
     for section in wireframe["sections"]:
-        section_key = list(section.keys())[0]
-        elements_key = list(section.keys())[1]
-        element_count = len(section[elements_key])
-        
-        if section_key == 'header':
-            h_count = element_count
-        elif section_key == 'sidebar':
-            s_count = element_count
-        elif section_key == 'main_content':
-            m_count = element_count
-        elif section_key == 'footer':
-            f_count = element_count
-    
-    header_counts.append(h_count)
-    sidebar_counts.append(s_count)
-    main_counts.append(m_count)
-    footer_counts.append(f_count)
-
-# Create the stacked horizontal bar chart
-fig = go.Figure()
-
-# Add traces for each section type
-fig.add_trace(go.Bar(
-    name='Header',
-    y=dashboards,
-    x=header_counts,
-    orientation='h',
-    marker_color='#1FB8CD',
-    hovertemplate='%{y}<br>Header: %{x} items<extra></extra>'
-))
-
-fig.add_trace(go.Bar(
-    name='Sidebar',
-    y=dashboards,
-    x=sidebar_counts,
-    orientation='h',
-    marker_color='#DB4545',
-    hovertemplate='%{y}<br>Sidebar: %{x} items<extra></extra>'
-))
-
-fig.add_trace(go.Bar(
-    name='Main Content',
-    y=dashboards,
-    x=main_counts,
-    orientation='h',
-    marker_color='#2E8B57',
-    hovertemplate='%{y}<br>Main Content: %{x} items<extra></extra>'
-))
-
-fig.add_trace(go.Bar(
-    name='Footer',
-    y=dashboards,
-    x=footer_counts,
-    orientation='h',
-    marker_color='#5D878F',
-    hovertemplate='%{y}<br>Footer: %{x} items<extra></extra>'
-))
-
-# Update layout
-fig.update_layout(
-    barmode='stack',
-    title='Adhyayan Sathi UI Components by Section',
-    xaxis_title='Component Count',
-    yaxis_title='Dashboard Type',
-    legend=dict(orientation='h', yanchor='bottom', y=1.05, xanchor='center', x=0.5)
-)
-
-# Update axes
-fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
-fig.update_yaxes(showgrid=False)
-
-# Save the chart
-fig.write_image("wireframe_structure.png")
-fig.write_image("wireframe_structure.svg", format="svg")
-
-fig.show()
\ No newline at end of file
+        section_key = next((key for key in section if key in counts), None)
+        items_key = next((key for key in ITEM_KEYS if key in section), None)
+        if section_key and items_key:
+            counts[section_key] += len(section[items_key])
+    return counts
+
+
+def parse_spec(path):
+    """Parse one dashboard spec file into [(dashboard name, counts)] pairs.
+
+    A spec holds either a single wireframe or a {"wireframes": [...]} list.
+    """
+    with open(path) as f:
+        spec = json.load(f)
+    wireframes = spec.get("wireframes", [spec])
+    return [(wireframe["name"], section_counts(wireframe)) for wireframe in wireframes]
+
+
+def scan_spec_dir(spec_dir, cache_path=SPEC_CACHE):
+    """Return per-dashboard counts for every *.json spec in ``spec_dir``.
+
+    Parsed counts are cached per file, keyed by mtime and size, so only
+    new or changed specs are parsed again. Returns (counts, parsed files).
+    """
+    cache_path = Path(cache_path)
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (FileNotFoundError, ValueError):
+        cache = {}
+
+    fresh = {}
+    parsed = 0
+    for path in sorted(Path(spec_dir).glob("*.json")):
+        stat = path.stat()
+        key = str(path.resolve())
+        entry = cache.get(key)
+        if not entry or entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                     "wireframes": parse_spec(path)}
+            parsed += 1
+        fresh[key] = entry
+
+    # Entries for other spec directories are kept; deleted files are dropped
+    spec_root = str(Path(spec_dir).resolve())
+    kept = {key: entry for key, entry in cache.items()
+            if Path(key).parent != Path(spec_root)}
+    kept.update(fresh)
+    if parsed or len(kept) != len(cache):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump(kept, f)
+
+    counts = [tuple(pair) for entry in fresh.values() for pair in entry["wireframes"]]
+    return counts, parsed
+
+
+def build_figure(counts=None, fast=False):
+    go = fast_figure.objects(fast)
+    chart_theme.register()
+
+    if counts is None:
+        counts = [(wireframe["name"], section_counts(wireframe))
+                  for wireframe in data["wireframes"]]
+
+    dashboards = [name.replace(" Dashboard", "") for name, _ in counts]
+
+    # Create the stacked horizontal bar chart
+    fig = go.Figure()
+
+    # Add traces for each section type; they take the brand colorway in order
+    for section_type in section_types:
+        fig.add_trace(go.Bar(
+            name=section_names[section_type],
+            y=dashboards,
+            x=[section[section_type] for _, section in counts],
+            orientation='h',
+            hovertemplate='%{y}<br>' + section_names[section_type] + ': %{x} items<extra></extra>'
+        ))
+
+    # Update layout
+    fig.update_layout(
+        barmode='stack',
+        title='Adhyayan Sathi UI Components by Section',
+        xaxis_title='Component Count',
+        yaxis_title='Dashboard Type'
+    )
+
+    # Update axes
+    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
+    fig.update_yaxes(showgrid=False)
+
+    return fast_figure.finish(fig)
+
+
+def main(argv=None):
+    parser = chart_cli.make_parser()
+    parser.add_argument('--spec-dir', help='directory of dashboard spec JSON files to chart')
+    args = parser.parse_args(argv)
+
+    counts = None
+    if args.spec_dir:
+        with chart_profile.stage("load"):
+            counts, parsed = scan_spec_dir(args.spec_dir)
+        print(f"{len(counts)} dashboards, {parsed} spec files re-parsed")
+    with chart_profile.stage("build"):
+        fig = build_figure(counts)
+    chart_profile.record_figure(fig, OUTPUT_NAME)
+    export_figure(fig, OUTPUT_NAME)
+    chart_cli.show(fig, args.headless)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,13 @@
-import plotly.express as px
-import pandas as pd
+import csv
+from array import array
+
+import chart_cli
+import chart_profile
+import chart_theme
+import fast_figure
+from export_engine import export_figure
+
+OUTPUT_NAME = "tech_stack_diagram"
 
 # Parse the technology stack data
 tech_data = {
@@ -42,103 +50,169 @@ tech_data = {
     }
 }
 
-# Flatten the data for treemap
-treemap_data = []
-
-for category, subcategories in tech_data["technology_stack"].items():
-    # Abbreviate category names to fit 15 char limit
-    category_short = {
-        "frontend": "Frontend",
-        "backend": "Backend", 
-        "database": "Database",
-        "infrastructure": "Infrastructure",
-        "external_services": "Ext Services",
-        "dev_tools": "Dev Tools",
-        "monitoring": "Monitoring"
-    }.get(category, category)
-    
-    for subcat, technologies in subcategories.items():
-        # Abbreviate subcategory names
-        subcat_short = {
-            "web": "Web",
-            "mobile": "Mobile",
-            "tools": "Tools",
-            "runtime": "Runtime",
-            "apis": "APIs", 
-            "authentication": "Auth",
-            "primary": "Primary DB",
-            "cache": "Cache",
-            "search": "Search",
-            "cloud": "Cloud",
-            "containers": "Containers",
-            "cdn": "CDN",
-            "communication": "Communication",
-            "payments": "Payments",
-            "file_storage": "File Storage",
-            "version_control": "Version Ctrl",
-            "ci_cd": "CI/CD",
-            "testing": "Testing",
-            "logging": "Logging",
-            "monitoring": "Monitoring",
-            "security": "Security"
-        }.get(subcat, subcat)
-        
-        for tech in technologies:
-            # Abbreviate technology names to fit 15 char limit
-            tech_short = tech
-            if len(tech) > 15:
-                tech_short = {
-                    "Material-UI": "Material-UI",
-                    "React Native": "React Native",
-                    "Express.js": "Express.js",
-                    "RESTful APIs": "REST APIs",
-                    "OAuth 2.0": "OAuth 2.0",
-                    "Passport.js": "Passport.js",
-                    "PostgreSQL": "PostgreSQL",
-                    "Memcached": "Memcached",
-                    "Elasticsearch": "Elasticsearch",
-                    "Google Cloud": "Google Cloud",
-                    "Kubernetes": "Kubernetes",
-                    "CloudFlare": "CloudFlare",
-                    "AWS CloudFront": "CloudFront",
-                    "Google Drive API": "Drive API",
-                    "GitHub Actions": "GH Actions",
-                    "New Relic": "New Relic",
-                    "Rate Limiting": "Rate Limit",
-                    "SSL/TLS": "SSL/TLS"
-                }.get(tech, tech[:15])
-            
-            treemap_data.append({
-                "Layer": category_short,
-                "Category": subcat_short,
-                "Technology": tech_short,
-                "Value": 1
-            })
-
-# Create DataFrame
-df = pd.DataFrame(treemap_data)
-
-# Create treemap
-fig = px.treemap(
-    df,
-    path=['Layer', 'Category', 'Technology'],
-    values='Value',
-    title="Adhyayan Sathi Tech Stack Architecture",
-    color_discrete_sequence=[
-        '#1FB8CD', '#DB4545', '#2E8B57', '#5D878F', '#D2BA4C',
-        '#B4413C', '#964325', '#944454', '#13343B', '#DB4545'
-    ]
-)
-
-# Update layout
-fig.update_layout(
-    font=dict(size=12),
-    uniformtext_minsize=10,
-    uniformtext_mode='hide'
-)
-
-# Save the charts
-fig.write_image("tech_stack_diagram.png")
-fig.write_image("tech_stack_diagram.svg", format="svg")
-
-fig.show()
\ No newline at end of file
+# Abbreviation tables, compiled once rather than per technology
+CATEGORY_SHORT = {
+    "frontend": "Frontend",
+    "backend": "Backend", 
+    "database": "Database",
+    "infrastructure": "Infrastructure",
+    "external_services": "Ext Services",
+    "dev_tools": "Dev Tools",
+    "monitoring": "Monitoring"
+}
+
+SUBCAT_SHORT = {
+    "web": "Web",
+    "mobile": "Mobile",
+    "tools": "Tools",
+    "runtime": "Runtime",
+    "apis": "APIs", 
+    "authentication": "Auth",
+    "primary": "Primary DB",
+    "cache": "Cache",
+    "search": "Search",
+    "cloud": "Cloud",
+    "containers": "Containers",
+    "cdn": "CDN",
+    "communication": "Communication",
+    "payments": "Payments",
+    "file_storage": "File Storage",
+    "version_control": "Version Ctrl",
+    "ci_cd": "CI/CD",
+    "testing": "Testing",
+    "logging": "Logging",
+    "monitoring": "Monitoring",
+    "security": "Security"
+}
+
+TECH_SHORT = {
+    "Material-UI": "Material-UI",
+    "React Native": "React Native",
+    "Express.js": "Express.js",
+    "RESTful APIs": "REST APIs",
+    "OAuth 2.0": "OAuth 2.0",
+    "Passport.js": "Passport.js",
+    "PostgreSQL": "PostgreSQL",
+    "Memcached": "Memcached",
+    "Elasticsearch": "Elasticsearch",
+    "Google Cloud": "Google Cloud",
+    "Kubernetes": "Kubernetes",
+    "CloudFlare": "CloudFlare",
+    "AWS CloudFront": "CloudFront",
+    "Google Drive API": "Drive API",
+    "GitHub Actions": "GH Actions",
+    "New Relic": "New Relic",
+    "Rate Limiting": "Rate Limit",
+    "SSL/TLS": "SSL/TLS"
+}
+
+
+def iter_tech_data(tech_data=tech_data):
+    """Yield (layer, category, technology, value) rows from the nested dict."""
+    for category, subcategories in tech_data["technology_stack"].items():
+        for subcat, technologies in subcategories.items():
+            for tech in technologies:
+                yield category, subcat, tech, 1
+
+
+def read_inventory(path):
+    """Stream rows from an inventory CSV with layer,category,technology[,count]."""
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            yield row["layer"], row["category"], row["technology"], float(row.get("count") or 1)
+
+
+def abbreviate_tech(tech):
+    # Abbreviate technology names to fit 15 char limit
+    if len(tech) > 15:
+        return TECH_SHORT.get(tech, tech[:15])
+    return tech
+
+
+def aggregate(rows):
+    """Fold inventory rows into treemap (ids, labels, parents, values).
+
+    Leaves come first, then categories, then layers, which is the order
+    px.treemap produces and keeps the layer colors stable.
+    """
+    levels = ({}, {}, {})  # id -> [label, parent, value] per depth
+    leaf_ids = {}
+    for layer, category, tech, value in rows:
+        key = (layer, category, tech)
+        if key not in leaf_ids:
+            layer_label = CATEGORY_SHORT.get(layer, layer)
+            category_label = SUBCAT_SHORT.get(category, category)
+            tech_label = abbreviate_tech(tech)
+            # Ids use the full names so that technologies sharing a
+            # truncated label stay separate leaves
+            layer_id = layer
+            category_id = f"{layer}/{category}"
+            leaf_ids[key] = (layer_id, category_id, f"{category_id}/{tech}")
+            levels[0].setdefault(layer_id, [layer_label, "", 0])
+            levels[1].setdefault(category_id, [category_label, layer_id, 0])
+            levels[2].setdefault(leaf_ids[key][2], [tech_label, category_id, 0])
+        for depth, node_id in enumerate(leaf_ids[key]):
+            levels[depth][node_id][2] += value
+
+    ids = []
+    labels = []
+    parents = []
+    values = array("d")
+    for level in reversed(levels):
+        for node_id, (label, parent, value) in level.items():
+            ids.append(node_id)
+            labels.append(label)
+            parents.append(parent)
+            values.append(value)
+    return ids, labels, parents, values
+
+
+def build_figure(rows=None, fast=False):
+    import numpy as np
+    go = fast_figure.objects(fast)
+    chart_theme.register()
+
+    # Rows are streamed, so reading the inventory is timed as part of this
+    with chart_profile.stage("aggregate"):
+        ids, labels, parents, values = aggregate(iter_tech_data() if rows is None else rows)
+
+    # Create treemap
+    fig = go.Figure(go.Treemap(
+        ids=ids,
+        labels=labels,
+        parents=parents,
+        values=np.frombuffer(values, dtype=np.float64),
+        branchvalues="total",
+        name="",
+        hovertemplate="labels=%{label}<br>Value=%{value}<br>parent=%{parent}<br>id=%{id}<extra></extra>"
+    ))
+
+    # Update layout
+    fig.update_layout(
+        title="Adhyayan Sathi Tech Stack Architecture",
+        uniformtext_minsize=10,
+        uniformtext_mode='hide'
+    )
+
+    return fast_figure.finish(fig)
+
+
+def main(argv=None):
+    parser = chart_cli.make_parser()
+    parser.add_argument("--inventory", help="CSV inventory (layer,category,technology[,count]) to stream")
+    chart_cli.add_report_option(parser)
+    args = parser.parse_args(argv)
+
+    rows = read_inventory(args.inventory) if args.inventory else iter_tech_data()
+    report = chart_profile.RowReport()
+    with chart_profile.stage("build"):
+        fig = build_figure(report.count(rows))
+    if args.report:
+        print(report.summary())
+    chart_profile.record_figure(fig, OUTPUT_NAME)
+    export_figure(fig, OUTPUT_NAME)
+    chart_cli.show(fig, args.headless)
+
+
+if __name__ == "__main__":
+    main()
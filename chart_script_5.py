@@ -1,6 +1,17 @@
-import plotly.graph_objects as go
-import numpy as np
-import pandas as pd
+import csv
+import json
+from pathlib import Path
+
+import chart_cli
+import chart_profile
+import chart_theme
+import fast_figure
+from export_engine import export_figure
+
+OUTPUT_NAME = "feature_matrix"
+
+# Above this many cells the matrix is drawn without per-cell text
+MAX_TEXT_CELLS = 2500
 
 # Parse the data
 data = {
@@ -68,48 +79,118 @@ feature_abbreviations = {
     "ERP Integration": "ERP Integr"
 }
 
-# Create matrix data
-user_roles = data["user_roles"]
-features = [feature_abbreviations[f["name"]] for f in data["features"]]
-access_text = []
-access_values = []
-
-for feature_data in data["features"]:
-    row_text = []
-    row_values = []
-    for role in user_roles:
-        access = feature_data["access"][role]
-        row_text.append(access)
-        row_values.append(access_mapping[access])
-    access_text.append(row_text)
-    access_values.append(row_values)
-
-# Create heatmap
-fig = go.Figure(data=go.Heatmap(
-    z=access_values,
-    x=user_roles,
-    y=features,
-    text=access_text,
-    texttemplate="%{text}",
-    textfont={"size": 10},
-    colorscale=[[0, colors[0]], [0.25, colors[1]], [0.5, colors[2]], [0.75, colors[3]], [1, colors[4]]],
-    showscale=False,
-    hoverongaps=False,
-    hovertemplate="<b>%{y}</b><br>%{x}: %{text}<extra></extra>"
-))
-
-# Update layout
-fig.update_layout(
-    title="Adhyayan Sathi Feature Access Matrix",
-    xaxis_title="User Roles",
-    yaxis_title="Features",
-    font=dict(size=12),
-)
-
-# Update axes
-fig.update_xaxes(side="bottom", tickangle=45)
-fig.update_yaxes(autorange="reversed")
-
-# Save the charts
-fig.write_image("feature_matrix.png")
-fig.write_image("feature_matrix.svg", format="svg")
\ No newline at end of file
+
+def load_policy(path):
+    """Read a policy in the shape of ``data`` from JSON, or from a CSV with
+    feature,role,access rows (roles missing for a feature get "No Access").
+    """
+    path = Path(path)
+    if path.suffix.lower() != ".csv":
+        with open(path) as f:
+            return json.load(f)
+
+    roles = {}
+    features = {}
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            roles.setdefault(row["role"], None)
+            features.setdefault(row["feature"], {})[row["role"]] = row["access"]
+    return {"user_roles": list(roles),
+            "features": [{"name": name, "access": access} for name, access in features.items()]}
+
+
+def encode_access(policy):
+    """Encode a policy as (levels, codes, labels).
+
+    ``codes`` is a features x roles uint8 matrix of access levels and
+    ``labels`` the matching uint16 indexes into ``levels`` (the distinct
+    access strings), both produced by one vectorized lookup.  A policy
+    without roles or features gives empty matrices.
+    """
+    import numpy as np
+
+    roles = policy["user_roles"]
+    features = policy["features"]
+    raw = np.array([[feature["access"].get(role, "No Access") for role in roles]
+                    for feature in features], dtype=object).reshape(len(features), len(roles))
+    levels, inverse = np.unique(raw.astype(str), return_inverse=True)
+
+    unknown = [level for level in levels if level not in access_mapping]
+    if unknown:
+        raise ValueError(f"unknown access levels: {', '.join(unknown)}")
+    lookup = np.array([access_mapping[level] for level in levels], dtype=np.uint8)
+
+    labels = inverse.reshape(raw.shape).astype(np.uint16)
+    return levels, lookup[labels], labels
+
+
+def build_figure(policy=data, max_text_cells=MAX_TEXT_CELLS, fast=False):
+    go = fast_figure.objects(fast)
+    chart_theme.register()
+
+    # Create matrix data
+    user_roles = policy["user_roles"]
+    features = [feature_abbreviations.get(f["name"], f["name"][:15]) for f in policy["features"]]
+    levels, access_values, label_idx = encode_access(policy)
+
+    colorscale = [[0, colors[0]], [0.25, colors[1]], [0.5, colors[2]], [0.75, colors[3]], [1, colors[4]]]
+    if access_values.size <= max_text_cells:
+        # Small matrices label every cell with its access string
+        cell_options = dict(
+            text=levels[label_idx],
+            texttemplate="%{text}",
+            textfont={"size": 10},
+            showscale=False,
+            hovertemplate="<b>%{y}</b><br>%{x}: %{text}<extra></extra>"
+        )
+    else:
+        # Large matrices drop per-cell text for a labelled color bar
+        cell_options = dict(
+            showscale=True,
+            colorbar=dict(tickvals=list(range(len(access_labels))), ticktext=access_labels),
+            hovertemplate="<b>%{y}</b><br>%{x}: level %{z}<extra></extra>"
+        )
+
+    # Create heatmap
+    fig = go.Figure(data=go.Heatmap(
+        z=access_values,
+        x=user_roles,
+        y=features,
+        zmin=0,
+        zmax=len(access_labels) - 1,
+        colorscale=colorscale,
+        hoverongaps=False,
+        **cell_options
+    ))
+
+    # Update layout
+    fig.update_layout(
+        title="Adhyayan Sathi Feature Access Matrix",
+        xaxis_title="User Roles",
+        yaxis_title="Features"
+    )
+
+    # Update axes
+    fig.update_xaxes(side="bottom", tickangle=45)
+    fig.update_yaxes(autorange="reversed")
+
+    return fast_figure.finish(fig)
+
+
+def main(argv=None):
+    parser = chart_cli.make_parser()
+    parser.add_argument("--policy", help="policy file (JSON like the built-in data, or feature,role,access CSV)")
+    parser.add_argument("--max-text-cells", type=int, default=MAX_TEXT_CELLS,
+                        help="drop per-cell text above this many cells")
+    args = parser.parse_args(argv)
+
+    with chart_profile.stage("load"):
+        policy = load_policy(args.policy) if args.policy else data
+    with chart_profile.stage("build"):
+        fig = build_figure(policy, args.max_text_cells)
+    chart_profile.record_figure(fig, OUTPUT_NAME)
+    export_figure(fig, OUTPUT_NAME)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,27 @@
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
+import csv
+from array import array
 from datetime import datetime, timedelta
 
+import chart_cli
+import chart_profile
+import chart_theme
+import fast_figure
+from export_engine import export_figure
+
+OUTPUT_NAME = "roadmap"
+
+# Bar colors per task type; unknown types cycle through PALETTE
+TYPE_COLORS = {
+    'Main Phase': '#1FB8CD',
+    'Frontend': '#DB4545',
+    'Backend': '#2E8B57', 
+    'Database': '#5D878F',
+    'Infrastructure': '#D2BA4C',
+    'Integration': '#B4413C',
+    'Ongoing': '#964325'
+}
+PALETTE = chart_theme.BRAND_COLORS
+
 # Create comprehensive timeline data with proper tracks
 timeline_data = []
 start_date = datetime(2024, 1, 1)
@@ -25,45 +44,7 @@ dev_tracks = [
     {'Task': 'Integration', 'Start': 22, 'Duration': 4, 'Team': 'Full-Stack', 'Resources': '2 people', 'Type': 'Integration'}
 ]
 
-# Combine all tasks
-all_tasks = phases + dev_tracks
-
-# Convert to DataFrame with proper date calculations
-df_data = []
-for task in all_tasks:
-    start_week = task['Start']
-    duration_weeks = task['Duration']
-    
-    df_data.append({
-        'Task': task['Task'],
-        'Start': start_date + timedelta(weeks=start_week),
-        'Finish': start_date + timedelta(weeks=start_week + duration_weeks),
-        'Team': task['Team'],
-        'Resources': task['Resources'],
-        'Duration': f"{duration_weeks}w" if duration_weeks < 20 else "Ongoing",
-        'Type': task['Type']
-    })
-
-df = pd.DataFrame(df_data)
-
-# Create Gantt chart
-fig = px.timeline(df, 
-                  x_start="Start", 
-                  x_end="Finish", 
-                  y="Task",
-                  color="Type",
-                  title="Adhyayan Sathi Dev Roadmap",
-                  color_discrete_map={
-                      'Main Phase': '#1FB8CD',
-                      'Frontend': '#DB4545',
-                      'Backend': '#2E8B57', 
-                      'Database': '#5D878F',
-                      'Infrastructure': '#D2BA4C',
-                      'Integration': '#B4413C',
-                      'Ongoing': '#964325'
-                  })
-
-# Add milestone markers as shapes
+# Milestone markers
 milestones = [
     {'week': 2, 'name': 'Requirements'},
     {'week': 8, 'name': 'Design Done'},
@@ -72,82 +53,173 @@ milestones = [
     {'week': 35, 'name': 'Go Live'}
 ]
 
-for milestone in milestones:
-    milestone_date = start_date + timedelta(weeks=milestone['week'])
-    fig.add_shape(
-        type="line",
-        x0=milestone_date,
-        x1=milestone_date,
-        y0=-0.5,
-        y1=len(df)-0.5,
-        line=dict(color='#13343B', width=2, dash='dot')
+
+def read_tasks(path):
+    """Stream task rows from a CSV with Task,Start,Duration,Team,Resources,Type.
+
+    Start and Duration are in weeks, as in the built-in phases.
+    """
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            row['Start'] = float(row['Start'])
+            row['Duration'] = float(row['Duration'])
+            yield row
+
+
+def read_milestones(path):
+    """Stream milestone rows from a CSV with week,name."""
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            yield {'week': float(row['week']), 'name': row['name']}
+
+
+def build_figure(tasks=phases + dev_tracks, milestones=milestones, start_date=start_date, fast=False):
+    import numpy as np
+    go = fast_figure.objects(fast)
+    chart_theme.register()
+
+    # Stream tasks once into compact per-type columns; the bars, their
+    # hover data and the duration labels are all built from these arrays
+    week_ms = 7 * 24 * 60 * 60 * 1000
+    columns = {}
+    all_names = []
+    all_starts = array('d')
+    label_names = []
+    label_mid = array('d')
+    label_text = []
+    # Tasks may be streamed from CSV, so reading them is timed here too
+    with chart_profile.stage("aggregate"):
+        for task in tasks:
+            start_week = task['Start']
+            duration_weeks = task['Duration']
+            duration = f"{duration_weeks:g}w" if duration_weeks < 20 else "Ongoing"
+
+            names, starts, lengths, custom = columns.setdefault(
+                task['Type'], ([], array('d'), array('d'), []))
+            names.append(task['Task'])
+            starts.append(start_week * week_ms)
+            lengths.append(duration_weeks * week_ms)
+            custom.append((duration, task['Team'], task['Resources']))
+
+            all_names.append(task['Task'])
+            all_starts.append(start_week)
+            if duration != 'Ongoing':
+                label_names.append(task['Task'])
+                label_mid.append((start_week + duration_weeks / 2) * week_ms)
+                label_text.append(duration)
+
+    origin = np.datetime64(start_date, 'ms')
+
+    def to_dates(offsets_ms):
+        return origin + np.frombuffer(offsets_ms, dtype=np.float64).astype('timedelta64[ms]')
+
+    # Create Gantt chart (the same bars px.timeline draws, one trace per type)
+    fig = go.Figure()
+    for i, (task_type, (names, starts, lengths, custom)) in enumerate(columns.items()):
+        fig.add_trace(go.Bar(
+            base=to_dates(starts),
+            x=np.frombuffer(lengths, dtype=np.float64),
+            y=names,
+            orientation='h',
+            name=task_type,
+            legendgroup=task_type,
+            marker_color=TYPE_COLORS.get(task_type, PALETTE[i % len(PALETTE)]),
+            customdata=custom,
+            hovertemplate='<b>%{y}</b><br>' +
+                          'Duration: %{customdata[0]}<br>' +
+                          'Team: %{customdata[1]}<br>' +
+                          'Resources: %{customdata[2]}<br>' +
+                          '<extra></extra>',
+            cliponaxis=False
+        ))
+
+    # Add duration labels on bars as a single text trace
+    fig.add_trace(go.Scatter(
+        x=to_dates(label_mid),
+        y=label_names,
+        mode='text',
+        text=label_text,
+        textfont=dict(size=10, color='white', family=chart_theme.HEADING_FONT),
+        showlegend=False,
+        hoverinfo='skip',
+        cliponaxis=False
+    ))
+
+    # Add milestone markers as one batch of shapes and labels
+    shapes = []
+    annotations = []
+    for milestone in milestones:
+        milestone_date = start_date + timedelta(weeks=milestone['week'])
+        shapes.append(dict(
+            type="line",
+            x0=milestone_date,
+            x1=milestone_date,
+            yref="paper",
+            y0=0,
+            y1=1,
+            line=dict(color=chart_theme.TEXT_DARK, width=2, dash='dot')
+        ))
+
+        # Add milestone labels at top
+        annotations.append(dict(
+            x=milestone_date,
+            yref="paper",
+            y=1,
+            yanchor="bottom",
+            text=milestone['name'],
+            font=dict(size=9, color=chart_theme.TEXT_DARK),
+            bgcolor='rgba(255,255,255,0.8)',
+            bordercolor=chart_theme.TEXT_DARK,
+            borderwidth=1
+        ))
+
+    # Earliest tasks at the top
+    order = np.argsort(np.frombuffer(all_starts, dtype=np.float64), kind='stable')[::-1]
+
+    # Update layout
+    fig.update_layout(
+        title="Adhyayan Sathi Dev Roadmap",
+        barmode='overlay',
+        shapes=shapes,
+        annotations=annotations,
+        xaxis_title="Timeline",
+        yaxis_title="Tasks & Tracks",
+        legend=dict(y=1.02),
+        yaxis={
+            'categoryorder': 'array', 
+            'categoryarray': [all_names[i] for i in order]
+        }
     )
-    
-    # Add milestone labels at top
-    fig.add_annotation(
-        x=milestone_date,
-        y=len(df)-0.3,
-        text=milestone['name'],
-        showarrow=False,
-        font=dict(size=9, color='#13343B'),
-        bgcolor='rgba(255,255,255,0.8)',
-        bordercolor='#13343B',
-        borderwidth=1
+
+    # Format x-axis 
+    fig.update_xaxes(
+        type='date',
+        dtick=14*24*60*60*1000,  # Bi-weekly ticks
+        tickformat='Week %V',
+        tickangle=0
     )
 
-# Update layout
-fig.update_layout(
-    xaxis_title="Timeline",
-    yaxis_title="Tasks & Tracks",
-    legend=dict(
-        orientation='h',
-        yanchor='bottom',
-        y=1.02,
-        xanchor='center',
-        x=0.5
-    ),
-    yaxis={
-        'categoryorder': 'array', 
-        'categoryarray': ['Post-Launch', 'Deployment', 'Testing & QA', 
-                         'Integration', 'Infra Setup', 'Database Dev',
-                         'Backend Dev', 'Frontend Dev', 'Design', 
-                         'Planning']
-    }
-)
-
-# Update traces with better hover info
-fig.update_traces(
-    cliponaxis=False,
-    hovertemplate='<b>%{y}</b><br>' +
-                  'Duration: %{customdata[0]}<br>' +
-                  'Team: %{customdata[1]}<br>' +
-                  'Resources: %{customdata[2]}<br>' +
-                  '<extra></extra>',
-    customdata=df[['Duration', 'Team', 'Resources']].values
-)
-
-# Add duration labels on bars
-for i, row in df.iterrows():
-    duration_text = row['Duration']
-    if duration_text != 'Ongoing':
-        fig.add_annotation(
-            x=row['Start'] + (row['Finish'] - row['Start'])/2,
-            y=i,
-            text=duration_text,
-            showarrow=False,
-            font=dict(size=10, color='white', family='Arial Black'),
-            bgcolor='rgba(0,0,0,0.6)'
-        )
+    return fast_figure.finish(fig)
 
-# Format x-axis 
-fig.update_xaxes(
-    dtick=14*24*60*60*1000,  # Bi-weekly ticks
-    tickformat='Week %V',
-    tickangle=0
-)
 
-# Save the chart
-fig.write_image("roadmap.png")
-fig.write_image("roadmap.svg", format="svg")
+def main(argv=None):
+    parser = chart_cli.make_parser()
+    parser.add_argument('--tasks', help='CSV of tasks to stream instead of the built-in plan')
+    parser.add_argument('--milestones', help='CSV of milestones (week,name)')
+    parser.add_argument('--start-date', type=datetime.fromisoformat, default=start_date,
+                        help='date of week 0 (YYYY-MM-DD)')
+    args = parser.parse_args(argv)
+
+    with chart_profile.stage("build"):
+        fig = build_figure(
+            read_tasks(args.tasks) if args.tasks else phases + dev_tracks,
+            read_milestones(args.milestones) if args.milestones else milestones,
+            args.start_date,
+        )
+    chart_profile.record_figure(fig, OUTPUT_NAME)
+    export_figure(fig, OUTPUT_NAME)
+    chart_cli.show(fig, args.headless)
+
 
-fig.show()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
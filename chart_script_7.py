@@ -1,6 +1,14 @@
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
+import csv
+import json
+from pathlib import Path
+
+import chart_cli
+import chart_profile
+import chart_theme
+import fast_figure
+from export_engine import export_figure
+
+OUTPUT_NAME = "security_architecture"
 
 # Security architecture data
 security_data = {
@@ -43,7 +51,7 @@ component_counts = []
 colors_list = []
 
 # Brand colors
-brand_colors = ["#1FB8CD", "#DB4545", "#2E8B57", "#5D878F", "#D2BA4C", "#B4413C", "#964325"]
+brand_colors = chart_theme.BRAND_COLORS
 
 # Layer name mappings (abbreviated to fit 15 char limit)
 layer_names = {
@@ -94,64 +102,121 @@ component_abbrevs = {
     "Regular Security Audits": "Sec Audits"
 }
 
-# Create data for each component across layers
-fig = go.Figure()
-
-color_idx = 0
 layer_order = ["perimeter_security", "authentication_layer", "authorization_layer", 
                "application_security", "data_protection", "infrastructure_security", 
                "monitoring_compliance"]
 
-y_positions = []
-layer_labels = []
-
-for i, layer_key in enumerate(layer_order):
-    layer_data = security_data["security_layers"][layer_key]
-    layer_name = layer_names[layer_key]
-    layer_labels.append(layer_name)
-    y_positions.append(i)
-    
-    # Add components as separate bars for this layer
-    x_offset = 0
-    for j, component in enumerate(layer_data["components"]):
-        component_abbrev = component_abbrevs.get(component, component[:14])
-        
+
+def default_layers():
+    """The built-in catalogue as (layer_key, components) pairs."""
+    return [(key, security_data["security_layers"][key]["components"]) for key in layer_order]
+
+
+def load_controls(path):
+    """Read (layer_key, components) pairs from a JSON file shaped like
+    ``security_data`` or from a CSV with layer,control rows."""
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        layers = {}
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                layers.setdefault(row["layer"], []).append(row["control"])
+        return list(layers.items())
+    with open(path) as f:
+        data = json.load(f)
+    return [(key, layer["components"]) for key, layer in data["security_layers"].items()]
+
+
+def build_figure(layers=None, trace_mode="layer", fast=False):
+    """Draw every control as a unit bar in its layer's row.
+
+    ``trace_mode`` is "layer" for one trace per layer or "single" for one
+    trace overall; either way bar colors, text and offsets are arrays.
+    """
+    go = fast_figure.objects(fast)
+    chart_theme.register()
+
+    if layers is None:
+        layers = default_layers()
+
+    traces = {}
+    color_idx = 0
+    y_positions = []
+    layer_labels = []
+
+    for i, (layer_key, layer_components) in enumerate(layers):
+        layer_name = layer_names.get(layer_key, layer_key[:15])
+        layer_labels.append(layer_name)
+        y_positions.append(i)
+        # An empty layer keeps its labelled row but adds no bars
+        if not layer_components:
+            continue
+
+        # Components sit side by side along the row
+        bars = traces.setdefault(i if trace_mode == "layer" else 0,
+                                 {"base": [], "y": [], "color": [], "text": [], "layer": []})
+        for j, component in enumerate(layer_components):
+            bars["base"].append(j)
+            bars["y"].append(i)
+            bars["color"].append(brand_colors[color_idx % len(brand_colors)])
+            bars["text"].append(component_abbrevs.get(component, component[:14]))
+            bars["layer"].append(layer_name)
+            color_idx += 1
+
+    # Create one bar trace per group
+    fig = go.Figure()
+    for bars in traces.values():
+        if trace_mode == "layer":
+            hover = dict(hovertemplate=f'<b>%{{text}}</b><br>Layer: {bars["layer"][0]}<extra></extra>')
+        else:
+            hover = dict(customdata=bars["layer"],
+                         hovertemplate='<b>%{text}</b><br>Layer: %{customdata}<extra></extra>')
         fig.add_trace(go.Bar(
-            x=[1],
-            y=[i],
+            x=[1] * len(bars["base"]),
+            y=bars["y"],
+            base=bars["base"],
             orientation='h',
-            name=component_abbrev,
-            marker_color=brand_colors[color_idx % len(brand_colors)],
-            text=component_abbrev,
+            marker_color=bars["color"],
+            text=bars["text"],
             textposition='inside',
-            textfont=dict(size=10),
-            hovertemplate=f'<b>{component_abbrev}</b><br>Layer: {layer_name}<extra></extra>',
-            offsetgroup=j,
-            base=x_offset,
-            showlegend=False
+            showlegend=False,
+            cliponaxis=False,
+            **hover
         ))
-        x_offset += 1
-        color_idx += 1
-
-# Update layout
-fig.update_layout(
-    title="Security Architecture Layers",
-    xaxis_title="Components",
-    yaxis_title="Security Layers",
-    barmode='stack',
-    yaxis=dict(
-        tickmode='array',
-        tickvals=y_positions,
-        ticktext=layer_labels
-    ),
-    xaxis=dict(showticklabels=False),
-    showlegend=False
-)
-
-fig.update_traces(cliponaxis=False)
-
-# Save as PNG and SVG
-fig.write_image("security_architecture.png")
-fig.write_image("security_architecture.svg", format="svg")
-
-fig.show()
\ No newline at end of file
+
+    # Update layout
+    fig.update_layout(
+        title="Security Architecture Layers",
+        xaxis_title="Components",
+        yaxis_title="Security Layers",
+        barmode='overlay',
+        yaxis=dict(
+            tickmode='array',
+            tickvals=y_positions,
+            ticktext=layer_labels
+        ),
+        xaxis=dict(showticklabels=False),
+        showlegend=False
+    )
+
+    return fast_figure.finish(fig)
+
+
+def main(argv=None):
+    parser = chart_cli.make_parser()
+    parser.add_argument("--controls", help="JSON or CSV (layer,control) control catalogue")
+    parser.add_argument("--trace-mode", choices=["layer", "single"], default="layer",
+                        help="one bar trace per layer, or a single trace overall")
+    args = parser.parse_args(argv)
+
+    with chart_profile.stage("load"):
+        layers = load_controls(args.controls) if args.controls else None
+    with chart_profile.stage("build"):
+        fig = build_figure(layers, args.trace_mode)
+    chart_profile.record_figure(fig, OUTPUT_NAME)
+    export_figure(fig, OUTPUT_NAME)
+    chart_cli.show(fig, args.headless)
+
+
+if __name__ == "__main__":
+    main()
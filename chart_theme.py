@@ -0,0 +1,66 @@
+"""Adhyayan Sathi brand template shared by every chart script.
+
+The palette, fonts, background, legend placement and annotation/shape
+defaults live in one plotly template, registered once per process and made
+the default, so figures carry the styling once in ``layout.template``
+instead of on every trace, shape and annotation.  Scripts call
+``register()`` at the top of ``build_figure`` and only set what differs
+from these defaults.
+"""
+import json
+
+BRAND_COLORS = ["#1FB8CD", "#DB4545", "#2E8B57", "#5D878F", "#D2BA4C", "#B4413C", "#964325"]
+# Treemap sectors get two extra darks before the palette repeats
+TREEMAP_COLORS = BRAND_COLORS + ["#944454", "#13343B", "#DB4545"]
+TEXT_DARK = "#13343B"
+HEADING_FONT = "Arial Black"
+
+TEMPLATE_NAME = "adhyayan"
+BASE_TEMPLATE = "plotly_white"
+
+TEMPLATE_LAYOUT = dict(
+    colorway=BRAND_COLORS,
+    treemapcolorway=TREEMAP_COLORS,
+    font=dict(size=12),
+    plot_bgcolor="white",
+    paper_bgcolor="white",
+    legend=dict(orientation="h", yanchor="bottom", y=1.05, xanchor="center", x=0.5),
+    # Labels sit centred on their point; arrows are opted into per annotation
+    annotationdefaults=dict(showarrow=False, xanchor="center", arrowhead=2,
+                            arrowsize=1.5, arrowwidth=3, arrowcolor="#333333"),
+    # Diagram boxes are outlined in white
+    shapedefaults=dict(line=dict(color="white", width=3)),
+)
+
+TEMPLATE_DATA = dict(
+    bar=[dict(textfont=dict(size=10))],
+)
+
+
+_registered_key = None
+
+
+def _template_key():
+    return json.dumps([BASE_TEMPLATE, TEMPLATE_LAYOUT, TEMPLATE_DATA], sort_keys=True)
+
+
+def register():
+    """Register the brand template and make it the default.
+
+    The template is rebuilt whenever the settings above change, e.g. after
+    watch mode reloads this module with a new palette.
+    """
+    global _registered_key
+    import plotly.io as pio
+
+    key = _template_key()
+    if key != _registered_key or TEMPLATE_NAME not in pio.templates:
+        import plotly.graph_objects as go
+
+        brand = go.layout.Template(layout=TEMPLATE_LAYOUT, data=TEMPLATE_DATA)
+        pio.templates[TEMPLATE_NAME] = pio.templates.merge_templates(
+            pio.templates[BASE_TEMPLATE], brand)
+        _registered_key = key
+    # Assigning the default re-validates the template, so only do it once
+    if pio.templates.default != TEMPLATE_NAME:
+        pio.templates.default = TEMPLATE_NAME
@@ -0,0 +1,155 @@
+"""Shared static-image export engine for the chart scripts.
+
+Every chart used to call ``fig.write_image`` once per format, paying the full
+Kaleido/Chrome startup each time.  The engine below keeps a single Kaleido
+server alive for the life of the process and renders all requested formats
+of a figure in one batched call, recording how long each figure took; the
+per-figure latencies and render cache counters are printed at exit.
+Formats whose artifact is already in the render cache are not re-rendered.
+The "json" format is the compact interactive payload from figure_payload
+and is written directly rather than through Kaleido.
+"""
+import atexit
+import os
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import chart_profile
+from render_cache import RenderCache, figure_key
+
+DEFAULT_FORMATS = ("png", "svg", "json")
+
+ExportResult = namedtuple("ExportResult", ["name", "paths", "seconds"])
+
+
+class ExportEngine:
+    """Long-lived exporter that figures are submitted to by name."""
+
+    def __init__(self, output_dir=".", formats=DEFAULT_FORMATS, cache=None,
+                 verbose=True):
+        self.output_dir = Path(output_dir)
+        self.formats = tuple(formats)
+        self.cache = cache
+        self.verbose = verbose
+        self.results = []
+        self._server = None
+
+    def start(self):
+        """Start the persistent Kaleido server (no-op if already running)."""
+        if self._server is not None:
+            return
+        import kaleido
+        if hasattr(kaleido, "start_sync_server"):
+            # Constructing Kaleido locates Chrome; fail here because the
+            # sync server thread dies silently and leaves callers blocked
+            try:
+                kaleido.Kaleido()
+            except Exception as exc:
+                raise RuntimeError(f"static image export unavailable: {exc}") from exc
+            # Kaleido >= 1.0: one browser shared by every write_images call
+            kaleido.start_sync_server(silence_warnings=True)
+            self._server = kaleido
+        else:
+            # Kaleido 0.x keeps its own subprocess alive after first use
+            self._server = False
+
+    def stop(self):
+        if self._server:
+            self._server.stop_sync_server(silence_warnings=True)
+        self._server = None
+
+    def export(self, fig, name, formats=None):
+        """Render ``fig`` to ``<output_dir>/<name>.<fmt>`` for every format."""
+        formats = tuple(formats or self.formats)
+        paths = [self.output_dir / f"{name}.{fmt}" for fmt in formats]
+
+        start = time.perf_counter()
+        with chart_profile.stage("export", figure=name):
+            # Serialize once and skip re-validation for every extra format
+            with chart_profile.stage("serialize"):
+                fig_dict = fig if isinstance(fig, dict) else fig.to_dict()
+            pending = list(zip(paths, formats))
+            if "json" in formats:
+                from figure_payload import write_payload
+
+                with chart_profile.stage("payload"):
+                    write_payload(fig_dict, self.output_dir / f"{name}.json")
+                pending = [(path, fmt) for path, fmt in pending if fmt != "json"]
+            keys = {}
+            if self.cache is not None and pending:
+                with chart_profile.stage("cache lookup"):
+                    options = self._options()
+                    keys = {fmt: figure_key(fig_dict, fmt, options) for _, fmt in pending}
+                    pending = [(path, fmt) for path, fmt in pending
+                               if not self.cache.fetch(keys[fmt], fmt, path)]
+            if pending:
+                with chart_profile.stage("render", formats=[fmt for _, fmt in pending]):
+                    self.start()
+                    self._render(fig_dict, *zip(*pending))
+                for path, fmt in pending:
+                    if fmt in keys:
+                        self.cache.store(keys[fmt], fmt, path)
+        result = ExportResult(name, paths, time.perf_counter() - start)
+
+        self.results.append(result)
+        if self.verbose:
+            print(f"exported {name} ({', '.join(formats)}) in {result.seconds:.2f}s",
+                  file=sys.stderr)
+        return result
+
+    @staticmethod
+    def _options():
+        import plotly.io as pio
+        defaults = pio.defaults
+        return {"width": defaults.default_width, "height": defaults.default_height,
+                "scale": defaults.default_scale}
+
+    def _render(self, fig_dict, paths, formats):
+        import plotly.io as pio
+
+        if self._server:
+            pio.write_images([fig_dict] * len(paths), paths,
+                             format=list(formats), validate=False)
+        else:
+            for path, fmt in zip(paths, formats):
+                pio.write_image(fig_dict, path, format=fmt, validate=False)
+
+    def report(self):
+        """Return a per-figure latency summary as text."""
+        lines = [f"{'figure':<28}{'seconds':>10}  outputs"]
+        for result in self.results:
+            outputs = ", ".join(p.name for p in result.paths)
+            lines.append(f"{result.name:<28}{result.seconds:>10.3f}  {outputs}")
+        total = sum(r.seconds for r in self.results)
+        lines.append(f"{'total':<28}{total:>10.3f}")
+        if self.cache is not None:
+            lines.append(self.cache.report())
+        return "\n".join(lines)
+
+
+_engine = None
+
+
+def get_engine():
+    """Return the process-wide engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        # ADHYAYAN_RENDER_CACHE=0 forces every figure to be re-rendered
+        use_cache = os.environ.get("ADHYAYAN_RENDER_CACHE", "1") != "0"
+        _engine = ExportEngine(cache=RenderCache() if use_cache else None)
+        atexit.register(_engine.stop)
+        atexit.register(_report_at_exit, _engine)
+    return _engine
+
+
+def _report_at_exit(engine):
+    # Pool workers are quiet; their timings go back with each summary
+    if engine.verbose and engine.results:
+        print(engine.report(), file=sys.stderr)
+
+
+def export_figure(fig, name, formats=None):
+    """Submit ``fig`` to the shared engine; see ``ExportEngine.export``."""
+    return get_engine().export(fig, name, formats)
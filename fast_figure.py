@@ -0,0 +1,152 @@
+"""Plain-dict stand-ins for the parts of plotly.graph_objects the charts use.
+
+``go.Figure``, ``go.Scatter`` and friends validate and coerce every
+property on every call, which dominates the cost of generating many
+figures.  The ``Figure`` and trace constructors below accept the same
+arguments but only build dicts, applying the two conveniences the scripts
+rely on: magic underscores (``marker_color`` -> ``marker.color``) and
+string titles (``title="X"`` -> ``title.text``).  ``to_dict``/``to_json``
+give the same figure ``go.Figure`` would, default template included.
+
+Chart scripts take ``fast=True`` in ``build_figure`` to use this module.
+Nothing is validated until ``Figure.validate()``, which ``finish`` calls
+for every fast figure when ``ADHYAYAN_DEBUG=1``.
+"""
+import os
+import sys
+
+# Property names that contain an underscore rather than nest with it
+UNDERSCORE_PROPS = {"paper_bgcolor", "plot_bgcolor", "error_x", "error_y", "error_z"}
+
+
+def _merge(dest, src):
+    for key, value in src.items():
+        if isinstance(value, dict) and isinstance(dest.get(key), dict):
+            _merge(dest[key], value)
+        else:
+            dest[key] = value
+    return dest
+
+
+def _expand(props):
+    """Return ``props`` with magic underscores and string titles expanded."""
+    out = {}
+    for key, value in props.items():
+        if isinstance(value, dict):
+            value = _expand(value)
+        elif isinstance(value, list) and value and isinstance(value[0], dict):
+            value = [_expand(item) if isinstance(item, dict) else item for item in value]
+        if key == "title" and isinstance(value, str):
+            value = {"text": value}
+        if "_" in key and key not in UNDERSCORE_PROPS:
+            head, rest = key.split("_", 1)
+            _merge(out, {head: _expand({rest: value})})
+        else:
+            _merge(out, {key: value})
+    return out
+
+
+def _encode_arrays(obj):
+    # What go.Figure.to_dict does with NumPy arrays, without copying the rest
+    from _plotly_utils.utils import is_homogeneous_array, is_skipped_key, to_typed_array_spec
+
+    if isinstance(obj, dict):
+        return {key: value if is_skipped_key(key)
+                else to_typed_array_spec(value) if is_homogeneous_array(value)
+                else _encode_arrays(value)
+                for key, value in obj.items()}
+    if isinstance(obj, list) and obj and isinstance(obj[0], dict):
+        return [_encode_arrays(value) for value in obj]
+    return obj
+
+
+def _trace_type(type_name):
+    def make(arg=None, **props):
+        trace = _expand(dict(arg or {}, **props))
+        trace["type"] = type_name
+        return trace
+
+    make.__name__ = make.__qualname__ = type_name.title()
+    return make
+
+
+Bar = _trace_type("bar")
+Heatmap = _trace_type("heatmap")
+Scatter = _trace_type("scatter")
+Scattergl = _trace_type("scattergl")
+Treemap = _trace_type("treemap")
+
+
+class Figure:
+    """A figure held as plain ``data`` and ``layout`` dicts."""
+
+    def __init__(self, data=None, layout=None):
+        if isinstance(data, dict):
+            data = [data]
+        self.data = list(data or ())
+        self.layout = _expand(layout or {})
+
+    def add_trace(self, trace):
+        self.data.append(trace)
+        return self
+
+    def update_layout(self, dict1=None, **props):
+        _merge(self.layout, _expand(dict(dict1 or {}, **props)))
+        return self
+
+    def update_traces(self, dict1=None, **props):
+        update = _expand(dict(dict1 or {}, **props))
+        for trace in self.data:
+            _merge(trace, update)
+        return self
+
+    def _update_axes(self, prefix, props):
+        update = _expand(props)
+        axes = [key for key in self.layout
+                if key.startswith(prefix) and key[len(prefix):].isdigit()]
+        for key in [prefix] + axes:
+            _merge(self.layout.setdefault(key, {}), update)
+
+    def update_xaxes(self, dict1=None, **props):
+        self._update_axes("xaxis", dict(dict1 or {}, **props))
+        return self
+
+    def update_yaxes(self, dict1=None, **props):
+        self._update_axes("yaxis", dict(dict1 or {}, **props))
+        return self
+
+    def to_dict(self):
+        layout = self.layout
+        if "template" not in layout:
+            import plotly.io as pio
+
+            # go.Figure applies the default template the same way
+            template = pio.templates[pio.templates.default].to_plotly_json()
+            layout = dict(layout, template=template)
+        return _encode_arrays({"data": self.data, "layout": layout})
+
+    to_plotly_json = to_dict
+
+    def to_json(self):
+        from plotly.io.json import to_json_plotly
+        return to_json_plotly(self.to_dict())
+
+    def validate(self):
+        """Validate the whole figure once; returns the ``go.Figure``."""
+        import plotly.graph_objects as go
+        return go.Figure(self.to_dict())
+
+
+def objects(fast=False):
+    """Return the namespace build_figure should take Figure and traces from."""
+    if fast:
+        return sys.modules[__name__]
+    import plotly.graph_objects as go
+    return go
+
+
+def finish(fig):
+    """Return ``fig``, validating fast figures first in debug mode."""
+    if isinstance(fig, Figure) and os.environ.get("ADHYAYAN_DEBUG", "0") != "0":
+        fig.validate()
+    return fig
@@ -0,0 +1,165 @@
+"""Compact figure payloads for rendering the charts interactively on the site.
+
+``write_payload`` writes ``<name>.json`` next to the exported images: the
+figure with every numeric array of ``MIN_ENCODED_LENGTH`` or more values
+stored as a base64 typed-array block (the ``{"dtype", "bdata"}`` form
+plotly.js decodes natively), downcast to the smallest lossless dtype, and
+with the layout template moved into a shared ``template_<hash>.json`` that
+all charts using it reference by name.  The chart_bundle loader stitches
+the template back in before calling ``Plotly.newPlot``.
+
+Run as a script to print a per-chart size report against the PNGs:
+
+    python figure_payload.py [--png-dir DIR]
+"""
+import argparse
+import gzip
+import hashlib
+import importlib
+from pathlib import Path
+
+MIN_ENCODED_LENGTH = 16
+
+# Pre-rendered images shipped with the site, for charts not exported yet
+REFERENCE_PNGS = {
+    "architecture_chart": "architecture chart visualization.png",
+    "user_flow_diagram": "user flow diagram.png",
+    "erd_diagram": "erd_diagram.png",
+    "wireframe_structure": "wireframe structure.png",
+    "tech_stack_diagram": "tech stack architecture.png",
+    "feature_matrix": "feature matrix visualization.png",
+    "roadmap": "development roadmap visualiztion.png",
+    "security_architecture": "security architecture layers visualiztion.png",
+}
+
+_NUMBER_TYPES = (int, float, type(None))
+
+
+def _is_numeric_list(values):
+    return all(type(v) in _NUMBER_TYPES for v in values)
+
+
+def _as_array(value):
+    """Return ``value`` as a NumPy array if it is numeric data worth packing."""
+    import numpy as np
+
+    if isinstance(value, np.ndarray):
+        ok = value.dtype.kind in "iuf" and value.size >= MIN_ENCODED_LENGTH
+        return value if ok else None
+    if not isinstance(value, (list, tuple)) or len(value) < MIN_ENCODED_LENGTH:
+        return None
+    if _is_numeric_list(value):
+        return np.array(value, dtype=float)
+    # Rectangular 2-D numeric data, e.g. heatmap z given as nested lists
+    if (all(isinstance(row, (list, tuple)) for row in value)
+            and len({len(row) for row in value}) == 1
+            and all(_is_numeric_list(row) for row in value)):
+        return np.array(value, dtype=float)
+    return None
+
+
+def _smallest(arr):
+    """Downcast ``arr`` to the smallest dtype that round-trips exactly."""
+    import numpy as np
+
+    if arr.dtype.kind == "f":
+        finite = np.isfinite(arr)
+        if finite.all() and np.array_equal(arr, np.round(arr)):
+            # Integral values; to_typed_array_spec picks the int width
+            return arr.astype(np.int64)
+        as_f32 = arr.astype(np.float32)
+        if np.array_equal(as_f32, arr, equal_nan=True):
+            return as_f32
+        return arr.astype(np.float64)
+    if arr.dtype.kind == "u":
+        return arr.astype(np.uint64)
+    return arr.astype(np.int64)
+
+
+def pack_arrays(obj):
+    """Return ``obj`` with numeric arrays replaced by typed-array specs.
+
+    ``None`` gaps (the separators in segmented line traces) become NaN,
+    which plotly.js treats the same way.
+    """
+    from _plotly_utils.utils import to_typed_array_spec
+
+    if isinstance(obj, dict):
+        return {key: pack_arrays(value) for key, value in obj.items()}
+    arr = _as_array(obj)
+    if arr is not None:
+        return to_typed_array_spec(_smallest(arr))
+    if isinstance(obj, (list, tuple)):
+        return [pack_arrays(value) for value in obj]
+    return obj
+
+
+def compact_figure(fig):
+    """Return ``(payload, template_name, template_json)`` for ``fig``."""
+    from plotly.io.json import to_json_plotly
+
+    fig_dict = fig if isinstance(fig, dict) else fig.to_dict()
+    layout = dict(fig_dict.get("layout", {}))
+    template_json = to_json_plotly(layout.pop("template", {}))
+    template_name = "template_" + hashlib.sha256(template_json.encode()).hexdigest()[:10]
+    payload = {"data": pack_arrays(fig_dict.get("data", [])),
+               "layout": pack_arrays(layout), "template": template_name}
+    return payload, template_name, template_json
+
+
+def write_payload(fig, path):
+    """Write ``fig``'s compact payload to ``path`` and its shared template
+    next to it; return the payload size in bytes."""
+    from plotly.io.json import to_json_plotly
+
+    path = Path(path)
+    payload, template_name, template_json = compact_figure(fig)
+    template_path = path.with_name(f"{template_name}.json")
+    if not template_path.exists():
+        template_path.write_text(template_json)
+    text = to_json_plotly(payload)
+    path.write_text(text)
+    return len(text)
+
+
+def size_report(png_dir="."):
+    """Return (chart, plain, compact, compact gzipped, png) byte counts."""
+    from plotly.io.json import to_json_plotly
+
+    from build_charts import discover
+
+    rows = []
+    templates = set()
+    for script in discover():
+        module = importlib.import_module(script.stem)
+        fig = module.build_figure()
+        payload, template_name, template_json = compact_figure(fig)
+        compact = to_json_plotly(payload).encode()
+        png = Path(png_dir) / f"{module.OUTPUT_NAME}.png"
+        if not png.exists():
+            png = Path(png_dir) / REFERENCE_PNGS.get(module.OUTPUT_NAME, "")
+        rows.append((script.stem, len(fig.to_json()), len(compact),
+                     len(gzip.compress(compact)), png.stat().st_size if png.is_file() else None))
+        templates.add((template_name, len(template_json)))
+    return rows, templates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--png-dir", default=".", help="where the exported PNGs are")
+    args = parser.parse_args(argv)
+
+    rows, templates = size_report(args.png_dir)
+    print(f"{'chart':<16}{'to_json KB':>12}{'payload KB':>12}{'gzip KB':>10}"
+          f"{'png KB':>10}{'payload/png':>13}")
+    for chart, plain, compact, zipped, png in rows:
+        ratio = f"{compact / png:>12.1%}" if png else f"{'-':>12}"
+        png_kb = f"{png / 1024:>10.1f}" if png else f"{'-':>10}"
+        print(f"{chart:<16}{plain / 1024:>12.1f}{compact / 1024:>12.1f}"
+              f"{zipped / 1024:>10.1f}{png_kb} {ratio}")
+    for name, size in sorted(templates):
+        print(f"shared {name}.json: {size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Measure how long importing each chart script takes.
+
+Each module is imported in a fresh interpreter with ``-X importtime`` and
+the cumulative time reported for the module itself is taken, so shared
+imports such as plotly are attributed to every script that pulls them in.
+The best of ``--repeat`` runs is reported.
+
+Usage: python import_times.py [--repeat N] [module ...]
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+
+def import_time_us(module):
+    """Cumulative import time of ``module`` in microseconds."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    for line in reversed(proc.stderr.splitlines()):
+        # "import time:   self [us] | cumulative | imported package"
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise RuntimeError(f"no importtime entry for {module}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*",
+                        help="modules to time (default: every chart script)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    modules = args.modules or [p.stem for p in sorted(ROOT.glob("chart_script*.py"))]
+    print(f"{'module':<20}{'import ms':>10}")
+    for module in modules:
+        best = min(import_time_us(module) for _ in range(args.repeat))
+        print(f"{module:<20}{best / 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Incremental on-disk counters for the event-registration stream.
+
+Registrations arrive as an append-only CSV log
+(``registration_id,event_id,student_id,registered_at``).  The store keeps
+only per-day, per-event counts in SQLite plus a checkpoint per log: the
+byte offset ingestion stopped at.  Each run seeks straight to that offset,
+folds the new complete lines into counts and upserts them together with the
+new checkpoint in one transaction, so the work scales with what was
+appended since the last run rather than with the whole history, and an
+interrupted run leaves the store as it was.
+"""
+import sqlite3
+from collections import Counter
+from pathlib import Path
+
+DEFAULT_STORE = Path(".chart_cache") / "registrations.sqlite"
+REGISTRATION_COLUMNS = ["registration_id", "event_id", "student_id", "registered_at"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_registrations (
+    day TEXT NOT NULL,
+    event_id INTEGER NOT NULL,
+    registrations INTEGER NOT NULL,
+    PRIMARY KEY (day, event_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS checkpoints (
+    source TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    rows INTEGER NOT NULL
+);
+"""
+
+UPSERT = """
+INSERT INTO daily_registrations (day, event_id, registrations) VALUES (?, ?, ?)
+ON CONFLICT (day, event_id) DO UPDATE SET registrations = registrations + excluded.registrations
+"""
+
+
+class RegistrationStore:
+    """Daily registration counts per event, fed incrementally."""
+
+    def __init__(self, path=DEFAULT_STORE):
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.con = sqlite3.connect(str(path))
+        self.con.executescript(SCHEMA)
+
+    def close(self):
+        self.con.close()
+
+    def checkpoint(self, source):
+        """Return ``(offset, rows)`` ingested so far from ``source``."""
+        row = self.con.execute("SELECT offset, rows FROM checkpoints WHERE source = ?",
+                               (str(source),)).fetchone()
+        return row or (0, 0)
+
+    def _apply(self, counts, source=None, offset=None, rows=None):
+        with self.con:
+            self.con.executemany(UPSERT, ((day, event, n) for (day, event), n in counts.items()))
+            if source is not None:
+                self.con.execute("INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)",
+                                 (str(source), offset, rows))
+
+    def ingest_rows(self, rows):
+        """Count ``(event_id, registered_at)`` pairs; no checkpoint is kept."""
+        counts = Counter((registered_at[:10], int(event_id)) for event_id, registered_at in rows)
+        self._apply(counts)
+        return sum(counts.values())
+
+    def ingest_log(self, path):
+        """Fold the lines appended to ``path`` since the last checkpoint.
+
+        A trailing line without its newline is still being written and is
+        left for the next run; blank lines and repeated headers are skipped.
+        Returns the number of registrations added.
+        """
+        path = Path(path).resolve()
+        offset, total = self.checkpoint(path)
+        if path.stat().st_size < offset:
+            raise ValueError(f"{path} is shorter than its checkpoint; "
+                             "registration logs must only be appended to")
+        counts = Counter()
+        new = 0
+        with open(path, "rb") as f:
+            header = f.readline()
+            columns = header.decode().strip().split(",")
+            event_col = columns.index("event_id")
+            time_col = columns.index("registered_at")
+            offset = max(offset, len(header))
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                if not line.strip() or line == header:
+                    continue
+                fields = line.split(b",")
+                counts[fields[time_col][:10].decode(), int(fields[event_col])] += 1
+                new += 1
+        self._apply(counts, path, offset, total + new)
+        return new
+
+    def daily(self):
+        """Return every ``(day, event_id, registrations)`` row, by day."""
+        return self.con.execute(
+            "SELECT day, event_id, registrations FROM daily_registrations "
+            "ORDER BY day, event_id").fetchall()
@@ -0,0 +1,108 @@
+"""On-disk content-hash cache for exported chart images.
+
+Artifacts are keyed by a SHA-256 of the figure JSON, the export options and
+the output format.  A hit copies the cached file to the requested path and
+skips rendering; the cache is trimmed least-recently-used first once it
+grows past ``max_bytes``.
+"""
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(".chart_cache") / "renders"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def figure_key(fig_dict, fmt, options=None):
+    """Stable hash of a figure dict plus export options and format."""
+    import plotly
+    from plotly.utils import PlotlyJSONEncoder
+
+    payload = json.dumps(
+        {
+            "figure": fig_dict,
+            "options": options or {},
+            "format": fmt,
+            "plotly": plotly.__version__,
+        },
+        sort_keys=True,
+        cls=PlotlyJSONEncoder,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """Size-bounded LRU cache of rendered artifacts."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def _entry(self, key, fmt):
+        return self.cache_dir / f"{key}.{fmt}"
+
+    def fetch(self, key, fmt, dest):
+        """Copy a cached artifact to ``dest``; return False on a miss."""
+        entry = self._entry(key, fmt)
+        try:
+            shutil.copyfile(entry, dest)
+        except FileNotFoundError:
+            # Never cached, or just evicted by another worker
+            self.misses += 1
+            return False
+        try:
+            # Bump mtime so eviction treats the entry as recently used
+            os.utime(entry)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        self.bytes_saved += os.path.getsize(dest)
+        return True
+
+    def store(self, key, fmt, src):
+        """Copy a freshly rendered artifact into the cache."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Per-process name, since workers may store the same key at once
+        tmp = self._entry(key, fmt).with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, self._entry(key, fmt))
+        self.evict()
+
+    def evict(self):
+        """Drop least-recently-used entries until under ``max_bytes``."""
+        # Workers share the directory, so entries can vanish at any point here
+        entries = []
+        for path in self.cache_dir.iterdir():
+            if path.suffix == ".tmp":
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def stats(self):
+        """Return the hit, miss and bytes-saved counters as a dict."""
+        return {"hits": self.hits, "misses": self.misses, "bytes_saved": self.bytes_saved}
+
+    def report(self):
+        return format_stats(self.stats())
+
+
+def format_stats(stats):
+    """One-line summary of ``RenderCache.stats()`` counters (or their sum)."""
+    lookups = stats["hits"] + stats["misses"]
+    rate = stats["hits"] / lookups if lookups else 0.0
+    return (f"render cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({rate:.0%} hit rate), {stats['bytes_saved'] / 1024:.1f} KiB saved")
@@ -0,0 +1,205 @@
+"""Native SVG writer for the box, circle, line and text diagrams.
+
+The architecture, swimlane and ERD charts are only shapes and labels, so
+they can be written straight to SVG in a few milliseconds instead of going
+through Kaleido's headless browser.  ``SvgCanvas`` maps data coordinates to
+pixels the way plotly's default layout does and understands the <b>, <i>
+and <br> markup the chart labels use; the chart scripts' ``render_svg``
+functions draw on it from the same specs as their ``build_figure``.
+
+PNG output needs the optional ``cairosvg`` package.  ``export_svg`` writes
+what it can natively and hands any other format (PNG without cairosvg, the
+JSON payload) to the plotly export engine.
+"""
+import re
+import sys
+import time
+from html import escape
+
+
+WIDTH = 700
+HEIGHT = 500
+MARGIN = dict(l=80, r=80, t=100, b=80)
+FONT_FAMILY = '"Open Sans", verdana, arial, sans-serif'
+
+_MARKUP = re.compile(r"(<b>|</b>|<i>|</i>|<br>)")
+_BOLD = ' font-weight="bold"'
+_ITALIC = ' font-style="italic"'
+
+
+def _runs(markup):
+    """Split label markup into lines of (text, bold, italic) runs."""
+    lines = [[]]
+    bold = italic = False
+    for token in _MARKUP.split(markup):
+        if token == "<br>":
+            lines.append([])
+        elif token in ("<b>", "</b>"):
+            bold = token == "<b>"
+        elif token in ("<i>", "</i>"):
+            italic = token == "<i>"
+        elif token:
+            lines[-1].append((token, bold, italic))
+    return lines
+
+
+def _num(value):
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+class SvgCanvas:
+    """An SVG document with a data-coordinate plot area."""
+
+    def __init__(self, x_range, y_range, width=WIDTH, height=HEIGHT, margin=MARGIN):
+        self.width = width
+        self.height = height
+        self.x0, self.x1 = x_range
+        self.y0, self.y1 = y_range
+        self.left = margin["l"]
+        self.top = margin["t"]
+        self.plot_w = width - margin["l"] - margin["r"]
+        self.plot_h = height - margin["t"] - margin["b"]
+        self.defs = set()
+        self.items = []
+
+    def px(self, x):
+        return self.left + (x - self.x0) / (self.x1 - self.x0) * self.plot_w
+
+    def py(self, y):
+        return self.top + (self.y1 - y) / (self.y1 - self.y0) * self.plot_h
+
+    def _add(self, tag, attrs, body=None):
+        attr_text = " ".join(f'{key.replace("_", "-")}="{value}"'
+                             for key, value in attrs.items() if value is not None)
+        self.items.append(f"<{tag} {attr_text}>{body}</{tag}>" if body is not None
+                          else f"<{tag} {attr_text}/>")
+
+    def lines(self, segments, color, width, dash=None):
+        """Draw ``[(x0, y0, x1, y1), ...]`` as one path."""
+        d = " ".join(f"M{_num(self.px(x0))} {_num(self.py(y0))}L{_num(self.px(x1))} {_num(self.py(y1))}"
+                     for x0, y0, x1, y1 in segments)
+        if d:
+            self._add("path", dict(d=d, fill="none", stroke=color, stroke_width=width,
+                                   stroke_dasharray=dash))
+
+    def arrow(self, x0, y0, x1, y1, color="#333333", width=3):
+        marker = f"arrow-{color.lstrip('#')}"
+        if marker not in self.defs:
+            self.defs.add(marker)
+            self.items.insert(0, f'<defs><marker id="{marker}" viewBox="0 0 10 10" refX="8" '
+                                 f'refY="5" markerWidth="4" markerHeight="4" orient="auto">'
+                                 f'<path d="M0 0L10 5L0 10z" fill="{color}"/></marker></defs>')
+        self._add("line", dict(x1=_num(self.px(x0)), y1=_num(self.py(y0)),
+                               x2=_num(self.px(x1)), y2=_num(self.py(y1)), stroke=color,
+                               stroke_width=width, marker_end=f"url(#{marker})"))
+
+    def rect(self, x0, y0, x1, y1, fill, stroke=None, stroke_width=None, opacity=None):
+        left, right = sorted((self.px(x0), self.px(x1)))
+        top, bottom = sorted((self.py(y0), self.py(y1)))
+        self._add("rect", dict(x=_num(left), y=_num(top), width=_num(right - left),
+                               height=_num(bottom - top), fill=fill, stroke=stroke,
+                               stroke_width=stroke_width, opacity=opacity))
+
+    def polygon(self, points, fill, stroke=None, stroke_width=None, opacity=None):
+        coords = " ".join(f"{_num(self.px(x))},{_num(self.py(y))}" for x, y in points)
+        self._add("polygon", dict(points=coords, fill=fill, stroke=stroke,
+                                  stroke_width=stroke_width, opacity=opacity))
+
+    def circle(self, x, y, radius, fill, stroke=None, stroke_width=None):
+        self._add("circle", dict(cx=_num(self.px(x)), cy=_num(self.py(y)), r=radius,
+                                 fill=fill, stroke=stroke, stroke_width=stroke_width))
+
+    def text(self, x, y, markup, size=12, color="#2a3f5f", family=FONT_FAMILY,
+             anchor="middle", background=None, border=None, pixels=False):
+        """Place ``markup`` centred vertically on (x, y), in data units
+        unless ``pixels``."""
+        cx, cy = (x, y) if pixels else (self.px(x), self.py(y))
+        lines = _runs(markup)
+        line_height = size * 1.3
+        first_dy = -(len(lines) - 1) / 2 * line_height
+        if background or border:
+            chars = max(sum(len(text) for text, _, _ in line) for line in lines)
+            box_w = chars * size * 0.6 + 6
+            box_h = len(lines) * line_height + 4
+            box_x = {"middle": cx - box_w / 2, "start": cx - 3, "end": cx - box_w + 3}[anchor]
+            self._add("rect", dict(x=_num(box_x), y=_num(cy - box_h / 2), width=_num(box_w),
+                                   height=_num(box_h), fill=background or "none",
+                                   stroke=border, stroke_width=1 if border else None))
+        spans = []
+        for i, line in enumerate(lines):
+            dy = first_dy if i == 0 else line_height
+            runs = "".join(
+                f'<tspan{_BOLD if bold else ""}{_ITALIC if italic else ""}>{escape(text)}</tspan>'
+                for text, bold, italic in line)
+            spans.append(f'<tspan x="{_num(cx)}" dy="{_num(dy)}">{runs}</tspan>')
+        self._add("text", dict(x=_num(cx), y=_num(cy), font_size=size, fill=color,
+                               font_family=escape(family, quote=True), text_anchor=anchor,
+                               dominant_baseline="central"), "".join(spans))
+
+    def title(self, text, size=17, centered=False):
+        x = self.width / 2 if centered else self.width * 0.05
+        self.text(x, self.top / 2, text, size=size, anchor="middle" if centered else "start",
+                  pixels=True)
+
+    def legend(self, entries, y=None):
+        """A horizontal legend of (label, color) swatches centred above the plot."""
+        widths = [18 + len(label) * 7 + 16 for label, _ in entries]
+        x = (self.width - sum(widths)) / 2
+        y = self.top - 18 if y is None else y
+        for (label, color), width in zip(entries, widths):
+            self.items.append(f'<rect x="{_num(x)}" y="{_num(y - 6)}" width="12" height="12" '
+                              f'fill="{color}"/>')
+            self.text(x + 18, y, label, size=12, anchor="start", pixels=True)
+            x += width
+
+    def to_svg(self):
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" '
+                f'height="{self.height}" viewBox="0 0 {self.width} {self.height}">'
+                f'<rect width="100%" height="100%" fill="white"/>'
+                + "".join(self.items) + "</svg>")
+
+
+def rasterize(svg, path):
+    """Write ``svg`` as a PNG; needs the optional cairosvg package."""
+    try:
+        import cairosvg
+    except ImportError as exc:
+        raise RuntimeError("PNG rasterization needs the cairosvg package") from exc
+    cairosvg.svg2png(bytestring=svg.encode(), write_to=str(path))
+
+
+def export_svg(svg, name, fallback=None, formats=None):
+    """Write ``svg`` as ``<name>.svg``/``.png`` next to the engine's output.
+
+    Formats that cannot be produced natively are exported through the
+    plotly engine from ``fallback()``, a callable returning the figure.
+    """
+    from export_engine import ExportResult, export_figure, get_engine
+
+    engine = get_engine()
+    formats = tuple(formats or engine.formats)
+    start = time.perf_counter()
+    paths, remaining = [], []
+    for fmt in formats:
+        path = engine.output_dir / f"{name}.{fmt}"
+        if fmt == "svg":
+            path.write_text(svg)
+        elif fmt == "png":
+            try:
+                rasterize(svg, path)
+            except RuntimeError:
+                remaining.append(fmt)
+                continue
+        else:
+            remaining.append(fmt)
+            continue
+        paths.append(path)
+    native_s = time.perf_counter() - start
+    if engine.verbose:
+        written = ", ".join(p.suffix[1:] for p in paths)
+        print(f"rendered {name} ({written}) natively in {native_s:.3f}s", file=sys.stderr)
+    if remaining and fallback is not None:
+        result = export_figure(fallback(), name, remaining)
+        paths += result.paths
+    return ExportResult(name, paths, time.perf_counter() - start)
+
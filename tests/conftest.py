@@ -0,0 +1,5 @@
+# The chart scripts are top-level modules; make them importable from tests/
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,47 @@
+"""Every build_figure must give the same figure with fast=True.
+
+fast_figure skips plotly's validation, so a difference between the two
+builds is a chart bug that only ADHYAYAN_DEBUG=1 would otherwise catch.
+Charts are found by file name, so new chart and analytics scripts are
+covered without being listed here.
+"""
+import importlib
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.synthetic import SCALERS, scaled_inputs
+
+ROOT = Path(__file__).resolve().parent.parent
+CHARTS = sorted(path.stem for pattern in ("chart_script*.py", "analytics_*.py")
+                for path in ROOT.glob(pattern))
+
+# Inputs with nothing to draw, which each take their own path through the build
+EMPTY_INPUTS = [
+    ("analytics_certificates", ([],)),
+    ("chart_script_5", ({"user_roles": [], "features": []},)),
+    ("chart_script_7", ([("network", ["Firewall"]), ("empty", [])],)),
+]
+
+
+def assert_same_figure(module, *inputs):
+    go_fig = module.build_figure(*inputs)
+    fast_fig = module.build_figure(*inputs, fast=True)
+    assert json.loads(fast_fig.to_json()) == json.loads(go_fig.to_json())
+
+
+@pytest.mark.parametrize("chart", CHARTS)
+def test_default_inputs(chart):
+    assert_same_figure(importlib.import_module(chart))
+
+
+@pytest.mark.parametrize("scale", [1, 10])
+@pytest.mark.parametrize("chart", sorted(SCALERS))
+def test_synthetic_inputs(chart, scale):
+    assert_same_figure(importlib.import_module(chart), *scaled_inputs(chart, scale))
+
+
+@pytest.mark.parametrize("chart, inputs", EMPTY_INPUTS)
+def test_empty_inputs(chart, inputs):
+    assert_same_figure(importlib.import_module(chart), *inputs)
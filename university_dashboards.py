@@ -0,0 +1,210 @@
+"""Render every institution's dashboard charts across a process pool.
+
+Each university gets a placement-rate chart and a faculty-per-department
+chart, both against its region's and the national average.  The two figure
+skeletons are built and validated once, in the parent; workers receive them
+with the peer averages when they start and, per university, only swap the
+bar values, labels and title into a shallow copy of the skeleton dict before
+handing it to their export engine.  Universities are sent to the pool in
+chunks, and the run reports its throughput in charts per second.
+
+The dataset is a JSON list of records shaped like ``appData.universities``
+in app.js (or an object with a "universities" list), or a CSV with the same
+columns; ``--synthetic N`` generates N institutions for load testing.
+
+Usage:
+    python university_dashboards.py [--universities FILE | --synthetic N]
+                                    [--jobs N] [--output-dir DIR] [--formats json png]
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import chart_theme
+from build_charts import _init_worker as _init_export_worker
+
+# The institutions app.js ships with
+universities = [
+    {"id": 1, "name": "Indian Institute of Technology Delhi", "code": "IITD",
+     "state": "Delhi", "region": "North", "placementRate": "95%",
+     "faculties": 450, "departments": 16},
+    {"id": 2, "name": "Indian Institute of Science Bangalore", "code": "IISc",
+     "state": "Karnataka", "region": "South", "placementRate": "98%",
+     "faculties": 350, "departments": 14},
+    {"id": 3, "name": "University of Delhi", "code": "DU",
+     "state": "Delhi", "region": "North", "placementRate": "82%",
+     "faculties": 1200, "departments": 90},
+]
+
+REGIONS = ["North", "South", "East", "West", "Central", "North East"]
+
+# Universities handed to a worker per task; amortizes pickling and IPC
+CHUNK_SIZE = 64
+
+_skeletons = None
+_averages = None
+_formats = None
+
+
+def load_universities(path):
+    """Read university records from a JSON or CSV file."""
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        with open(path, newline="") as f:
+            return list(csv.DictReader(f))
+    with open(path) as f:
+        data = json.load(f)
+    return data["universities"] if isinstance(data, dict) else data
+
+
+def synthetic_universities(n, seed=0):
+    """Return ``n`` made-up university records for load testing."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    departments = rng.integers(5, 120, n)
+    faculties = departments * rng.integers(10, 40, n)
+    rates = rng.uniform(40, 99, n)
+    regions = rng.integers(0, len(REGIONS), n)
+    return [{"id": i + 1, "name": f"University {i + 1}", "code": f"U{i + 1:05d}",
+             "region": REGIONS[regions[i]], "placementRate": f"{rates[i]:.0f}%",
+             "faculties": int(faculties[i]), "departments": int(departments[i])}
+            for i in range(n)]
+
+
+def _metrics(record):
+    # placementRate is a "95%" string in app.js
+    placement = float(str(record["placementRate"]).rstrip("%"))
+    per_department = float(record["faculties"]) / max(float(record["departments"]), 1)
+    return placement, per_department
+
+
+def peer_averages(records):
+    """Return {"national": (placement, faculty_per_dept), "region": {...}}."""
+    totals = {}
+    national = [0.0, 0.0, 0]
+    for record in records:
+        placement, per_department = _metrics(record)
+        region = totals.setdefault(record.get("region", ""), [0.0, 0.0, 0])
+        for acc in (region, national):
+            acc[0] += placement
+            acc[1] += per_department
+            acc[2] += 1
+    mean = lambda acc: (acc[0] / acc[2], acc[1] / acc[2]) if acc[2] else (0.0, 0.0)
+    return {"national": mean(national),
+            "region": {name: mean(acc) for name, acc in totals.items()}}
+
+
+def build_skeletons():
+    """Build and validate each dashboard chart once, returned as plain dicts."""
+    import plotly.graph_objects as go
+
+    chart_theme.register()
+    colors = [chart_theme.BRAND_COLORS[0], "#A7A9AC", "#5D878F"]
+    skeletons = {}
+    for chart, title, axis in (("placement", "Placement Rate", "Placement rate (%)"),
+                               ("faculty", "Faculty per Department", "Faculty per department")):
+        fig = go.Figure(go.Bar(x=["This university", "Region avg", "National avg"],
+                               y=[0, 0, 0], marker_color=colors, text=["", "", ""],
+                               textposition="outside", cliponaxis=False))
+        fig.update_layout(title=title, yaxis_title=axis, showlegend=False)
+        skeletons[chart] = fig.to_dict()
+    return skeletons
+
+
+def dashboard_figures(skeletons, record, averages):
+    """Yield ``(chart, figure dict)`` for one university from the skeletons."""
+    placement, per_department = _metrics(record)
+    region = averages["region"].get(record.get("region", ""), averages["national"])
+    values = {"placement": (placement, region[0], averages["national"][0]),
+              "faculty": (per_department, region[1], averages["national"][1])}
+    name = record.get("code") or record["name"]
+    for chart, skeleton in skeletons.items():
+        ys = [round(value, 1) for value in values[chart]]
+        # Only data and title change; the template is shared by reference
+        trace = dict(skeleton["data"][0], y=ys, text=[f"{y:g}" for y in ys],
+                     x=[name, f"{record.get('region') or 'Region'} avg", "National avg"])
+        title = dict(skeleton["layout"]["title"],
+                     text=f"{record['name']}: {skeleton['layout']['title']['text']}")
+        yield chart, {"data": [trace], "layout": dict(skeleton["layout"], title=title)}
+
+
+def output_name(record, chart):
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", str(record.get("code") or record["id"])).strip("_")
+    return f"university_{slug}_{chart}"
+
+
+def _init_worker(output_dir, skeletons, averages, formats):
+    global _skeletons, _averages, _formats
+    _init_export_worker(output_dir)
+    _skeletons, _averages, _formats = skeletons, averages, formats
+
+
+def render_university(record):
+    """Export one university's charts. Never raises; returns a summary."""
+    from export_engine import export_figure
+
+    summary = {"university": record.get("code") or record["id"], "charts": 0, "error": None}
+    try:
+        for chart, fig in dashboard_figures(_skeletons, record, _averages):
+            export_figure(fig, output_name(record, chart), _formats)
+            summary["charts"] += 1
+    except Exception:
+        summary["error"] = traceback.format_exc(limit=3)
+    return summary
+
+
+def render_all(records, jobs=None, output_dir=".", formats=None):
+    """Render every university's dashboard and return the summaries in order."""
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(records)))
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    initargs = (str(output_dir), build_skeletons(), peer_averages(records), formats)
+    chunksize = max(1, min(CHUNK_SIZE, len(records) // (jobs * 4)))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=initargs) as pool:
+        return list(pool.map(render_university, records, chunksize=chunksize))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--universities", help="JSON or CSV file of university records")
+    source.add_argument("--synthetic", type=int, metavar="N",
+                        help="render N generated universities instead")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--output-dir", default="university_dashboards")
+    parser.add_argument("--formats", nargs="+", default=None,
+                        help="export formats (default: the export engine's)")
+    args = parser.parse_args(argv)
+
+    if args.universities:
+        records = load_universities(args.universities)
+    elif args.synthetic:
+        records = synthetic_universities(args.synthetic)
+    else:
+        records = universities
+
+    start = time.perf_counter()
+    summaries = render_all(records, args.jobs, args.output_dir, args.formats)
+    wall_s = time.perf_counter() - start
+
+    charts = sum(s["charts"] for s in summaries)
+    failed = [s for s in summaries if s["error"]]
+    print(f"rendered {charts} charts for {len(records) - len(failed)}/{len(records)} "
+          f"universities in {wall_s:.2f}s ({charts / wall_s:.1f} charts/s)")
+    if failed:
+        print(f"\n{len(failed)} universities failed; first error ({failed[0]['university']}):\n"
+              f"{failed[0]['error']}", file=sys.stderr)
+    return 0 if not failed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
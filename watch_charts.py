@@ -0,0 +1,234 @@
+"""Rebuild charts whenever their source or data inputs change.
+
+Keeps one warm interpreter (plotly, NumPy and the Kaleido server loaded
+once) and polls the inputs of every chart: its script, the local helper
+modules it imports, and every data file it opened while building, which is
+recorded with an audit hook rather than declared by hand.  When something
+changes, only the charts depending on it are reloaded and rebuilt, and a
+chart is only re-exported if its figure actually differs from the last
+export, so every other output file is left untouched.
+
+Usage: python watch_charts.py [--output-dir DIR] [--interval SECONDS] [chart_script_6 ...]
+"""
+import argparse
+import ast
+import functools
+import hashlib
+import importlib
+import os
+import sys
+import time
+import traceback
+import types
+from graphlib import TopologicalSorter
+from pathlib import Path
+
+from build_charts import ROOT, discover
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _local_file(name):
+    module = sys.modules.get(name)
+    path = getattr(module, "__file__", None)
+    if path and Path(path).resolve().parent == ROOT:
+        return Path(path).resolve()
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _imported_names(path, stamp):
+    # Top-level import statements catch "from x import CONSTANT", which
+    # leaves nothing in the module's namespace that points back at x
+    try:
+        tree = ast.parse(Path(path).read_bytes(), filename=str(path))
+    except (OSError, SyntaxError):
+        # Half-saved files are picked up again once they parse
+        return frozenset()
+    names = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+    return frozenset(names)
+
+
+def local_imports(module):
+    """Names of the modules next to this one that ``module`` uses directly."""
+    path = _local_file(module.__name__)
+    names = set()
+    if path is not None:
+        names = {name for name in _imported_names(path, _stamp(path))
+                 if name != module.__name__ and name in sys.modules and _local_file(name)}
+    for value in vars(module).values():
+        if isinstance(value, types.ModuleType):
+            name = value.__name__
+        else:
+            name = getattr(value, "__module__", None)
+        if name and name != module.__name__ and _local_file(name):
+            names.add(name)
+    return names
+
+
+def reload_order(names):
+    """Order module ``names`` so each comes after the local modules it imports."""
+    names = sorted(names)
+    graph = {name: sorted(local_imports(sys.modules[name]) & set(names)) for name in names}
+    return list(TopologicalSorter(graph).static_order())
+
+
+class ChartWatcher:
+    def __init__(self, charts, output_dir=".", interval=0.2):
+        self.charts = list(charts)
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self.inputs = {}   # chart -> set of paths it depends on
+        self.stamps = {}   # path -> (mtime_ns, size) when last seen
+        self.digests = {}  # chart -> digest of the last exported figure
+        self._opened = None
+        self._ignored = [Path(p).resolve() for p in {sys.prefix, sys.base_prefix}]
+        self._ignored += [ROOT / ".chart_cache", Path(".chart_cache").resolve()]
+        # The output directory may be the repo itself, so only the files
+        # actually exported are skipped, not everything under it
+        self._artifacts = set()
+        sys.addaudithook(self._audit)
+
+    def _audit(self, event, args):
+        # Collect the files a chart opens while it is being built
+        if self._opened is None or event != "open" or not isinstance(args[0], (str, Path)):
+            return
+        path = Path(args[0]).resolve()
+        if (path.suffix in (".py", ".pyc") or path in self._artifacts
+                or any(p in path.parents for p in self._ignored)):
+            return
+        self._opened.add(path)
+
+    def _configure_engine(self):
+        from export_engine import get_engine
+
+        engine = get_engine()
+        engine.output_dir = self.output_dir
+        engine.verbose = False
+
+    def _reload(self, name):
+        module = sys.modules[name]
+        if name == "export_engine" and module._engine is not None:
+            # The reloaded module starts its own engine
+            module._engine.stop()
+        importlib.reload(module)
+
+    def _helpers(self, chart):
+        """Local helper modules ``chart`` depends on, transitively."""
+        seen = set()
+        pending = local_imports(sys.modules[chart])
+        while pending:
+            name = pending.pop()
+            if name not in seen and name not in self.charts:
+                seen.add(name)
+                pending |= local_imports(sys.modules[name])
+        return seen
+
+    def build(self, chart, reload=False):
+        from export_engine import export_figure
+
+        start = time.perf_counter()
+        self._opened = set()
+        try:
+            if reload:
+                self._reload(chart)
+            module = importlib.import_module(chart)
+            fig = module.build_figure()
+        except Exception:
+            print(f"{chart} failed:\n{traceback.format_exc(limit=3)}", file=sys.stderr)
+            return
+        finally:
+            opened, self._opened = self._opened, None
+            helpers = self._helpers(chart) if chart in sys.modules else set()
+            self.inputs[chart] = ({_local_file(chart) or ROOT / f"{chart}.py"}
+                                  | {_local_file(name) for name in helpers} | opened)
+            for path in self.inputs[chart]:
+                self.stamps.setdefault(path, _stamp(path))
+
+        digest = hashlib.sha256(fig.to_json().encode()).hexdigest()
+        if digest == self.digests.get(chart):
+            print(f"{chart}: figure unchanged, outputs left as they are")
+            return
+        try:
+            result = export_figure(fig, module.OUTPUT_NAME)
+        except Exception:
+            print(f"{chart} export failed:\n{traceback.format_exc(limit=3)}", file=sys.stderr)
+            return
+        self.digests[chart] = digest
+        self._artifacts.update(path.resolve() for path in result.paths)
+        outputs = ", ".join(path.name for path in result.paths)
+        print(f"{chart}: rebuilt in {time.perf_counter() - start:.2f}s ({outputs})")
+
+    def changed(self):
+        """Return the paths whose stamp differs from when last seen."""
+        changed = set()
+        for path, stamp in self.stamps.items():
+            current = _stamp(path)
+            if current != stamp:
+                self.stamps[path] = current
+                changed.add(path)
+        return changed
+
+    def rebuild(self, changed):
+        helpers = reload_order(name for name in list(sys.modules)
+                               if name not in self.charts and not name.startswith("__")
+                               and _local_file(name))
+        # Reload changed helpers and the helpers importing them in
+        # dependency order, then rebuild the charts depending on any of them
+        stale = set()
+        for name in helpers:
+            if _local_file(name) in changed or local_imports(sys.modules[name]) & stale:
+                stale.add(name)
+                self._reload(name)
+        if stale:
+            changed = changed | {_local_file(name) for name in stale}
+            self._configure_engine()
+        for chart in self.charts:
+            if self.inputs.get(chart, set()) & changed:
+                self.build(chart, reload=True)
+
+    def run(self):
+        self._configure_engine()
+        for chart in self.charts:
+            self.build(chart)
+        print(f"watching {len(self.stamps)} files for {len(self.charts)} charts "
+              "(Ctrl-C to stop)")
+        try:
+            while True:
+                time.sleep(self.interval)
+                changed = self.changed()
+                if changed:
+                    self.rebuild(changed)
+        except KeyboardInterrupt:
+            pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("charts", nargs="*", help="charts to watch (default: all)")
+    parser.add_argument("--output-dir", default=".", help="directory the images are written to")
+    parser.add_argument("--interval", type=float, default=0.2,
+                        help="seconds between checks for changed inputs")
+    args = parser.parse_args(argv)
+
+    os.environ["ADHYAYAN_HEADLESS"] = "1"
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    charts = args.charts or [script.stem for script in discover()]
+    Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+    ChartWatcher(charts, args.output_dir, args.interval).run()
+
+
+if __name__ == "__main__":
+    main()